@@ -0,0 +1,33 @@
+"""
+Console helpers shared by the standalone test scripts in the repository root.
+
+Usage:
+    from script_output import PerThreadStdout
+"""
+
+import io
+import threading
+
+
+class PerThreadStdout:
+    """Route print() output into a buffer owned by the calling thread"""
+
+    def __init__(self, fallback):
+        self._fallback = fallback
+        self._local = threading.local()
+
+    def capture(self) -> io.StringIO:
+        """Start a fresh buffer for the current thread"""
+        self._local.buffer = io.StringIO()
+        return self._local.buffer
+
+    def release(self) -> str:
+        """Stop capturing for the current thread and return what it printed"""
+        buffer = self._local.__dict__.pop("buffer", None)
+        return buffer.getvalue() if buffer is not None else ""
+
+    def write(self, text: str) -> int:
+        return getattr(self._local, "buffer", self._fallback).write(text)
+
+    def flush(self):
+        getattr(self._local, "buffer", self._fallback).flush()
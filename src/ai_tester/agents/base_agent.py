@@ -6,9 +6,17 @@ Provides common functionality for all agents in the multi-agent system
 from typing import Tuple, Optional, Dict, Any
 import json
 import re
+from ai_tester.utils.json_compat import json_loads
 from ai_tester.utils.token_manager import validate_prompt_size, truncate_to_token_limit
 
 
+# JSON object inside a ```json ... ``` (or bare ```) markdown fence
+_MARKDOWN_JSON_PATTERN = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```', re.DOTALL)
+
+# Outermost {...} span anywhere in the response
+_BARE_JSON_PATTERN = re.compile(r'\{.*\}', re.DOTALL)
+
+
 class BaseAgent:
     """Base class for all agents in the multi-agent system"""
 
@@ -36,7 +44,8 @@ class BaseAgent:
         raise NotImplementedError(f"{self.name} must implement run()")
 
     def _call_llm(self, system_prompt: str, user_prompt: str,
-                  max_tokens: int = 2000, model: Optional[str] = None) -> Tuple[Optional[str], Optional[str]]:
+                  max_tokens: int = 2000, model: Optional[str] = None,
+                  ticket_key: Optional[str] = None) -> Tuple[Optional[str], Optional[str]]:
         """
         Standard LLM call with error handling and token validation (C8 Fix)
 
@@ -45,6 +54,8 @@ class BaseAgent:
             user_prompt: User prompt with specific task details
             max_tokens: Maximum tokens for the response
             model: Optional model override (e.g., 'gpt-4o-mini' for cheaper extraction tasks)
+            ticket_key: Jira ticket/epic the call is about, so its cached response
+                can be invalidated when the ticket changes
 
         Returns:
             Tuple of (result, error) where error is None on success
@@ -92,7 +103,8 @@ class BaseAgent:
                 system_prompt,
                 user_prompt,
                 max_tokens=max_tokens,
-                model=model
+                model=model,
+                ticket_key=ticket_key
             )
             return result, error
         except Exception as e:
@@ -112,11 +124,11 @@ class BaseAgent:
             return {}
 
         try:
-            # Try direct JSON parsing first
-            return json.loads(response)
+            # Try direct JSON parsing first (most responses are already valid JSON)
+            return json_loads(response)
         except json.JSONDecodeError:
             # Try to extract JSON from markdown code blocks
-            json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', response, re.DOTALL)
+            json_match = _MARKDOWN_JSON_PATTERN.search(response)
             if json_match:
                 try:
                     return json.loads(json_match.group(1))
@@ -124,7 +136,7 @@ class BaseAgent:
                     pass
 
             # Try to find any JSON object in the response
-            json_match = re.search(r'\{.*\}', response, re.DOTALL)
+            json_match = _BARE_JSON_PATTERN.search(response)
             if json_match:
                 try:
                     return json.loads(json_match.group(0))
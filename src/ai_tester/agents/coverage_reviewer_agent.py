@@ -134,7 +134,8 @@ class CoverageReviewerAgent(BaseAgent):
             result, error = self._call_llm_structured(
                 system_prompt=system_prompt,
                 user_prompt=user_prompt,
-                max_tokens=3000
+                max_tokens=3000,
+                ticket_key=epic_data.get('key')
             )
 
             if error:
@@ -146,7 +147,8 @@ class CoverageReviewerAgent(BaseAgent):
             result, error = self._call_llm(
                 system_prompt=system_prompt,
                 user_prompt=user_prompt,
-                max_tokens=3000
+                max_tokens=3000,
+                ticket_key=epic_data.get('key')
             )
 
             if error:
@@ -384,7 +386,8 @@ Return ONLY the JSON response with your review."""
         self,
         system_prompt: str,
         user_prompt: str,
-        max_tokens: int = 3000
+        max_tokens: int = 3000,
+        ticket_key: Optional[str] = None
     ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
         """
         Call LLM with structured output using Pydantic model
@@ -393,6 +396,8 @@ Return ONLY the JSON response with your review."""
             system_prompt: System prompt defining the agent's role
             user_prompt: User prompt with specific task details
             max_tokens: Maximum tokens for the response
+            ticket_key: Jira ticket/epic the call is about, so its cached response
+                can be invalidated when the ticket changes
 
         Returns:
             Tuple of (result dict, error message)
@@ -402,7 +407,8 @@ Return ONLY the JSON response with your review."""
                 system_prompt,
                 user_prompt,
                 max_tokens=max_tokens,
-                pydantic_model=CoverageReviewResponse
+                pydantic_model=CoverageReviewResponse,
+                ticket_key=ticket_key
             )
 
             if error:
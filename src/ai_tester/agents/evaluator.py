@@ -150,7 +150,9 @@ Then provide:
 Return ONLY valid JSON following the exact structure in the system prompt."""
 
         # Call LLM
-        result, error = self._call_llm(system_prompt, user_prompt, max_tokens=1500)
+        result, error = self._call_llm(
+            system_prompt, user_prompt, max_tokens=1500, ticket_key=epic_context.get('epic_key')
+        )
 
         if error:
             return {}, self._format_error(f"Failed to evaluate split: {error}")
@@ -94,7 +94,8 @@ class GapAnalyzerAgent(BaseAgent):
             result, error = self._call_llm_structured(
                 system_prompt=system_prompt,
                 user_prompt=user_prompt,
-                max_tokens=2500
+                max_tokens=2500,
+                ticket_key=epic_data.get('key')
             )
 
             if error:
@@ -105,7 +106,8 @@ class GapAnalyzerAgent(BaseAgent):
             result, error = self._call_llm(
                 system_prompt=system_prompt,
                 user_prompt=user_prompt,
-                max_tokens=2500
+                max_tokens=2500,
+                ticket_key=epic_data.get('key')
             )
 
             if error:
@@ -233,7 +235,8 @@ Return ONLY the JSON response with your analysis."""
         self,
         system_prompt: str,
         user_prompt: str,
-        max_tokens: int = 2500
+        max_tokens: int = 2500,
+        ticket_key: Optional[str] = None
     ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
         """
         Call LLM with structured output using Pydantic model
@@ -242,6 +245,8 @@ Return ONLY the JSON response with your analysis."""
             system_prompt: System prompt defining the agent's role
             user_prompt: User prompt with specific task details
             max_tokens: Maximum tokens for the response
+            ticket_key: Jira ticket/epic the call is about, so its cached response
+                can be invalidated when the ticket changes
 
         Returns:
             Tuple of (result dict, error message)
@@ -251,7 +256,8 @@ Return ONLY the JSON response with your analysis."""
                 system_prompt,
                 user_prompt,
                 max_tokens=max_tokens,
-                pydantic_model=GapAnalysisResponse
+                pydantic_model=GapAnalysisResponse,
+                ticket_key=ticket_key
             )
 
             if error:
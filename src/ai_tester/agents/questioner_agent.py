@@ -71,7 +71,8 @@ class QuestionerAgent(BaseAgent):
             result, error = self._call_llm_structured(
                 system_prompt=system_prompt,
                 user_prompt=user_prompt,
-                max_tokens=2000
+                max_tokens=2000,
+                ticket_key=epic_data.get('key')
             )
 
             if error:
@@ -82,7 +83,8 @@ class QuestionerAgent(BaseAgent):
             result, error = self._call_llm(
                 system_prompt=system_prompt,
                 user_prompt=user_prompt,
-                max_tokens=2000
+                max_tokens=2000,
+                ticket_key=epic_data.get('key')
             )
 
             if error:
@@ -255,7 +257,8 @@ Return ONLY the JSON response with your questions."""
         self,
         system_prompt: str,
         user_prompt: str,
-        max_tokens: int = 2000
+        max_tokens: int = 2000,
+        ticket_key: Optional[str] = None
     ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
         """
         Call LLM with structured output using Pydantic model
@@ -264,6 +267,8 @@ Return ONLY the JSON response with your questions."""
             system_prompt: System prompt defining the agent's role
             user_prompt: User prompt with specific task details
             max_tokens: Maximum tokens for the response
+            ticket_key: Jira ticket/epic the call is about, so its cached response
+                can be invalidated when the ticket changes
 
         Returns:
             Tuple of (result dict, error message)
@@ -273,7 +278,8 @@ Return ONLY the JSON response with your questions."""
                 system_prompt,
                 user_prompt,
                 max_tokens=max_tokens,
-                pydantic_model=QuestionerResponse
+                pydantic_model=QuestionerResponse,
+                ticket_key=ticket_key
             )
 
             if error:
@@ -142,7 +142,8 @@ class RequirementsFixerAgent(BaseAgent):
             result, error = self._call_llm_structured(
                 system_prompt=system_prompt,
                 user_prompt=user_prompt,
-                max_tokens=3500
+                max_tokens=3500,
+                ticket_key=epic_data.get('key')
             )
 
             if error:
@@ -154,7 +155,8 @@ class RequirementsFixerAgent(BaseAgent):
             result, error = self._call_llm(
                 system_prompt=system_prompt,
                 user_prompt=user_prompt,
-                max_tokens=3500
+                max_tokens=3500,
+                ticket_key=epic_data.get('key')
             )
 
             if error:
@@ -434,7 +436,8 @@ Return ONLY the JSON response with your fixes."""
         self,
         system_prompt: str,
         user_prompt: str,
-        max_tokens: int = 3500
+        max_tokens: int = 3500,
+        ticket_key: Optional[str] = None
     ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
         """
         Call LLM with structured output using Pydantic model
@@ -443,6 +446,8 @@ Return ONLY the JSON response with your fixes."""
             system_prompt: System prompt defining the agent's role
             user_prompt: User prompt with specific task details
             max_tokens: Maximum tokens for the response
+            ticket_key: Jira ticket/epic the call is about, so its cached response
+                can be invalidated when the ticket changes
 
         Returns:
             Tuple of (result dict, error message)
@@ -452,7 +457,8 @@ Return ONLY the JSON response with your fixes."""
                 system_prompt,
                 user_prompt,
                 max_tokens=max_tokens,
-                pydantic_model=RequirementsFixesResponse
+                pydantic_model=RequirementsFixesResponse,
+                ticket_key=ticket_key
             )
 
             if error:
@@ -204,7 +204,8 @@ Return ONLY valid JSON following the exact structure specified in the system pro
             result, error = self._call_llm_structured(
                 system_prompt=system_prompt,
                 user_prompt=user_prompt,
-                max_tokens=4000
+                max_tokens=4000,
+                ticket_key=epic_context.get('epic_key')
             )
 
             if error:
@@ -225,7 +226,9 @@ Return ONLY valid JSON following the exact structure specified in the system pro
             return options, None
         else:
             # Fallback to regular JSON mode
-            result, error = self._call_llm(system_prompt, user_prompt, max_tokens=4000)
+            result, error = self._call_llm(
+                system_prompt, user_prompt, max_tokens=4000, ticket_key=epic_context.get('epic_key')
+            )
 
             if error:
                 return [], self._format_error(f"Failed to generate split options: {error}")
@@ -469,7 +472,8 @@ Return ONLY valid JSON following the exact structure specified in the system pro
         self,
         system_prompt: str,
         user_prompt: str,
-        max_tokens: int = 4000
+        max_tokens: int = 4000,
+        ticket_key: Optional[str] = None
     ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
         """
         Call LLM with structured output using Pydantic model
@@ -478,6 +482,8 @@ Return ONLY valid JSON following the exact structure specified in the system pro
             system_prompt: System prompt defining the agent's role
             user_prompt: User prompt with specific task details
             max_tokens: Maximum tokens for the response
+            ticket_key: Jira ticket/epic the call is about, so its cached response
+                can be invalidated when the ticket changes
 
         Returns:
             Tuple of (result dict, error message)
@@ -487,7 +493,8 @@ Return ONLY valid JSON following the exact structure specified in the system pro
                 system_prompt,
                 user_prompt,
                 max_tokens=max_tokens,
-                pydantic_model=StrategicPlanResponse
+                pydantic_model=StrategicPlanResponse,
+                ticket_key=ticket_key
             )
 
             if error:
@@ -111,7 +111,8 @@ class TestTicketGeneratorAgent(BaseAgent):
             result, error = self._call_llm_structured(
                 system_prompt=system_prompt,
                 user_prompt=user_prompt,
-                max_tokens=3000
+                max_tokens=3000,
+                ticket_key=epic_context.get('epic_key')
             )
 
             if error:
@@ -120,7 +121,9 @@ class TestTicketGeneratorAgent(BaseAgent):
             return result, None
         else:
             # Fallback to regular JSON mode
-            result, error = self._call_llm(system_prompt, user_prompt, max_tokens=3000)
+            result, error = self._call_llm(
+                system_prompt, user_prompt, max_tokens=3000, ticket_key=epic_context.get('epic_key')
+            )
 
             if error:
                 return None, error
@@ -361,7 +364,8 @@ Issues:
         self,
         system_prompt: str,
         user_prompt: str,
-        max_tokens: int = 3000
+        max_tokens: int = 3000,
+        ticket_key: Optional[str] = None
     ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
         """
         Call LLM with structured output using Pydantic model
@@ -370,6 +374,8 @@ Issues:
             system_prompt: System prompt defining the agent's role
             user_prompt: User prompt with specific task details
             max_tokens: Maximum tokens for the response
+            ticket_key: Jira ticket/epic the call is about, so its cached response
+                can be invalidated when the ticket changes
 
         Returns:
             Tuple of (result dict, error message)
@@ -379,7 +385,8 @@ Issues:
                 system_prompt,
                 user_prompt,
                 max_tokens=max_tokens,
-                pydantic_model=TestTicketResponse
+                pydantic_model=TestTicketResponse,
+                ticket_key=ticket_key
             )
 
             if error:
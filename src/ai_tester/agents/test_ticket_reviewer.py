@@ -93,7 +93,9 @@ ACCEPTANCE CRITERIA ({len(acceptance_criteria)} items):
 
         user_prompt += "\n\nProvide quality score and detailed feedback."
 
-        result, error = self._call_llm(system_prompt, user_prompt, max_tokens=1500)
+        result, error = self._call_llm(
+            system_prompt, user_prompt, max_tokens=1500, ticket_key=epic_context.get('epic_key')
+        )
 
         if error:
             return None, error
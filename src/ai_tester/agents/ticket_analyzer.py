@@ -142,7 +142,9 @@ class TicketAnalyzerAgent:
 
         # Get assessment from LLM
         try:
-            json_text, error = self.llm_client.complete_json(system_prompt, user_prompt, max_tokens=2000)
+            json_text, error = self.llm_client.complete_json(
+                system_prompt, user_prompt, max_tokens=2000, ticket_key=ticket.get("key")
+            )
 
             if error:
                 print(f"ERROR: LLM API error: {error}")
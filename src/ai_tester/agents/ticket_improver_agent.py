@@ -111,7 +111,8 @@ class TicketImproverAgent(BaseAgent):
                 system_prompt=system_prompt,
                 user_prompt=user_prompt,
                 max_tokens=4000,
-                model=model
+                model=model,
+                ticket_key=ticket_data.get('key')
             )
 
             # Restore original cache setting
@@ -135,7 +136,8 @@ class TicketImproverAgent(BaseAgent):
                 system_prompt=system_prompt,
                 user_prompt=user_prompt,
                 max_tokens=4000,
-                model=model
+                model=model,
+                ticket_key=ticket_data.get('key')
             )
 
             # Restore original cache setting
@@ -164,7 +166,8 @@ class TicketImproverAgent(BaseAgent):
         system_prompt: str,
         user_prompt: str,
         max_tokens: int = 2000,
-        model: Optional[str] = None
+        model: Optional[str] = None,
+        ticket_key: Optional[str] = None
     ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
         """
         Call LLM with structured output using Pydantic model
@@ -174,6 +177,8 @@ class TicketImproverAgent(BaseAgent):
             user_prompt: User prompt with specific task details
             max_tokens: Maximum tokens for the response
             model: Optional model override
+            ticket_key: Jira ticket/epic the call is about, so its cached response
+                can be invalidated when the ticket changes
 
         Returns:
             Tuple of (result dict, error message)
@@ -184,7 +189,8 @@ class TicketImproverAgent(BaseAgent):
                 user_prompt,
                 max_tokens=max_tokens,
                 model=model,
-                pydantic_model=TicketImprovementResponse
+                pydantic_model=TicketImprovementResponse,
+                ticket_key=ticket_key
             )
 
             if error:
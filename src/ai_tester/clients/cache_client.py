@@ -5,16 +5,204 @@ Provides transparent caching layer for LLM API calls to reduce costs.
 Uses Redis for production/multi-user scenarios, falls back to disk cache.
 """
 
+import atexit
+import errno
 import hashlib
-import json
+import mmap
 import os
+import queue
+import shutil
+import struct
+import sys
+import threading
+import time
 import zlib
-from datetime import datetime, timedelta
-from typing import Optional, Tuple, Dict, Any
+from collections import OrderedDict
+from datetime import datetime
+from typing import Optional, Tuple, Dict, Any, Callable, Iterator
 import logging
 
+from ai_tester.utils.json_compat import json_dumps_bytes, json_loads
+
 logger = logging.getLogger(__name__)
 
+# Try to import zstandard (optional dependency) - faster than zlib at a better ratio
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+# Every zstd frame starts with this magic number; zlib streams start with 0x78,
+# so entries written by either codec can be told apart when reading
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+ZSTD_LEVEL = 3
+
+# Entries start with a fixed header carrying their write time (ns since the
+# epoch), so expired entries can be recognised without decompressing them, and
+# the id of the zstd dictionary they were compressed with (0 = none). Version-1
+# headers carry no dictionary id; entries without any header (older versions)
+# start with a bare zstd/zlib frame
+ENTRY_MAGIC = b'AIT\x02'
+ENTRY_HEADER = struct.Struct('<4sQI')
+ENTRY_MAGIC_V1 = b'AIT\x01'
+ENTRY_HEADER_V1 = struct.Struct('<4sQ')
+
+# New disk entries are written to an unnamed O_TMPFILE and linked into place
+# where the platform supports it; cleared after the first unsupported attempt
+_tmpfile_link_supported = sys.platform == 'linux' and hasattr(os, 'O_TMPFILE')
+# Errors from linking the temp file that mean this will never work here: no
+# /proc/self/fd, or linkat() refused for the file system or by a sandbox
+_TMPFILE_LINK_UNSUPPORTED_ERRNOS = (errno.ENOENT, errno.EXDEV, errno.EOPNOTSUPP, errno.EPERM)
+
+# Disk entries at least this large are memory-mapped and decompressed in place
+# instead of being copied into a bytes object first; below it, mapping costs
+# more than the read() it saves
+MMAP_THRESHOLD = 64 * 1024
+
+# Responses kept in the in-process LRU tier in front of Redis/disk. Other
+# processes (and other CacheClients) can clear or invalidate the shared store
+# without this tier noticing, so entries are only served from memory for a
+# short while after they were read or written
+MEMORY_CACHE_SIZE = 1024
+MEMORY_CACHE_TTL_SECONDS = 30
+
+# Keys per UNLINK command when clearing Redis
+REDIS_CLEAR_BATCH_SIZE = 500
+
+# Redis connection pools shared by every CacheClient in the process, keyed by
+# URL, so new clients reuse open connections instead of reconnecting
+REDIS_MAX_CONNECTIONS = 32
+_redis_pools: Dict[str, Any] = {}
+_redis_pools_lock = threading.Lock()
+
+# Redis writes after the first are queued and sent by a background thread in
+# pipelined batches of up to this many entries, collected over at most this
+# many seconds; a full queue makes set() write synchronously instead. Like the
+# connection pools, there is one writer thread per Redis URL (guarded by
+# _redis_pools_lock), however many CacheClients are created
+REDIS_WRITE_QUEUE_SIZE = 10_000
+REDIS_WRITE_BATCH_SIZE = 256
+REDIS_WRITE_BATCH_WINDOW = 0.02
+_redis_writers: Dict[str, "_RedisWriter"] = {}
+
+# Reverse index from a ticket to the cache keys stored for it, so a ticket's
+# entries can be invalidated without scanning the whole cache. Redis keeps one
+# SET per ticket (under the llm_cache: prefix, so clear() removes it too); the
+# disk cache keeps one file of keys per ticket in this subdirectory
+TICKET_INDEX_PREFIX = "llm_cache:idx:ticket:"
+TICKET_INDEX_DIR = "tickets"
+
+# Shared zstd dictionary for disk entries: small LLM JSON payloads repeat the
+# same keys and boilerplate, which a trained dictionary lets zstd reference
+# instead of re-encoding in every entry. Until one exists, training runs in
+# the background after every ZSTD_DICT_MIN_SAMPLES disk writes, since it reads
+# up to four times that many entries
+ZSTD_DICT_FILE = ".zdict"
+ZSTD_DICT_SIZE = 100_000
+ZSTD_DICT_MIN_SAMPLES = 256
+
+# zstd (de)compression contexts are reused across calls, but they are not
+# thread-safe, so each thread keeps its own, one per dictionary (id 0 = none)
+_zstd_contexts = threading.local()
+
+
+def _dict_id(zdict: Optional["zstandard.ZstdCompressionDict"]) -> int:
+    return zdict.dict_id() if zdict is not None else 0
+
+
+def _get_zstd_compressor(
+    zdict: Optional["zstandard.ZstdCompressionDict"] = None
+) -> "zstandard.ZstdCompressor":
+    """Return this thread's reusable zstd compressor for the given dictionary."""
+    compressors = getattr(_zstd_contexts, "compressors", None)
+    if compressors is None:
+        compressors = _zstd_contexts.compressors = {}
+    compressor = compressors.get(_dict_id(zdict))
+    if compressor is None:
+        compressor = compressors[_dict_id(zdict)] = zstandard.ZstdCompressor(
+            level=ZSTD_LEVEL, dict_data=zdict
+        )
+    return compressor
+
+
+def _get_zstd_decompressor(
+    zdict: Optional["zstandard.ZstdCompressionDict"] = None
+) -> "zstandard.ZstdDecompressor":
+    """Return this thread's reusable zstd decompressor for the given dictionary."""
+    decompressors = getattr(_zstd_contexts, "decompressors", None)
+    if decompressors is None:
+        decompressors = _zstd_contexts.decompressors = {}
+    decompressor = decompressors.get(_dict_id(zdict))
+    if decompressor is None:
+        decompressor = decompressors[_dict_id(zdict)] = zstandard.ZstdDecompressor(dict_data=zdict)
+    return decompressor
+
+
+def _pipeline_set(pipe, cache_key: str, compressed: bytes, ticket_key: Optional[str], ttl_seconds: int) -> None:
+    """Queue an entry (and its ticket index update) on a Redis pipeline."""
+    pipe.setex(cache_key, ttl_seconds, compressed)
+    if ticket_key:
+        index_key = f"{TICKET_INDEX_PREFIX}{ticket_key}"
+        pipe.sadd(index_key, cache_key)
+        pipe.expire(index_key, ttl_seconds)
+
+
+class _RedisWriter:
+    """
+    Background writer sending queued entries to one Redis server.
+
+    Each queued entry carries its TTL and a callback that counts a failed
+    write against the CacheClient that queued it.
+    """
+
+    def __init__(self, redis_client):
+        self.redis_client = redis_client
+        self.queue: queue.Queue = queue.Queue(maxsize=REDIS_WRITE_QUEUE_SIZE)
+        threading.Thread(target=self._drain, name="cache-redis-writer", daemon=True).start()
+        atexit.register(self.flush)
+
+    def put(self, entry: Tuple[str, bytes, Optional[str], int, Callable[[str], None]]) -> bool:
+        """Queue an entry; False if the queue is full."""
+        try:
+            self.queue.put_nowait(entry)
+            return True
+        except queue.Full:
+            return False
+
+    def flush(self) -> None:
+        """Block until all queued writes have been sent."""
+        self.queue.join()
+
+    def _drain(self) -> None:
+        """Send queued entries to Redis in pipelined batches."""
+        while True:
+            batch = [self.queue.get()]
+            deadline = time.monotonic() + REDIS_WRITE_BATCH_WINDOW
+            while len(batch) < REDIS_WRITE_BATCH_SIZE:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self.queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+
+            try:
+                pipe = self.redis_client.pipeline(transaction=False)
+                for cache_key, compressed, ticket_key, ttl_seconds, _ in batch:
+                    _pipeline_set(pipe, cache_key, compressed, ticket_key, ttl_seconds)
+                pipe.execute()
+                logger.debug(f"Cache SET (Redis): wrote {len(batch)} queued entries")
+            except Exception as e:
+                logger.error(f"Redis set error: {e}")
+                for *_, count in batch:
+                    count("errors")
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+
 
 class CacheClient:
     """
@@ -30,6 +218,9 @@ class CacheClient:
 
     CACHE_VERSION = "v5"  # Increment when prompts change significantly - v5: Fixed duplicate sections and context bleeding
 
+    # Characters that are not valid (or not safe) in file names on Windows/POSIX
+    _SAFE_KEY_TRANS = str.maketrans({':': '_', '/': '_', '\\': '_', '*': '_', '?': '_'})
+
     def __init__(
         self,
         redis_url: Optional[str] = None,
@@ -49,11 +240,32 @@ class CacheClient:
         self.enabled = enabled
         self.ttl_days = ttl_days
         self.ttl_seconds = ttl_days * 24 * 60 * 60
+        self.ttl_ns = self.ttl_seconds * 1_000_000_000
         self.cache_dir = cache_dir
+        # Directory prefix (with trailing separator) of each of the 256 disk shards
+        self._shard_prefixes = [os.path.join(cache_dir, f"{i:02x}", "") for i in range(256)]
         self.redis_client = None
         self.use_redis = False
+        # Redis is not pinged up front; the first command doubles as the
+        # connection check, and falls back to disk if it fails
+        self._redis_verified = False
+        # Shared write-behind writer for this Redis URL, looked up on first use
+        self._redis_url = redis_url
+        self._writer: Optional[_RedisWriter] = None
+        self._zstd_dict = None
+        # Background dictionary training: at most one run at a time per client
+        self._dict_lock = threading.Lock()
+        self._dict_trainer: Optional[threading.Thread] = None
+        self._disk_sets_without_dict = 0
+        # Shard directories known to exist, so set() doesn't re-create them
+        self._shard_dirs = set()
+        # cache_key -> ((response, error), expires_ns), least recently used first;
+        # guarded by _memory_lock, since get()/set() may run on several threads
+        self._memory: "OrderedDict[str, Tuple[Tuple[str, Optional[str]], int]]" = OrderedDict()
+        self._memory_lock = threading.Lock()
 
-        # Stats tracking
+        # Stats tracking; the Redis writer thread updates them too
+        self._stats_lock = threading.Lock()
         self.stats = {
             "hits": 0,
             "misses": 0,
@@ -69,14 +281,17 @@ class CacheClient:
         if redis_url:
             try:
                 import redis
-                self.redis_client = redis.from_url(
-                    redis_url,
-                    decode_responses=False,  # We handle binary data
-                    socket_connect_timeout=2,
-                    socket_timeout=2
-                )
-                # Test connection
-                self.redis_client.ping()
+                with _redis_pools_lock:
+                    pool = _redis_pools.get(redis_url)
+                    if pool is None:
+                        pool = _redis_pools[redis_url] = redis.BlockingConnectionPool.from_url(
+                            redis_url,
+                            max_connections=REDIS_MAX_CONNECTIONS,
+                            decode_responses=False,  # We handle binary data
+                            socket_connect_timeout=2,
+                            socket_timeout=2
+                        )
+                self.redis_client = redis.Redis(connection_pool=pool)
                 self.use_redis = True
                 logger.info(f"LLM cache initialized with Redis: {redis_url}")
             except ImportError:
@@ -89,8 +304,139 @@ class CacheClient:
 
         # Initialize disk cache fallback
         if not self.use_redis:
-            os.makedirs(cache_dir, exist_ok=True)
-            logger.info(f"LLM cache initialized with disk storage: {cache_dir}")
+            self._init_disk()
+
+    def _init_disk(self) -> None:
+        """Prepare the disk cache directory (and its zstd dictionary)."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        logger.info(f"LLM cache initialized with disk storage: {self.cache_dir}")
+        # The dictionary lives next to the entries, so only the disk cache
+        # uses one; Redis entries must stay readable by other hosts
+        if ZSTD_AVAILABLE:
+            self._zstd_dict = self._load_dict()
+
+    def _fall_back_to_disk(self, error: Exception) -> bool:
+        """
+        Switch to the disk cache if Redis failed before any command succeeded.
+
+        Returns:
+            True if the cache now uses disk, False if Redis was already verified
+        """
+        if self._redis_verified:
+            return False
+        logger.warning(f"Could not connect to Redis: {error}")
+        logger.info("Falling back to disk cache")
+        self.use_redis = False
+        self.redis_client = None
+        self._init_disk()
+        return True
+
+    def _load_dict(self) -> Optional["zstandard.ZstdCompressionDict"]:
+        """Load the disk cache's zstd dictionary, if one has been trained."""
+        dict_file = os.path.join(self.cache_dir, ZSTD_DICT_FILE)
+        try:
+            with open(dict_file, 'rb') as f:
+                return zstandard.ZstdCompressionDict(f.read())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Could not load cache dictionary: {e}")
+            return None
+
+    def _maybe_train_dict(self) -> None:
+        """Start background dictionary training if none is in use and it is due."""
+        self._disk_sets_without_dict += 1
+        due = self._disk_sets_without_dict % ZSTD_DICT_MIN_SAMPLES == 0
+        if not due or not self._dict_lock.acquire(blocking=False):
+            return
+
+        def train():
+            try:
+                self.train_dictionary()
+            finally:
+                self._dict_lock.release()
+
+        self._dict_trainer = threading.Thread(target=train, name="cache-zdict-trainer", daemon=True)
+        self._dict_trainer.start()
+
+    def close(self) -> None:
+        """
+        Wait for background work started by this client to finish.
+
+        Call before removing the cache directory: a dictionary still being
+        trained writes into it. Queued Redis writes are flushed too.
+        """
+        self.flush()
+        if self._dict_trainer is not None:
+            self._dict_trainer.join()
+
+    def train_dictionary(self) -> bool:
+        """
+        Train the disk cache's zstd dictionary from existing entries.
+
+        Runs in the background as the disk cache fills up, but can also be
+        called directly (e.g. from a maintenance script). If another
+        process has already trained one, that dictionary is loaded instead.
+        Entries written before the dictionary existed still decode.
+
+        Returns:
+            True if the cache now compresses with a dictionary
+        """
+        if not ZSTD_AVAILABLE or self.use_redis:
+            return False
+        if self._zstd_dict is not None:
+            return True
+
+        zdict = self._load_dict()
+        if zdict is not None:
+            self._zstd_dict = zdict
+            return True
+
+        samples = []
+        try:
+            for entry in self._iter_cache_entries():
+                try:
+                    with open(entry.path, 'rb') as f:
+                        samples.append(self._encode_payload(self._read_cache_file(f)))
+                except Exception:
+                    continue
+                if len(samples) >= ZSTD_DICT_MIN_SAMPLES * 4:
+                    break
+        except OSError:
+            return False
+
+        if len(samples) < ZSTD_DICT_MIN_SAMPLES:
+            return False
+
+        dict_file = os.path.join(self.cache_dir, ZSTD_DICT_FILE)
+        try:
+            zdict = zstandard.train_dictionary(ZSTD_DICT_SIZE, samples)
+            # Readers in other processes must never see a partial dictionary
+            self._write_file_replacing(dict_file, zdict.as_bytes())
+        except Exception as e:
+            logger.warning(f"Could not train cache dictionary: {e}")
+            return False
+
+        self._zstd_dict = zdict
+        logger.info(f"Trained cache dictionary from {len(samples)} entries: {dict_file}")
+        return True
+
+    def _dict_for_id(self, dict_id: int) -> Optional["zstandard.ZstdCompressionDict"]:
+        """
+        Return the dictionary an entry was compressed with, by its header's id.
+
+        Another process may have trained (or retrained) the dictionary since this
+        one loaded it, so an unknown id re-reads the dictionary file once.
+        """
+        if dict_id == 0:
+            return None
+        zdict = self._zstd_dict
+        if _dict_id(zdict) != dict_id:
+            zdict = self._load_dict()
+            if _dict_id(zdict) != dict_id:
+                raise ValueError(f"Cache entry needs zstd dictionary {dict_id}, which is not available")
+            self._zstd_dict = zdict
+        return zdict
 
     def _generate_cache_key(
         self,
@@ -104,23 +450,81 @@ class CacheClient:
 
         Includes cache version to invalidate old entries when prompts change.
         """
-        # Combine all deterministic parameters
-        content = f"{self.CACHE_VERSION}|{model}|{max_tokens}|{sys_prompt}|{user_prompt}"
+        # BLAKE2b (stdlib, so every process derives the same key): faster than
+        # SHA-256 on 64-bit CPUs, and a 128-bit digest is plenty for cache keys
+        hasher = hashlib.blake2b(digest_size=16)
+
+        # Feed each deterministic parameter separately (length-prefixed so field
+        # boundaries are unambiguous) instead of building one large concatenated
+        # string from the prompts first
+        for part in (self.CACHE_VERSION, model, str(max_tokens), sys_prompt, user_prompt):
+            encoded = part.encode('utf-8')
+            hasher.update(len(encoded).to_bytes(8, 'little'))
+            hasher.update(encoded)
 
-        # Generate SHA256 hash
-        key_hash = hashlib.sha256(content.encode('utf-8')).hexdigest()
+        key_hash = hasher.hexdigest()
 
         return f"llm_cache:{self.CACHE_VERSION}:{key_hash}"
 
+    @staticmethod
+    def _encode_payload(data: Dict[str, Any]) -> bytes:
+        """Serialize an entry to the bytes that get compressed."""
+        return json_dumps_bytes(data)
+
     def _compress_data(self, data: Dict[str, Any]) -> bytes:
-        """Compress data for storage efficiency."""
-        json_str = json.dumps(data)
-        return zlib.compress(json_str.encode('utf-8'), level=6)
+        """Compress data for storage efficiency (zstd if available, else zlib)."""
+        payload = self._encode_payload(data)
+        # Read once: background training may install a dictionary meanwhile
+        zdict = self._zstd_dict if ZSTD_AVAILABLE else None
+        if ZSTD_AVAILABLE:
+            compressed = _get_zstd_compressor(zdict).compress(payload)
+        else:
+            compressed = zlib.compress(payload, level=6)
+        try:
+            written_ns = self._timestamp_ns(data)
+        except KeyError:
+            written_ns = time.time_ns()
+        return ENTRY_HEADER.pack(ENTRY_MAGIC, written_ns, _dict_id(zdict)) + compressed
+
+    @staticmethod
+    def _peek_timestamp(header: bytes) -> Optional[int]:
+        """Return the write time from an entry header, or None for headerless entries."""
+        magic = header[:4]
+        if magic == ENTRY_MAGIC and len(header) >= ENTRY_HEADER.size:
+            return ENTRY_HEADER.unpack_from(header)[1]
+        if magic == ENTRY_MAGIC_V1 and len(header) >= ENTRY_HEADER_V1.size:
+            return ENTRY_HEADER_V1.unpack_from(header)[1]
+        return None
 
     def _decompress_data(self, compressed: bytes) -> Dict[str, Any]:
-        """Decompress stored data."""
-        json_str = zlib.decompress(compressed).decode('utf-8')
-        return json.loads(json_str)
+        """Decompress stored data, detecting the codec from the frame header."""
+        # Skip the header without copying the (possibly memory-mapped) entry
+        magic = compressed[:4]
+        if magic == ENTRY_MAGIC:
+            offset = ENTRY_HEADER.size
+            dict_id = ENTRY_HEADER.unpack_from(compressed)[2]
+        else:
+            # Older entries don't say; their zstd frame does, and only the
+            # disk cache's current dictionary could have been used
+            offset = ENTRY_HEADER_V1.size if magic == ENTRY_MAGIC_V1 else 0
+            dict_id = None
+        body = memoryview(compressed)[offset:]
+        try:
+            if body[:4] == ZSTD_MAGIC:
+                if not ZSTD_AVAILABLE:
+                    raise ValueError("Cache entry is zstd-compressed but zstandard is not installed")
+                zdict = self._zstd_dict if dict_id is None else self._dict_for_id(dict_id)
+                payload = _get_zstd_decompressor(zdict).decompress(body)
+            else:
+                payload = zlib.decompress(body)
+        finally:
+            body.release()
+        return json_loads(payload)
+
+    def _count(self, stat: str) -> None:
+        """Increment one of the stats counters."""
+        with self._stats_lock:
+            self.stats[stat] += 1
 
     def get(self, cache_key: str) -> Optional[Tuple[str, Optional[str]]]:
         """
@@ -132,6 +536,10 @@ class CacheClient:
         if not self.enabled:
             return None
 
+        cached = self._get_memory(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             if self.use_redis:
                 return self._get_redis(cache_key)
@@ -139,66 +547,154 @@ class CacheClient:
                 return self._get_disk(cache_key)
         except Exception as e:
             logger.error(f"Cache get error: {e}")
-            self.stats["errors"] += 1
+            self._count("errors")
             return None
 
+    def _get_memory(self, cache_key: str) -> Optional[Tuple[str, Optional[str]]]:
+        """Get from the in-process LRU tier."""
+        with self._memory_lock:
+            try:
+                value, expires_ns = self._memory[cache_key]
+            except KeyError:
+                return None
+            if time.time_ns() > expires_ns:
+                del self._memory[cache_key]
+                return None
+            self._memory.move_to_end(cache_key)
+
+        self._count("hits")
+        logger.debug(f"Cache HIT (Memory): {cache_key[:16]}...")
+        return value
+
+    def _remember(self, cache_key: str, data: Dict[str, Any], expires_ns: int) -> Tuple[str, Optional[str]]:
+        """Add an entry to the in-process LRU tier, evicting the oldest if full."""
+        value = (data["response"], data.get("error"))
+        expires_ns = min(expires_ns, time.time_ns() + MEMORY_CACHE_TTL_SECONDS * 1_000_000_000)
+        with self._memory_lock:
+            self._memory[cache_key] = (value, expires_ns)
+            self._memory.move_to_end(cache_key)
+            if len(self._memory) > MEMORY_CACHE_SIZE:
+                self._memory.popitem(last=False)
+        return value
+
+    def _forget(self, cache_keys) -> None:
+        """Drop entries from the in-process LRU tier."""
+        with self._memory_lock:
+            for cache_key in cache_keys:
+                self._memory.pop(cache_key, None)
+
+    @staticmethod
+    def _timestamp_ns(data: Dict[str, Any]) -> int:
+        """Write time of an entry (entries written before ts_ns existed carry an ISO timestamp)."""
+        ts_ns = data.get("ts_ns")
+        if ts_ns is None:
+            ts_ns = int(datetime.fromisoformat(data["timestamp"]).timestamp() * 1_000_000_000)
+        return ts_ns
+
+    def _expires_ns(self, data: Dict[str, Any]) -> int:
+        """Expiry time of an entry."""
+        return self._timestamp_ns(data) + self.ttl_ns
+
     def _get_redis(self, cache_key: str) -> Optional[Tuple[str, Optional[str]]]:
         """Get from Redis cache."""
         try:
             compressed = self.redis_client.get(cache_key)
+            self._redis_verified = True
             if compressed:
                 data = self._decompress_data(compressed)
-                self.stats["hits"] += 1
+                self._count("hits")
                 logger.debug(f"Cache HIT (Redis): {cache_key[:16]}...")
-                return (data["response"], data.get("error"))
+                return self._remember(cache_key, data, self._expires_ns(data))
             else:
-                self.stats["misses"] += 1
+                self._count("misses")
                 logger.debug(f"Cache MISS (Redis): {cache_key[:16]}...")
                 return None
         except Exception as e:
+            if self._fall_back_to_disk(e):
+                return self._get_disk(cache_key)
             logger.error(f"Redis get error: {e}")
-            self.stats["errors"] += 1
+            self._count("errors")
             return None
 
+    def _cache_file_path(self, cache_key: str) -> str:
+        """
+        Map a cache key to its file, replacing characters unsafe in file names.
+
+        Files are spread over 256 shard directories (first byte of a BLAKE2b hash
+        of the key) so no single directory grows large enough to slow lookups.
+        """
+        safe_key = cache_key.translate(self._SAFE_KEY_TRANS)
+        shard = hashlib.blake2b(safe_key.encode('utf-8'), digest_size=1).digest()[0]
+        return self._shard_prefixes[shard] + safe_key + ".cache"
+
+    @staticmethod
+    def _is_shard_dir(entry: os.DirEntry) -> bool:
+        return len(entry.name) == 2 and entry.is_dir(follow_symlinks=False)
+
+    def _iter_cache_entries(self) -> Iterator[os.DirEntry]:
+        """Yield the disk cache files, including flat ones left by older versions."""
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith('.cache'):
+                    yield entry
+                elif self._is_shard_dir(entry):
+                    with os.scandir(entry.path) as shard_entries:
+                        for shard_entry in shard_entries:
+                            if shard_entry.name.endswith('.cache'):
+                                yield shard_entry
+
     def _get_disk(self, cache_key: str) -> Optional[Tuple[str, Optional[str]]]:
         """Get from disk cache."""
-        # Replace colons with underscores for Windows compatibility
-        safe_key = cache_key.replace(":", "_")
-        cache_file = os.path.join(self.cache_dir, f"{safe_key}.cache")
+        cache_file = self._cache_file_path(cache_key)
 
         if not os.path.exists(cache_file):
-            self.stats["misses"] += 1
+            self._count("misses")
             logger.debug(f"Cache MISS (Disk): {cache_key[:16]}...")
             return None
 
         try:
+            data = None
             with open(cache_file, 'rb') as f:
-                compressed = f.read()
-
-            data = self._decompress_data(compressed)
+                # Only decompress entries whose header says they are still fresh
+                written_ns = self._peek_timestamp(f.read(ENTRY_HEADER.size))
+                if written_ns is None or time.time_ns() - written_ns <= self.ttl_ns:
+                    f.seek(0)
+                    data = self._read_cache_file(f)
 
             # Check TTL
-            cached_time = datetime.fromisoformat(data["timestamp"])
-            if datetime.now() - cached_time > timedelta(days=self.ttl_days):
+            expires_ns = self._expires_ns(data) if data is not None else 0
+            if time.time_ns() > expires_ns:
                 logger.debug(f"Cache EXPIRED (Disk): {cache_key[:16]}...")
                 os.remove(cache_file)
-                self.stats["misses"] += 1
+                self._count("misses")
                 return None
 
-            self.stats["hits"] += 1
+            self._count("hits")
             logger.debug(f"Cache HIT (Disk): {cache_key[:16]}...")
-            return (data["response"], data.get("error"))
+            return self._remember(cache_key, data, expires_ns)
 
         except Exception as e:
             logger.error(f"Disk cache read error: {e}")
-            self.stats["errors"] += 1
+            self._count("errors")
             return None
 
+    def _read_cache_file(self, f) -> Dict[str, Any]:
+        """Decompress an open cache file, mapping large entries instead of reading them."""
+        size = os.fstat(f.fileno()).st_size
+        if size < MMAP_THRESHOLD:
+            return self._decompress_data(f.read())
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if hasattr(mapped, 'madvise'):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            return self._decompress_data(mapped)
+
     def set(
         self,
         cache_key: str,
         response: str,
-        error: Optional[str] = None
+        error: Optional[str] = None,
+        ticket_key: Optional[str] = None
     ) -> bool:
         """
         Store LLM response in cache.
@@ -207,6 +703,7 @@ class CacheClient:
             cache_key: Generated cache key
             response: LLM response text
             error: Error message if any
+            ticket_key: Jira ticket the response belongs to, for invalidate_by_ticket
 
         Returns:
             True if successfully cached
@@ -218,54 +715,167 @@ class CacheClient:
             data = {
                 "response": response,
                 "error": error,
-                "timestamp": datetime.now().isoformat(),
+                "ts_ns": time.time_ns(),
                 "version": self.CACHE_VERSION
             }
 
             if self.use_redis:
-                return self._set_redis(cache_key, data)
+                stored = self._set_redis(cache_key, data, ticket_key)
             else:
-                return self._set_disk(cache_key, data)
+                stored = self._set_disk(cache_key, data, ticket_key)
+            if stored:
+                self._remember(cache_key, data, data["ts_ns"] + self.ttl_ns)
+            return stored
 
         except Exception as e:
             logger.error(f"Cache set error: {e}")
-            self.stats["errors"] += 1
+            self._count("errors")
             return False
 
-    def _set_redis(self, cache_key: str, data: Dict[str, Any]) -> bool:
+    def _set_redis(self, cache_key: str, data: Dict[str, Any], ticket_key: Optional[str] = None) -> bool:
         """Store in Redis cache."""
         try:
             compressed = self._compress_data(data)
-            self.redis_client.setex(
-                cache_key,
-                self.ttl_seconds,
-                compressed
-            )
-            self.stats["sets"] += 1
+            # The caller doesn't need to wait for Redis; once a command has
+            # confirmed the connection, hand the write to the background writer
+            if self._redis_verified and self._enqueue_write(cache_key, compressed, ticket_key):
+                self._count("sets")
+                logger.debug(f"Cache SET queued (Redis): {cache_key[:16]}... ({len(compressed)} bytes)")
+                return True
+
+            if ticket_key:
+                pipe = self.redis_client.pipeline(transaction=False)
+                _pipeline_set(pipe, cache_key, compressed, ticket_key, self.ttl_seconds)
+                pipe.execute()
+            else:
+                self.redis_client.setex(
+                    cache_key,
+                    self.ttl_seconds,
+                    compressed
+                )
+            self._redis_verified = True
+            self._count("sets")
             logger.debug(f"Cache SET (Redis): {cache_key[:16]}... ({len(compressed)} bytes)")
             return True
         except Exception as e:
+            if self._fall_back_to_disk(e):
+                return self._set_disk(cache_key, data, ticket_key)
             logger.error(f"Redis set error: {e}")
-            self.stats["errors"] += 1
+            self._count("errors")
+            return False
+
+    def _enqueue_write(self, cache_key: str, compressed: bytes, ticket_key: Optional[str] = None) -> bool:
+        """Queue a Redis write for the background writer; False if the queue is full."""
+        if self._writer is None:
+            with _redis_pools_lock:
+                writer = _redis_writers.get(self._redis_url)
+                if writer is None:
+                    writer = _redis_writers[self._redis_url] = _RedisWriter(self.redis_client)
+            self._writer = writer
+        return self._writer.put((cache_key, compressed, ticket_key, self.ttl_seconds, self._count))
+
+    def flush(self) -> None:
+        """Block until all queued Redis writes have been sent."""
+        if self._writer is not None:
+            self._writer.flush()
+
+    def _ticket_index_file(self, ticket_key: str) -> str:
+        safe_ticket = ticket_key.translate(self._SAFE_KEY_TRANS)
+        return os.path.join(self.cache_dir, TICKET_INDEX_DIR, f"{safe_ticket}.keys")
+
+    @staticmethod
+    def _write_new_file_linked(cache_file: str, compressed: bytes) -> bool:
+        """
+        Create a new entry via an unnamed O_TMPFILE linked into place (Linux only).
+
+        The file only gets a name once it is complete, and no temporary name has
+        to be created, renamed or cleaned up. Returns False when the caller
+        should use the temp-file-and-rename path instead: the entry already
+        exists (linking cannot replace it), or writing or linking failed. If
+        O_TMPFILE/linking through /proc is unsupported here, it is not
+        attempted again.
+        """
+        global _tmpfile_link_supported
+        if not _tmpfile_link_supported:
+            return False
+
+        try:
+            fd = os.open(os.path.dirname(cache_file), os.O_TMPFILE | os.O_WRONLY, 0o666)
+        except OSError as e:
+            if e.errno in (errno.EOPNOTSUPP, errno.EISDIR, errno.EINVAL):
+                _tmpfile_link_supported = False
             return False
 
-    def _set_disk(self, cache_key: str, data: Dict[str, Any]) -> bool:
+        try:
+            with open(fd, 'wb', closefd=False) as f:
+                f.write(compressed)
+            os.link(f"/proc/self/fd/{fd}", cache_file)
+            return True
+        except FileExistsError:
+            return False
+        except OSError as e:
+            # Errors such as ENOSPC or EIO only fail this write; the caller's
+            # fallback will most likely fail the same way
+            if e.errno in _TMPFILE_LINK_UNSUPPORTED_ERRNOS:
+                _tmpfile_link_supported = False
+            return False
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _write_file_replacing(path: str, data: bytes) -> None:
+        """
+        Write a file via a temporary file renamed into place.
+
+        os.replace is atomic, so readers see either the old file or the
+        complete new one, never a partial write.
+        """
+        tmp_file = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_file, path)
+        except BaseException:
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+            raise
+
+    def _set_disk(self, cache_key: str, data: Dict[str, Any], ticket_key: Optional[str] = None) -> bool:
         """Store in disk cache."""
-        # Replace colons with underscores for Windows compatibility
-        safe_key = cache_key.replace(":", "_")
-        cache_file = os.path.join(self.cache_dir, f"{safe_key}.cache")
+        cache_file = self._cache_file_path(cache_key)
 
         try:
             compressed = self._compress_data(data)
-            with open(cache_file, 'wb') as f:
-                f.write(compressed)
+            shard_dir = os.path.dirname(cache_file)
+            if shard_dir not in self._shard_dirs:
+                os.makedirs(shard_dir, exist_ok=True)
+                self._shard_dirs.add(shard_dir)
+            try:
+                if not self._write_new_file_linked(cache_file, compressed):
+                    self._write_file_replacing(cache_file, compressed)
+            except FileNotFoundError:
+                # Another client or process cleared the cache and removed the shard
+                self._shard_dirs.discard(shard_dir)
+                os.makedirs(shard_dir, exist_ok=True)
+                self._shard_dirs.add(shard_dir)
+                self._write_file_replacing(cache_file, compressed)
+
+            if ticket_key:
+                index_file = self._ticket_index_file(ticket_key)
+                os.makedirs(os.path.dirname(index_file), exist_ok=True)
+                with open(index_file, 'a', encoding='utf-8') as f:
+                    f.write(f"{cache_key}\n")
 
-            self.stats["sets"] += 1
+            self._count("sets")
             logger.debug(f"Cache SET (Disk): {cache_key[:16]}... ({len(compressed)} bytes)")
+            if ZSTD_AVAILABLE and self._zstd_dict is None:
+                self._maybe_train_dict()
             return True
         except Exception as e:
             logger.error(f"Disk cache write error: {e}")
-            self.stats["errors"] += 1
+            self._count("errors")
             return False
 
     def clear(self, pattern: Optional[str] = None) -> int:
@@ -281,6 +891,9 @@ class CacheClient:
         if not self.enabled:
             return 0
 
+        with self._memory_lock:
+            self._memory.clear()
+
         try:
             if self.use_redis:
                 return self._clear_redis(pattern)
@@ -292,15 +905,30 @@ class CacheClient:
 
     def _clear_redis(self, pattern: Optional[str] = None) -> int:
         """Clear Redis cache."""
+        # Let queued writes land first so they can't reappear after the clear
+        self.flush()
         try:
             pattern = pattern or "llm_cache:*"
-            keys = list(self.redis_client.scan_iter(match=pattern, count=100))
-            if keys:
-                deleted = self.redis_client.delete(*keys)
+            # UNLINK frees values off the server's main thread, and batching keeps
+            # each command small; all batches go out in one pipelined round trip
+            pipe = self.redis_client.pipeline(transaction=False)
+            batch = []
+            for key in self.redis_client.scan_iter(match=pattern, count=1000):
+                batch.append(key)
+                if len(batch) >= REDIS_CLEAR_BATCH_SIZE:
+                    pipe.unlink(*batch)
+                    batch = []
+            if batch:
+                pipe.unlink(*batch)
+
+            deleted = sum(pipe.execute())
+            self._redis_verified = True
+            if deleted:
                 logger.info(f"Cleared {deleted} Redis cache entries")
-                return deleted
-            return 0
+            return deleted
         except Exception as e:
+            if self._fall_back_to_disk(e):
+                return self._clear_disk()
             logger.error(f"Redis clear error: {e}")
             return 0
 
@@ -308,10 +936,20 @@ class CacheClient:
         """Clear disk cache."""
         try:
             count = 0
-            for filename in os.listdir(self.cache_dir):
-                if filename.endswith('.cache'):
-                    os.remove(os.path.join(self.cache_dir, filename))
-                    count += 1
+            for entry in self._iter_cache_entries():
+                os.remove(entry.path)
+                count += 1
+
+            # Drop the now-empty shard directories
+            self._shard_dirs.clear()
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if self._is_shard_dir(entry):
+                        try:
+                            os.rmdir(entry.path)
+                        except OSError:
+                            pass
+            shutil.rmtree(os.path.join(self.cache_dir, TICKET_INDEX_DIR), ignore_errors=True)
             logger.info(f"Cleared {count} disk cache entries")
             return count
         except Exception as e:
@@ -348,12 +986,12 @@ class CacheClient:
         else:
             # Add disk cache stats
             try:
-                cache_files = [f for f in os.listdir(self.cache_dir) if f.endswith('.cache')]
-                total_size = sum(
-                    os.path.getsize(os.path.join(self.cache_dir, f))
-                    for f in cache_files
-                )
-                stats["disk_cache_entries"] = len(cache_files)
+                entry_count = 0
+                total_size = 0
+                for entry in self._iter_cache_entries():
+                    entry_count += 1
+                    total_size += entry.stat().st_size
+                stats["disk_cache_entries"] = entry_count
                 stats["disk_cache_size_mb"] = round(total_size / (1024 * 1024), 2)
             except Exception:
                 pass
@@ -364,13 +1002,61 @@ class CacheClient:
         """
         Invalidate cache entries for a specific ticket.
 
-        Useful when ticket is updated in Jira.
+        Useful when ticket is updated in Jira. Only entries stored with
+        set(..., ticket_key=...) are indexed by ticket.
+
+        Returns:
+            Number of entries invalidated
         """
         if not self.enabled:
             return 0
 
-        # For now, we can't easily match by ticket content in the hash
-        # This would require storing metadata alongside cache entries
-        # TODO: Implement metadata index for granular invalidation
-        logger.warning(f"Ticket-level invalidation not yet implemented for {ticket_key}")
-        return 0
+        try:
+            if self.use_redis:
+                return self._invalidate_redis(ticket_key)
+            else:
+                return self._invalidate_disk(ticket_key)
+        except Exception as e:
+            logger.error(f"Cache invalidation error for {ticket_key}: {e}")
+            self._count("errors")
+            return 0
+
+    def _invalidate_redis(self, ticket_key: str) -> int:
+        """Invalidate a ticket's Redis entries through its index SET."""
+        # Queued writes may still add keys to the index
+        self.flush()
+        index_key = f"{TICKET_INDEX_PREFIX}{ticket_key}"
+        keys = self.redis_client.smembers(index_key)
+        if not keys:
+            return 0
+
+        pipe = self.redis_client.pipeline(transaction=False)
+        pipe.unlink(*keys)
+        pipe.delete(index_key)
+        deleted = pipe.execute()[0]
+
+        self._forget(key.decode('utf-8') if isinstance(key, bytes) else key for key in keys)
+        logger.info(f"Invalidated {deleted} Redis cache entries for {ticket_key}")
+        return deleted
+
+    def _invalidate_disk(self, ticket_key: str) -> int:
+        """Invalidate a ticket's disk entries through its index file."""
+        index_file = self._ticket_index_file(ticket_key)
+        try:
+            with open(index_file, encoding='utf-8') as f:
+                keys = set(f.read().splitlines())
+        except FileNotFoundError:
+            return 0
+
+        self._forget(keys)
+        deleted = 0
+        for key in keys:
+            try:
+                os.remove(self._cache_file_path(key))
+                deleted += 1
+            except FileNotFoundError:
+                pass
+        os.remove(index_file)
+
+        logger.info(f"Invalidated {deleted} disk cache entries for {ticket_key}")
+        return deleted
@@ -4,7 +4,7 @@ Extracted from legacy code - handles all Jira operations
 """
 
 import requests
-from typing import List, Dict, Optional
+from typing import List, Dict, NamedTuple, Optional, Tuple
 
 
 # Import from the utils module
@@ -39,7 +39,12 @@ except ImportError:
     def sanitize_ticket_description(desc, remove_code=True): return desc
     def sanitize_attachment(att, remove_code=True): return att
     def sanitize_image_attachment(att, security_level="maximum"): return att
-    def get_sanitization_summary(orig, san): return {}
+    class SanitizationSummary(NamedTuple):
+        total_fields: int = 0
+        safe_fields: int = 0
+        removed_fields: int = 0
+        removed_field_names: Tuple[str, ...] = ()
+    def get_sanitization_summary(orig, san): return SanitizationSummary()
 
 
 class JiraClient:
@@ -609,11 +614,11 @@ class JiraClient:
             if verbose:
                 summary = get_sanitization_summary(ticket, sanitized)
                 print(f"INFO: Sanitization summary for {ticket.get('key', 'unknown')}:")
-                print(f"  - Total fields: {summary['total_fields']}")
-                print(f"  - Safe fields: {summary['safe_fields']}")
-                print(f"  - Removed fields: {summary['removed_fields']}")
-                if summary['removed_field_names']:
-                    print(f"  - Removed: {', '.join(summary['removed_field_names'][:10])}")
+                print(f"  - Total fields: {summary.total_fields}")
+                print(f"  - Safe fields: {summary.safe_fields}")
+                print(f"  - Removed fields: {summary.removed_fields}")
+                if summary.removed_field_names:
+                    print(f"  - Removed: {', '.join(summary.removed_field_names[:10])}")
 
         return sanitized
 
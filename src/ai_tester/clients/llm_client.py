@@ -72,7 +72,8 @@ class LLMClient:
         retries: int = 2,
         pydantic_model=None,
         use_cache: bool = True,
-        model: Optional[str] = None
+        model: Optional[str] = None,
+        ticket_key: Optional[str] = None
     ) -> Tuple[str, Optional[str]]:
         """
         Send a request to the LLM and get JSON response.
@@ -85,6 +86,8 @@ class LLMClient:
             pydantic_model: Optional Pydantic model for structured outputs
             use_cache: Whether to use caching (default: True)
             model: Optional model override (defaults to self.model)
+            ticket_key: Jira ticket the prompt is about; the cached response is
+                indexed under it so CacheClient.invalidate_by_ticket can drop it
 
         Returns:
             Tuple of (response_text, error_message)
@@ -150,7 +153,7 @@ class LLMClient:
                         response_text = parsed.model_dump_json(indent=2)
                         # Cache successful response
                         if use_cache and self.cache_client.enabled:
-                            self.cache_client.set(cache_key, response_text, None)
+                            self.cache_client.set(cache_key, response_text, None, ticket_key=ticket_key)
                         return (response_text, None)
                     else:
                         return ("", "No parsed response from structured output")
@@ -172,7 +175,7 @@ class LLMClient:
                     response_text = (resp.choices[0].message.content or "").strip()
                     # Cache successful response
                     if use_cache and self.cache_client.enabled:
-                        self.cache_client.set(cache_key, response_text, None)
+                        self.cache_client.set(cache_key, response_text, None, ticket_key=ticket_key)
                     return (response_text, None)
                     
             except Exception as e:
@@ -192,7 +195,7 @@ class LLMClient:
                         response_text = (resp.choices[0].message.content or "").strip()
                         # Cache successful response
                         if use_cache and self.cache_client.enabled:
-                            self.cache_client.set(cache_key, response_text, None)
+                            self.cache_client.set(cache_key, response_text, None, ticket_key=ticket_key)
                         return (response_text, None)
                     except Exception as e2:
                         last_err = str(e2)
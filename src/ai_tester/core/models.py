@@ -3,10 +3,16 @@ Core data models for AI Tester.
 
 Extracted from original monolithic code and refactored for testability.
 """
+import sys
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator
 from enum import Enum
 
+from ai_tester.utils.json_compat import json_dumps_bytes
+
+# dataclass(slots=True) is only available on Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class Priority(Enum):
     """Test priority levels"""
@@ -15,7 +21,7 @@ class Priority(Enum):
     LOW = "Low"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TestStep:
     """Represents a single test step"""
     action: str
@@ -38,7 +44,7 @@ class TestStep:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Requirement:
     """Represents a requirement or acceptance criterion"""
     req_id: str
@@ -61,7 +67,7 @@ class Requirement:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TestCase:
     """Represents a complete test case"""
     id: str
@@ -118,7 +124,7 @@ class TestCase:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class GeneratedTestTicket:
     """Represents a generated test ticket (group of test cases)"""
     title: str
@@ -145,23 +151,53 @@ class GeneratedTestTicket:
         """Get total number of steps across all test cases"""
         return sum(tc.get_step_count() for tc in self.test_cases)
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for serialization"""
+    def _header_fields(self) -> Dict[str, Any]:
+        """Fields of to_dict() that come before test_cases, in document order"""
         return {
             "title": self.title,
             "description": self.description,
             "epic_key": self.epic_key,
             "story_keys": self.story_keys,
             "priority": self.priority.value,
+        }
+    
+    def _stats(self) -> Dict[str, int]:
+        """The stats field of to_dict()"""
+        return {
+            "test_case_count": self.get_test_case_count(),
+            "total_step_count": self.get_total_step_count()
+        }
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization"""
+        return {
+            **self._header_fields(),
             "test_cases": [tc.to_dict() for tc in self.test_cases],
-            "stats": {
-                "test_case_count": self.get_test_case_count(),
-                "total_step_count": self.get_total_step_count()
-            }
+            "stats": self._stats()
         }
+    
+    def to_json_bytes(self) -> bytes:
+        """Serialize to compact UTF-8 JSON (orjson if available, else json)"""
+        return json_dumps_bytes(self.to_dict())
+    
+    def iter_json_chunks(self) -> Iterator[bytes]:
+        """
+        Serialize to compact UTF-8 JSON one test case at a time
+        
+        Yields the same document as to_json_bytes(), but only one test case
+        dict is built at a time, so large tickets can be written to a file or
+        socket without materializing the whole dict first.
+        """
+        # Reopen the serialized header object to append the remaining fields
+        yield json_dumps_bytes(self._header_fields())[:-1] + b',"test_cases":['
+        for i, tc in enumerate(self.test_cases):
+            if i:
+                yield b','
+            yield json_dumps_bytes(tc.to_dict())
+        yield b'],"stats":' + json_dumps_bytes(self._stats()) + b'}'
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class EpicContext:
     """Represents the context of an Epic with all its children"""
     epic_key: str
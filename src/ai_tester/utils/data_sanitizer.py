@@ -13,8 +13,12 @@ Phase 2.1 Implementation (Complete): Image Security (Complete Block)
 Phase 2.2 Implementation (Complete): Entity Pseudonymization + PII Detection with Presidio
 """
 
+import os
 import re
-from typing import Dict, List, Any, Optional, Set, Tuple
+from functools import lru_cache
+from importlib.util import find_spec
+from itertools import islice
+from typing import Dict, Iterable, List, Any, NamedTuple, Optional, Set, Tuple
 
 
 # ============================================================================
@@ -90,6 +94,8 @@ PSEUDONYMIZE_FIELDS = {
 class FieldWhitelistConfig:
     """Configuration for Jira field whitelisting"""
 
+    __slots__ = ('safe_fields', 'blocked_fields')
+
     def __init__(
         self,
         safe_fields: Optional[Set[str]] = None,
@@ -104,12 +110,16 @@ class FieldWhitelistConfig:
             blocked_fields: Custom set of blocked field IDs (extends defaults)
             additional_acceptance_criteria_fields: Additional custom field IDs for acceptance criteria
         """
-        self.safe_fields = safe_fields or SAFE_FIELDS.copy()
-        self.blocked_fields = blocked_fields or BLOCKED_FIELDS.copy()
+        safe_fields = set(safe_fields or SAFE_FIELDS)
 
         # Add additional acceptance criteria fields if provided
         if additional_acceptance_criteria_fields:
-            self.safe_fields.update(additional_acceptance_criteria_fields)
+            safe_fields.update(additional_acceptance_criteria_fields)
+
+        # Frozen copies: the caller's sets are never mutated, and the config
+        # can't drift after construction
+        self.safe_fields = frozenset(safe_fields)
+        self.blocked_fields = frozenset(blocked_fields or BLOCKED_FIELDS)
 
     def is_field_allowed(self, field_id: str) -> bool:
         """Check if a field is allowed to be sent to OpenAI"""
@@ -122,7 +132,8 @@ class FieldWhitelistConfig:
             return True
 
         # Check if it's a custom acceptance criteria field (contains "acceptance" or "criteria")
-        if 'acceptance' in field_id.lower() or 'criteria' in field_id.lower():
+        field_name = field_id.lower()
+        if 'acceptance' in field_name or 'criteria' in field_name:
             return True
 
         # Default: block unknown fields
@@ -155,6 +166,99 @@ CODE_BLOCK_PATTERNS = [
 ]
 
 
+# Each removal pass is applied in CODE_BLOCK_PATTERNS order, exactly as a
+# separate re.sub, because a later pass must see the output of the earlier
+# ones (inline code around a '{code}' marker, SQL spanning a removed block).
+_FENCED_BLOCK_PATTERN = re.compile(CODE_BLOCK_PATTERNS[0], re.DOTALL)
+_JIRA_BLOCK_PATTERN = re.compile(CODE_BLOCK_PATTERNS[1], re.DOTALL | re.IGNORECASE)
+_INLINE_CODE_PATTERN = re.compile(CODE_BLOCK_PATTERNS[2])
+_SQL_PATTERN = re.compile(CODE_BLOCK_PATTERNS[3], re.IGNORECASE | re.DOTALL)
+_JIRA_CLOSE_PATTERN = re.compile(r'\{code\}', re.IGNORECASE)
+
+
+def _sub_before(pattern: re.Pattern, replacement: str, text: str, limit: int) -> str:
+    """
+    pattern.sub restricted to text[:limit], where limit is the end of the last
+    closing token (a negative limit means there is none)
+
+    Every match of the block and SQL patterns ends with its closing token, so
+    no match can extend past limit and the result equals pattern.sub over the
+    whole text. Without the limit, each opener with no closing token after it
+    rescans the rest of the text and the pass is quadratic.
+    """
+    if limit <= 0:
+        return text
+    return pattern.sub(replacement, text[:limit]) + text[limit:]
+
+
+def _sub_code_blocks(text: str, replacement: str) -> str:
+    """Apply the fenced, Jira, inline-code and SQL removal passes in order"""
+    close = text.rfind('\n```')
+    text = _sub_before(_FENCED_BLOCK_PATTERN, replacement, text, close + 4 if close != -1 else -1)
+
+    jira_limit = -1
+    for close_match in _JIRA_CLOSE_PATTERN.finditer(text):
+        jira_limit = close_match.end()
+    text = _sub_before(_JIRA_BLOCK_PATTERN, replacement, text, jira_limit)
+
+    if '`' in text:
+        text = _INLINE_CODE_PATTERN.sub(replacement, text)
+
+    close = text.rfind(';')
+    return _sub_before(_SQL_PATTERN, replacement, text, close + 1 if close != -1 else -1)
+
+
+# Try to import Hyperscan (optional dependency) for SIMD scanning of large attachments
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    hyperscan = None
+    HYPERSCAN_AVAILABLE = False
+
+_LONG_TOKEN_PATTERN = re.compile(CODE_BLOCK_PATTERNS[4])
+_LONG_TOKEN_DB = None
+
+# Hyperscan only prefilters for a run of 32 ASCII alphanumerics. The \b
+# anchors are left to re: Hyperscan's byte-level word boundaries treat every
+# non-ASCII letter as a non-word character, unlike re's Unicode \b.
+_LONG_TOKEN_CANDIDATE = r'[A-Za-z0-9]{32}'
+
+if HYPERSCAN_AVAILABLE:
+    try:
+        _LONG_TOKEN_DB = hyperscan.Database()
+        _LONG_TOKEN_DB.compile(
+            expressions=[_LONG_TOKEN_CANDIDATE.encode('ascii')],
+            ids=[0],
+            flags=[hyperscan.HS_FLAG_SINGLEMATCH],
+        )
+    except Exception as e:
+        print(f"WARNING: Hyperscan database compilation failed, using re: {e}")
+        _LONG_TOKEN_DB = None
+
+
+def _contains_long_token(text: str) -> bool:
+    """
+    Check text for long alphanumeric tokens (potential API keys)
+
+    When Hyperscan is available it rules out text without any run of 32
+    ASCII alphanumerics, which every match needs, and only text with such a
+    run is confirmed with the precompiled regex. The answer is therefore
+    always the regex's; Hyperscan reports at most one candidate.
+    """
+    if _LONG_TOKEN_DB is not None:
+        candidates = []
+
+        def on_match(pattern_id, start, end, flags, context):
+            candidates.append(end)
+
+        _LONG_TOKEN_DB.scan(text.encode('utf-8', 'replace'), match_event_handler=on_match)
+        if not candidates:
+            return False
+
+    return _LONG_TOKEN_PATTERN.search(text) is not None
+
+
 def remove_code_blocks(text: str, replacement: str = "[CODE_BLOCK_REMOVED]") -> str:
     """
     Remove code blocks from text to prevent accidental exposure of secrets
@@ -169,23 +273,16 @@ def remove_code_blocks(text: str, replacement: str = "[CODE_BLOCK_REMOVED]") ->
     if not text:
         return text
 
-    sanitized = text
-
-    # Remove markdown code blocks
-    sanitized = re.sub(CODE_BLOCK_PATTERNS[0], replacement, sanitized, flags=re.DOTALL)
-
-    # Remove Jira code blocks
-    sanitized = re.sub(CODE_BLOCK_PATTERNS[1], replacement, sanitized, flags=re.DOTALL | re.IGNORECASE)
-
-    # Remove inline code
-    sanitized = re.sub(CODE_BLOCK_PATTERNS[2], replacement, sanitized)
-
-    # Remove SQL queries
-    sanitized = re.sub(CODE_BLOCK_PATTERNS[3], replacement, sanitized, flags=re.IGNORECASE | re.DOTALL)
+    # Remove markdown code blocks, Jira code blocks, inline code and SQL queries.
+    # Every construct needs a backtick, '{' or ';', so plain prose skips the passes
+    if '`' in text or '{' in text or ';' in text:
+        sanitized = _sub_code_blocks(text, replacement)
+    else:
+        sanitized = text
 
     # Don't remove potential API keys automatically - too many false positives
     # Instead, log a warning if detected
-    if re.search(CODE_BLOCK_PATTERNS[4], sanitized):
+    if _contains_long_token(sanitized):
         print("WARNING: Potential API key or long token detected in text")
 
     return sanitized
@@ -254,6 +351,29 @@ def sanitize_jira_ticket(
     return sanitized
 
 
+def sanitize_jira_tickets(
+    tickets: Iterable[Dict[str, Any]],
+    whitelist_config: Optional[FieldWhitelistConfig] = None,
+    remove_code: bool = True
+) -> List[Dict[str, Any]]:
+    """
+    Sanitize a batch of Jira tickets with one shared whitelist configuration
+
+    Equivalent to calling sanitize_jira_ticket on each ticket, but the default
+    FieldWhitelistConfig is built once for the batch instead of per ticket.
+
+    Args:
+        tickets: Raw Jira tickets
+        whitelist_config: Field whitelist configuration (uses defaults if None)
+        remove_code: Whether to remove code blocks from text fields
+
+    Returns:
+        Sanitized tickets, in input order
+    """
+    config = whitelist_config or FieldWhitelistConfig()
+    return [sanitize_jira_ticket(ticket, config, remove_code) for ticket in tickets]
+
+
 def sanitize_ticket_description(
     description: str,
     remove_code: bool = True
@@ -390,15 +510,100 @@ def sanitize_image_attachment(
 # PHASE 2.2: ENTITY PSEUDONYMIZATION & PII DETECTION
 # ============================================================================
 
-# Try to import Presidio (optional dependency)
-try:
-    from presidio_analyzer import AnalyzerEngine
-    from presidio_anonymizer import AnonymizerEngine
-    PRESIDIO_AVAILABLE = True
-except ImportError:
-    PRESIDIO_AVAILABLE = False
-    AnalyzerEngine = None
-    AnonymizerEngine = None
+# Presidio is an optional dependency. Importing it pulls in spaCy, which takes
+# seconds, so only check that it is installed here; the engine classes are
+# imported on first use (see _import_presidio_analyzer), which clears this
+# flag if the installed packages fail to import
+PRESIDIO_AVAILABLE = (
+    find_spec("presidio_analyzer") is not None
+    and find_spec("presidio_anonymizer") is not None
+)
+AnalyzerEngine = None
+BatchAnalyzerEngine = None
+
+# Conservative entity types (Phase 2.2 - avoid false positives)
+DEFAULT_PII_ENTITIES = [
+    "EMAIL_ADDRESS",   # High risk
+    "IP_ADDRESS",      # High risk
+    "PHONE_NUMBER",    # High risk
+    "CREDIT_CARD",     # High risk
+    "IBAN_CODE",       # High risk (banking)
+    "US_SSN",          # High risk (if applicable)
+    # Note: URL detection removed - causes overlaps with email addresses
+    # Skip: ORGANIZATION (too many false positives)
+    # Skip: PERSON (names can be project code names, not always PII)
+]
+
+# Every default entity needs an '@' (email), a digit (IPv4, phone, card, IBAN,
+# SSN) or a ':' (IPv6), so text without any of them can skip the analyzer
+_PII_PREFILTER_PATTERN = re.compile(r'[@:\d]')
+_PREFILTERED_ENTITIES = frozenset(DEFAULT_PII_ENTITIES)
+
+
+def _may_contain_pii(text: str, entities_to_detect: Optional[List[str]] = None) -> bool:
+    """Cheap literal check run before handing text to Presidio."""
+    if entities_to_detect and not _PREFILTERED_ENTITIES.issuperset(entities_to_detect):
+        return True
+    return _PII_PREFILTER_PATTERN.search(text) is not None
+
+
+# spaCy model backing Presidio. Every default entity is found by Presidio's
+# pattern recognizers (or phonenumbers), so the small model is enough; set
+# PRESIDIO_SPACY_MODEL (e.g. en_core_web_lg) when detecting NER entities
+# such as PERSON or LOCATION.
+DEFAULT_PRESIDIO_SPACY_MODEL = "en_core_web_sm"
+
+
+def _create_nlp_engine():
+    """Build the spaCy NLP engine for the shared AnalyzerEngine."""
+    from presidio_analyzer.nlp_engine import NlpEngineProvider
+
+    model_name = os.getenv("PRESIDIO_SPACY_MODEL", DEFAULT_PRESIDIO_SPACY_MODEL)
+    provider = NlpEngineProvider(nlp_configuration={
+        "nlp_engine_name": "spacy",
+        "models": [{"lang_code": "en", "model_name": model_name}],
+    })
+    return provider.create_engine()
+
+
+def _import_presidio_analyzer():
+    """
+    Import presidio_analyzer on first use.
+
+    An install that fails to import (e.g. a spaCy or pydantic version clash)
+    is from then on treated as not installed, rather than failing the import
+    again on every call.
+    """
+    global PRESIDIO_AVAILABLE
+    try:
+        import presidio_analyzer
+    except Exception:
+        PRESIDIO_AVAILABLE = False
+        raise
+    return presidio_analyzer
+
+
+@lru_cache(maxsize=1)
+def _get_analyzer_engine() -> "AnalyzerEngine":
+    """
+    Shared Presidio AnalyzerEngine.
+
+    Building an engine loads the spaCy model and all recognizers, which takes
+    far longer than analyzing a ticket, so one engine is built on first use
+    and reused for every call.
+    """
+    global AnalyzerEngine
+    if AnalyzerEngine is None:
+        AnalyzerEngine = _import_presidio_analyzer().AnalyzerEngine
+    return AnalyzerEngine(nlp_engine=_create_nlp_engine(), supported_languages=["en"])
+
+
+def _get_batch_analyzer_engine() -> "BatchAnalyzerEngine":
+    """BatchAnalyzerEngine wrapping the shared AnalyzerEngine."""
+    global BatchAnalyzerEngine
+    if BatchAnalyzerEngine is None:
+        BatchAnalyzerEngine = _import_presidio_analyzer().BatchAnalyzerEngine
+    return BatchAnalyzerEngine(analyzer_engine=_get_analyzer_engine())
 
 
 class EntityPseudonymizer:
@@ -433,6 +638,16 @@ class EntityPseudonymizer:
         "URL": "URL"
     }
 
+    # Shape of every placeholder produced by _get_next_placeholder
+    _PLACEHOLDER_PATTERN = re.compile(r'<\w+_\d+>')
+
+    __slots__ = (
+        'entity_to_placeholder',
+        'placeholder_to_entity',
+        'counters',
+        '_contains_sensitive_data',
+    )
+
     def __init__(self):
         """Initialize pseudonymizer with empty mappings"""
         # Forward mapping: real value → placeholder
@@ -460,13 +675,10 @@ class EntityPseudonymizer:
         # Map to semantic type
         semantic_type = self.ENTITY_TYPE_MAPPING.get(entity_type, entity_type)
 
-        # Initialize counter if needed
-        if semantic_type not in self.counters:
-            self.counters[semantic_type] = 0
-
-        # Increment and generate placeholder
-        self.counters[semantic_type] += 1
-        return f"<{semantic_type}_{self.counters[semantic_type]}>"
+        # Increment counter (starting at 1) and generate placeholder
+        count = self.counters.get(semantic_type, 0) + 1
+        self.counters[semantic_type] = count
+        return f"<{semantic_type}_{count}>"
 
     def pseudonymize_entity(self, entity_value: str, entity_type: str) -> str:
         """
@@ -483,8 +695,9 @@ class EntityPseudonymizer:
             Placeholder string (e.g., "<EMAIL_1>")
         """
         # Check if we've seen this entity before
-        if entity_value in self.entity_to_placeholder:
-            return self.entity_to_placeholder[entity_value]
+        placeholder = self.entity_to_placeholder.get(entity_value)
+        if placeholder is not None:
+            return placeholder
 
         # Create new placeholder
         placeholder = self._get_next_placeholder(entity_type)
@@ -508,10 +721,12 @@ class EntityPseudonymizer:
         Returns:
             Text with original sensitive values restored
         """
-        result = text_with_placeholders
-        for placeholder, entity in self.placeholder_to_entity.items():
-            result = result.replace(placeholder, entity)
-        return result
+        # One pass over the text instead of one str.replace per mapped entity
+        placeholder_to_entity = self.placeholder_to_entity
+        return self._PLACEHOLDER_PATTERN.sub(
+            lambda m: placeholder_to_entity.get(m.group(0), m.group(0)),
+            text_with_placeholders
+        )
 
     def get_summary(self) -> Dict[str, Any]:
         """
@@ -575,83 +790,21 @@ def pseudonymize_text_with_presidio(
     if not text:
         return text, {"entities_detected": 0}
 
-    try:
-        # Initialize Presidio analyzer
-        analyzer = AnalyzerEngine()
-
-        # Conservative entity types (Phase 2.2 - avoid false positives)
-        default_entities = [
-            "EMAIL_ADDRESS",   # High risk
-            "IP_ADDRESS",      # High risk
-            "PHONE_NUMBER",    # High risk
-            "CREDIT_CARD",     # High risk
-            "IBAN_CODE",       # High risk (banking)
-            "US_SSN",          # High risk (if applicable)
-            # Note: URL detection removed - causes overlaps with email addresses
-            # Skip: ORGANIZATION (too many false positives)
-            # Skip: PERSON (names can be project code names, not always PII)
-        ]
+    if not _may_contain_pii(text, entities_to_detect):
+        return _apply_presidio_results(text, [], pseudonymizer)
 
-        entities = entities_to_detect or default_entities
+    try:
+        analyzer = _get_analyzer_engine()
 
         # Detect PII
         results = analyzer.analyze(
             text=text,
-            entities=entities,
+            entities=entities_to_detect or DEFAULT_PII_ENTITIES,
             language="en",
             allow_list=allowed_organizations or []
         )
 
-        if not results:
-            return text, {"entities_detected": 0}
-
-        # Filter out overlapping detections (e.g., URL within EMAIL_ADDRESS)
-        # Prioritize higher-confidence and longer matches
-        filtered_results = []
-        for result in results:
-            overlaps = False
-            for other in results:
-                if result == other:
-                    continue
-                # Check if result overlaps with other
-                if (result.start >= other.start and result.end <= other.end):
-                    # result is contained within other - skip if other has higher score
-                    if other.score >= result.score:
-                        overlaps = True
-                        break
-            if not overlaps:
-                filtered_results.append(result)
-
-        # Sort by start position (reverse) to replace from end to start
-        # This prevents offset issues when replacing
-        results_sorted = sorted(filtered_results, key=lambda x: x.start, reverse=True)
-
-        # Pseudonymize each entity
-        pseudonymized = text
-        for result in results_sorted:
-            # Extract the actual entity value
-            entity_value = text[result.start:result.end]
-
-            # Get consistent placeholder
-            placeholder = pseudonymizer.pseudonymize_entity(
-                entity_value=entity_value,
-                entity_type=result.entity_type
-            )
-
-            # Replace in text (from end to start to maintain offsets)
-            pseudonymized = (
-                pseudonymized[:result.start] +
-                placeholder +
-                pseudonymized[result.end:]
-            )
-
-        # Generate safe summary (no sensitive mappings)
-        summary = {
-            "entities_detected": len(filtered_results),
-            "by_type": pseudonymizer.get_summary()["by_type"]
-        }
-
-        return pseudonymized, summary
+        return _apply_presidio_results(text, results, pseudonymizer)
 
     except Exception as e:
         # If Presidio fails, return original text and log error
@@ -662,6 +815,145 @@ def pseudonymize_text_with_presidio(
         }
 
 
+def pseudonymize_texts_with_presidio(
+    texts: Iterable[str],
+    pseudonymizer: EntityPseudonymizer,
+    allowed_organizations: Optional[List[str]] = None,
+    entities_to_detect: Optional[List[str]] = None,
+    batch_size: int = 32,
+    n_process: int = 1
+) -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    Batch variant of pseudonymize_text_with_presidio.
+
+    Runs all texts through one Presidio BatchAnalyzerEngine, so the spaCy
+    pipeline processes them with nlp.pipe in batches of batch_size instead of
+    one document at a time. Texts are pseudonymized in order with the shared
+    pseudonymizer, so placeholders stay consistent across the batch.
+
+    Args:
+        texts: Input texts that may contain PII
+        pseudonymizer: EntityPseudonymizer instance (maintains consistency)
+        allowed_organizations: List of company names to whitelist (optional)
+        entities_to_detect: Custom entity list (defaults to conservative set)
+        batch_size: Number of texts per spaCy batch
+        n_process: Worker processes for spaCy's nlp.pipe (1 = in-process).
+            Worth raising only for large batches, since each worker loads
+            its own copy of the model.
+
+    Returns:
+        List of (pseudonymized_text, summary_dict), one per input text
+    """
+    texts = [text or "" for text in texts]
+
+    if not PRESIDIO_AVAILABLE:
+        return [
+            (text, {
+                "error": "Presidio not installed",
+                "note": "Run: pip install presidio-analyzer presidio-anonymizer"
+            })
+            for text in texts
+        ]
+
+    try:
+        # Only texts that pass the prefilter go through spaCy, and each distinct
+        # text only once; the rest have no detections. The detections are held
+        # for this call only, so no PII outlives it
+        to_analyze = list(dict.fromkeys(
+            text for text in texts if _may_contain_pii(text, entities_to_detect)
+        ))
+        detections = {}
+        if to_analyze:
+            # Feed spaCy texts sorted by length so each batch pads to a
+            # similar size; placeholders are still assigned in input order
+            to_analyze.sort(key=len)
+            batch_analyzer = _get_batch_analyzer_engine()
+            detections = dict(zip(to_analyze, batch_analyzer.analyze_iterator(
+                to_analyze,
+                language="en",
+                batch_size=batch_size,
+                n_process=n_process,
+                entities=entities_to_detect or DEFAULT_PII_ENTITIES,
+                allow_list=allowed_organizations or []
+            )))
+
+        return [
+            _apply_presidio_results(text, detections.get(text, []), pseudonymizer)
+            for text in texts
+        ]
+
+    except Exception as e:
+        # If Presidio fails, return original texts and log error
+        print(f"WARNING: Presidio batch pseudonymization failed: {e}")
+        return [(text, {"error": str(e), "entities_detected": 0}) for text in texts]
+
+
+def _apply_presidio_results(
+    text: str,
+    results: List[Any],
+    pseudonymizer: EntityPseudonymizer
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Replace Presidio detections in text with pseudonymizer placeholders.
+
+    Args:
+        text: Text the results were detected in
+        results: Presidio RecognizerResult list for text
+        pseudonymizer: EntityPseudonymizer instance (maintains consistency)
+
+    Returns:
+        Tuple of (pseudonymized_text, summary_dict)
+    """
+    if not results:
+        return text, {"entities_detected": 0}
+
+    # Filter out overlapping detections (e.g., URL within EMAIL_ADDRESS)
+    # Prioritize higher-confidence and longer matches
+    filtered_results = []
+    for result in results:
+        overlaps = False
+        for other in results:
+            if result == other:
+                continue
+            # Check if result overlaps with other
+            if (result.start >= other.start and result.end <= other.end):
+                # result is contained within other - skip if other has higher score
+                if other.score >= result.score:
+                    overlaps = True
+                    break
+        if not overlaps:
+            filtered_results.append(result)
+
+    # Placeholders are assigned from the end of the text backwards, which
+    # fixes the numbering; the output is then assembled front to back in a
+    # single join instead of re-slicing the whole text per entity
+    results_sorted = sorted(filtered_results, key=lambda x: x.start, reverse=True)
+    placeholders = [
+        pseudonymizer.pseudonymize_entity(
+            entity_value=text[result.start:result.end],
+            entity_type=result.entity_type
+        )
+        for result in results_sorted
+    ]
+
+    parts = []
+    cursor = 0
+    for result, placeholder in zip(reversed(results_sorted), reversed(placeholders)):
+        parts.append(text[cursor:result.start])
+        parts.append(placeholder)
+        cursor = max(cursor, result.end)
+    parts.append(text[cursor:])
+    pseudonymized = ''.join(parts)
+
+    # Generate safe summary (no sensitive mappings)
+    summary = {
+        "entities_detected": len(filtered_results),
+        "by_type": pseudonymizer.get_summary()["by_type"]
+    }
+
+    return pseudonymized, summary
+
+
 # ============================================================================
 # PHASE 2.2: INTEGRATED SANITIZATION WITH PSEUDONYMIZATION
 # ============================================================================
@@ -763,7 +1055,7 @@ def detect_pii(text: str) -> List[Dict[str, Any]]:
         return []
 
     try:
-        analyzer = AnalyzerEngine()
+        analyzer = _get_analyzer_engine()
         results = analyzer.analyze(
             text=text,
             entities=["EMAIL_ADDRESS", "IP_ADDRESS", "PHONE_NUMBER"],
@@ -802,23 +1094,68 @@ def redact_pii(text: str, pii_entities: List[Dict[str, Any]]) -> str:
 # UTILITY FUNCTIONS
 # ============================================================================
 
+class SanitizationSummary(NamedTuple):
+    """Field-level audit summary of a sanitized ticket"""
+    total_fields: int
+    safe_fields: int
+    removed_fields: int
+    removed_field_names: Tuple[str, ...]
+
+
 def get_sanitization_summary(
     original_ticket: Dict[str, Any],
     sanitized_ticket: Dict[str, Any]
-) -> Dict[str, Any]:
+) -> SanitizationSummary:
     """
     Generate a summary of what was sanitized
 
     Returns:
-        Dictionary with counts of removed fields, code blocks, etc.
+        SanitizationSummary with counts and sorted names of removed fields
     """
-    original_fields = set(original_ticket.get('fields', {}).keys())
-    sanitized_fields = set(sanitized_ticket.get('fields', {}).keys())
-    removed_fields = original_fields - sanitized_fields
+    original_fields = original_ticket.get('fields', {})
+    sanitized_fields = sanitized_ticket.get('fields', {})
+    # Key views support set operations directly, no intermediate sets needed
+    removed_fields = original_fields.keys() - sanitized_fields.keys()
 
-    return {
-        'total_fields': len(original_fields),
-        'safe_fields': len(sanitized_fields),
-        'removed_fields': len(removed_fields),
-        'removed_field_names': list(removed_fields),
-    }
+    return SanitizationSummary(
+        total_fields=len(original_fields),
+        safe_fields=len(sanitized_fields),
+        removed_fields=len(removed_fields),
+        removed_field_names=tuple(sorted(removed_fields)),
+    )
+
+
+def get_sanitization_counts(
+    original_ticket: Dict[str, Any],
+    sanitized_ticket: Dict[str, Any],
+    sample_removed: int = 5
+) -> SanitizationSummary:
+    """
+    Lightweight variant of get_sanitization_summary that only reports counts
+
+    Sanitized fields are always a subset of the original fields, so the counts
+    are derived from the field dict sizes without building set differences.
+
+    Args:
+        original_ticket: Raw Jira ticket data
+        sanitized_ticket: Output of sanitize_jira_ticket
+        sample_removed: Number of removed field names to include (0 to skip)
+
+    Returns:
+        SanitizationSummary whose removed_field_names holds at most
+        sample_removed names
+    """
+    original_fields = original_ticket.get('fields', {})
+    sanitized_fields = sanitized_ticket.get('fields', {})
+
+    removed_names: Tuple[str, ...] = ()
+    if sample_removed > 0:
+        removed = (name for name in original_fields if name not in sanitized_fields)
+        removed_names = tuple(islice(removed, sample_removed))
+
+    return SanitizationSummary(
+        total_fields=len(original_fields),
+        safe_fields=len(sanitized_fields),
+        removed_fields=len(original_fields) - len(sanitized_fields),
+        removed_field_names=removed_names,
+    )
@@ -1,6 +1,15 @@
 """String formatting utilities"""
+import json
 import re
 
+from ai_tester.utils.json_compat import json_loads
+
+
+# Characters dropped from slugs, and runs of whitespace/hyphens that collapse
+# to a single hyphen
+_SLUG_INVALID_CHARS = re.compile(r"[^a-z0-9\-\s]+")
+_SLUG_SEPARATORS = re.compile(r"[\s-]+")
+
 
 def slugify(text: str) -> str:
     """
@@ -26,15 +35,10 @@ def slugify(text: str) -> str:
     text = text.strip().lower()
     
     # Remove special characters
-    text = re.sub(r"[^a-z0-9\-\s]", "", text)
+    text = _SLUG_INVALID_CHARS.sub("", text)
     
-    # Replace spaces with hyphens
-    text = re.sub(r"\s+", "-", text)
-    
-    # Remove multiple hyphens
-    text = re.sub(r"-+", "-", text)
-    
-    return text
+    # Replace spaces and repeated hyphens with a single hyphen
+    return _SLUG_SEPARATORS.sub("-", text)
 
 
 def safe_json_extract(text: str) -> dict:
@@ -51,8 +55,6 @@ def safe_json_extract(text: str) -> dict:
         >>> safe_json_extract('```json\\n{"key": "value"}\\n```')
         {'key': 'value'}
     """
-    import json
-    
     if not text:
         return None
     
@@ -62,15 +64,17 @@ def safe_json_extract(text: str) -> dict:
     
     # Try direct parse
     try:
-        return json.loads(text)
+        return json_loads(text)
     except (json.JSONDecodeError, ValueError):
         pass
     
-    # Try to find JSON object in text
-    match = re.search(r"(\{(?:.|\n)*\})", text, re.DOTALL)
-    if match:
+    # Try to find JSON object in text: the span from the first '{' to the
+    # last '}', located with str.find/rfind rather than a greedy regex
+    start = text.find("{")
+    end = text.rfind("}")
+    if start != -1 and end > start:
         try:
-            return json.loads(match.group(1))
+            return json_loads(text[start:end + 1])
         except (json.JSONDecodeError, ValueError):
             pass
     
@@ -6,6 +6,45 @@ Sanitizes user input to prevent prompt injection attacks.
 import re
 from typing import Set
 
+# Phrases in a parenthetical note that mark the preceding term as out of scope
+_SCOPE_REMOVAL_NOTE = r'(?:removed from scope|out of scope|not in scope|scope removed|deleted from scope)'
+
+# Terms marked as removed: ~~word~~ and "word (removed from scope)"
+_STRIKETHROUGH_TERM_PATTERN = re.compile(r'~~(\w+)~~', re.IGNORECASE)
+_REMOVAL_NOTE_TERM_PATTERN = re.compile(
+    rf'\b(\w+)\s*\([^)]*{_SCOPE_REMOVAL_NOTE}[^)]*\)', re.IGNORECASE
+)
+
+# Strikethrough text (Jira markdown: ~~text~~)
+_STRIKETHROUGH_PATTERN = re.compile(r'~{2,}[^~]+~{2,}')
+
+# Words/phrases followed by removal notes, applied in order
+_REMOVAL_PHRASE_PATTERNS = [
+    re.compile(rf'\b\w+\s*\([^)]*{_SCOPE_REMOVAL_NOTE}[^)]*\)', re.IGNORECASE),
+    re.compile(r',?\s*and\s+\w+\s*\([^)]*(?:removed from scope|out of scope)[^)]*\)', re.IGNORECASE),
+    re.compile(r'\band\s+~~[^~]+~~', re.IGNORECASE),
+]
+
+# Standalone parenthetical notes about removed scope. One alternation removes
+# the same notes as one pattern per phrase: a note always runs from the first
+# '(' after the previous ')' to the next ')', so removing one note can't create
+# or break a match for another phrase
+_REMOVAL_NOTE_PATTERN = re.compile(rf'\([^)]*{_SCOPE_REMOVAL_NOTE}[^)]*\)', re.IGNORECASE)
+
+# Artifact and whitespace cleanup, applied in order
+_CLEANUP_SUBSTITUTIONS = [
+    (re.compile(r'\s*,\s*,\s*'), ', '),  # Double commas
+    (re.compile(r'\s+and\s+and\s+'), ' and '),  # Double "and"
+    (re.compile(r',\s*and\s+'), ' and '),  # ", and" -> " and"
+    (re.compile(r'\(\s*\)'), ''),  # Empty parentheses
+    (re.compile(r'\s+operations'), ' operations'),  # Extra space before operations
+    (re.compile(r'/\s*/'), '/'),  # Clean up double slashes
+    (re.compile(r'(^|[^/])/$'), r'\1'),  # Remove trailing slash
+    (re.compile(r'\n\s*\n\s*\n+'), '\n\n'),  # Multiple blank lines
+    (re.compile(r'[ \t]+'), ' '),  # Multiple spaces
+    (re.compile(r'\.\s*\.'), '.'),  # Double periods
+]
+
 
 def clean_jira_text_for_llm(text: str) -> str:
     """
@@ -29,40 +68,22 @@ def clean_jira_text_for_llm(text: str) -> str:
     removed_terms: Set[str] = set()
 
     # Find strikethrough terms: ~~word~~
-    strikethrough_matches = re.findall(r'~~(\w+)~~', text, re.IGNORECASE)
+    strikethrough_matches = _STRIKETHROUGH_TERM_PATTERN.findall(text)
     removed_terms.update([term.lower() for term in strikethrough_matches])
 
     # Find words followed by removal notes: "word (removed from scope)"
-    removal_note_matches = re.findall(
-        r'\b(\w+)\s*\([^)]*(?:removed from scope|out of scope|not in scope|scope removed|deleted from scope)[^)]*\)',
-        text,
-        re.IGNORECASE
-    )
+    removal_note_matches = _REMOVAL_NOTE_TERM_PATTERN.findall(text)
     removed_terms.update([term.lower() for term in removal_note_matches])
 
     # Remove strikethrough text (Jira markdown: ~~text~~)
-    text = re.sub(r'~{2,}[^~]+~{2,}', '', text)
+    text = _STRIKETHROUGH_PATTERN.sub('', text)
 
     # Remove words/phrases followed by removal notes
-    removal_phrases = [
-        r'\b\w+\s*\([^)]*(?:removed from scope|out of scope|not in scope|scope removed|deleted from scope)[^)]*\)',
-        r',?\s*and\s+\w+\s*\([^)]*(?:removed from scope|out of scope)[^)]*\)',
-        r'\band\s+~~[^~]+~~',
-    ]
-    for pattern in removal_phrases:
-        text = re.sub(pattern, '', text, flags=re.IGNORECASE)
+    for pattern in _REMOVAL_PHRASE_PATTERNS:
+        text = pattern.sub('', text)
 
     # Remove standalone parenthetical notes about removed scope
-    removal_patterns = [
-        r'\([^)]*removed from scope[^)]*\)',
-        r'\([^)]*out of scope[^)]*\)',
-        r'\([^)]*not in scope[^)]*\)',
-        r'\([^)]*scope removed[^)]*\)',
-        r'\([^)]*deleted from scope[^)]*\)',
-        r'\([^)]*operation removed from scope[^)]*\)',
-    ]
-    for pattern in removal_patterns:
-        text = re.sub(pattern, '', text, flags=re.IGNORECASE)
+    text = _REMOVAL_NOTE_PATTERN.sub('', text)
 
     # For each removed term, remove ALL occurrences throughout the text
     for term in removed_terms:
@@ -95,19 +116,9 @@ def clean_jira_text_for_llm(text: str) -> str:
 
     text = '\n'.join(cleaned_lines)
 
-    # Clean up artifacts
-    text = re.sub(r'\s*,\s*,\s*', ', ', text)  # Double commas
-    text = re.sub(r'\s+and\s+and\s+', ' and ', text)  # Double "and"
-    text = re.sub(r',\s*and\s+', ' and ', text)  # ", and" -> " and"
-    text = re.sub(r'\(\s*\)', '', text)  # Empty parentheses
-    text = re.sub(r'\s+operations', ' operations', text)  # Extra space before operations
-    text = re.sub(r'/\s*/', '/', text)  # Clean up double slashes
-    text = re.sub(r'(^|[^/])/$', r'\1', text)  # Remove trailing slash
-
-    # Clean up extra whitespace
-    text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)  # Multiple blank lines
-    text = re.sub(r'[ \t]+', ' ', text)  # Multiple spaces
-    text = re.sub(r'\.\s*\.', '.', text)  # Double periods
+    # Clean up artifacts and extra whitespace
+    for pattern, replacement in _CLEANUP_SUBSTITUTIONS:
+        text = pattern.sub(replacement, text)
     text = text.strip()
 
     return text
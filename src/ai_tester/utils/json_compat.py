@@ -0,0 +1,33 @@
+"""
+JSON helpers that use orjson when it is installed.
+
+orjson parses and serializes several times faster than the json module, but
+rejects NaN/Infinity, so parsing falls back to json for those.
+"""
+import json
+from typing import Any, Union
+
+# Try to import orjson (optional dependency) for faster JSON parsing/serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+def json_loads(text: Union[str, bytes]) -> Any:
+    """Parse JSON with orjson when available, falling back to json (which also accepts NaN/Infinity)"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
+def json_dumps_bytes(obj: Any) -> bytes:
+    """Serialize obj to compact UTF-8 JSON (orjson if available, else json)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
@@ -4,7 +4,11 @@ Token management utilities for LLM context window management.
 Provides token counting, estimation, and smart truncation to prevent
 exceeding model context limits.
 """
+import hashlib
+import threading
+
 import tiktoken
+from cachetools import LRUCache
 from typing import Dict, Any, Tuple
 
 
@@ -21,6 +25,21 @@ MODEL_LIMITS = {
 # Reserve tokens for response (output)
 DEFAULT_RESPONSE_RESERVE = 4000  # Reserve 4k tokens for model response
 
+# Exact counts are memoized for texts up to this many characters (system
+# prompts, short fields); longer texts are tokenized on every call. The cache
+# is keyed by a digest of the text rather than the text itself: user prompts
+# carry ticket content that may contain PII, which must not stay in memory
+# for the life of the process
+COUNT_CACHE_MAX_CHARS = 1500
+COUNT_CACHE_SIZE = 4096
+_COUNT_CACHE: LRUCache = LRUCache(maxsize=COUNT_CACHE_SIZE)
+_COUNT_CACHE_LOCK = threading.Lock()
+
+
+# Encodings resolved per model name, so the tiktoken lookup (and the fallback
+# warning for unknown models) happens once per process
+_ENCODERS: Dict[str, tiktoken.Encoding] = {}
+
 
 def get_encoding_for_model(model: str) -> tiktoken.Encoding:
     """
@@ -35,30 +54,61 @@ def get_encoding_for_model(model: str) -> tiktoken.Encoding:
     Raises:
         ValueError: If model is not supported
     """
+    enc = _ENCODERS.get(model)
+    if enc is not None:
+        return enc
+
     try:
-        return tiktoken.encoding_for_model(model)
+        enc = tiktoken.encoding_for_model(model)
     except KeyError:
         # Fallback to cl100k_base for newer models
         print(f"Warning: Model '{model}' not found in tiktoken, using cl100k_base encoding")
-        return tiktoken.get_encoding("cl100k_base")
+        enc = tiktoken.get_encoding("cl100k_base")
+
+    _ENCODERS[model] = enc
+    return enc
+
+
+def _count_tokens(text: str, model: str) -> int:
+    """
+    Exact token count for a short text, memoized per (text digest, model).
+
+    Only called with texts of at most COUNT_CACHE_MAX_CHARS characters, so
+    hashing stays cheap while repeated system prompts skip the BPE pass
+    entirely.
+    """
+    key = (hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest(), model)
+    with _COUNT_CACHE_LOCK:
+        count = _COUNT_CACHE.get(key)
+    if count is None:
+        count = len(get_encoding_for_model(model).encode_ordinary(text))
+        with _COUNT_CACHE_LOCK:
+            _COUNT_CACHE[key] = count
+    return count
 
 
 def estimate_tokens(text: str, model: str = "gpt-4o") -> int:
     """
-    Estimate the number of tokens in a text string.
+    Count the number of tokens in a text string.
+
+    The count is exact: check_token_limit and validate_prompt_size rely on it
+    to decide whether a prompt fits the context window, so it must not
+    undercount. Counts for short texts are memoized.
 
     Args:
-        text: Text to estimate tokens for
+        text: Text to count tokens for
         model: Model name to use for encoding
 
     Returns:
-        Estimated token count
+        Token count
     """
     if not text:
         return 0
 
-    enc = get_encoding_for_model(model)
-    return len(enc.encode(text))
+    if len(text) <= COUNT_CACHE_MAX_CHARS:
+        return _count_tokens(text, model)
+
+    return len(get_encoding_for_model(model).encode_ordinary(text))
 
 
 def estimate_messages_tokens(messages: list, model: str = "gpt-4o") -> int:
@@ -87,7 +137,7 @@ def estimate_messages_tokens(messages: list, model: str = "gpt-4o") -> int:
         num_tokens += tokens_per_message
         for key, value in message.items():
             if value:
-                num_tokens += len(enc.encode(str(value)))
+                num_tokens += len(enc.encode_ordinary(str(value)))
             if key == "name":
                 num_tokens += tokens_per_name
 
@@ -166,7 +216,7 @@ def truncate_to_token_limit(
         return text
 
     enc = get_encoding_for_model(model)
-    tokens = enc.encode(text)
+    tokens = enc.encode_ordinary(text)
 
     # If already within limit, return as-is
     if len(tokens) <= max_tokens:
@@ -225,7 +275,7 @@ def split_text_to_chunks(
         return []
 
     enc = get_encoding_for_model(model)
-    tokens = enc.encode(text)
+    tokens = enc.encode_ordinary(text)
 
     chunks = []
     start = 0
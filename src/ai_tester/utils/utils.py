@@ -4,18 +4,38 @@ Extracted from legacy code
 """
 
 import re
-import json
-import base64
+from binascii import b2a_base64
 from typing import Optional, Dict
 from html import escape as _html_escape
 
+from ai_tester.utils.json_compat import json_loads
+
+# Try to import pybase64 (optional dependency) for SIMD base64 encoding
+try:
+    import pybase64
+    PYBASE64_AVAILABLE = True
+except ImportError:
+    pybase64 = None
+    PYBASE64_AVAILABLE = False
+
+# Try to import pypdfium2 (optional dependency) for faster PDF text extraction
+try:
+    import pypdfium2 as pdfium
+    PYPDFIUM2_AVAILABLE = True
+except ImportError:
+    pdfium = None
+    PYPDFIUM2_AVAILABLE = False
+
+
+_SLUG_INVALID_CHARS = re.compile(r"[^a-z0-9\-\s]+")
+_SLUG_SEPARATORS = re.compile(r"[\s-]+")
+_EXCESS_NEWLINES_PATTERN = re.compile(r"\n{4,}")
+
 
 def slugify(value: str) -> str:
     """Convert text to URL-friendly slug."""
-    value = value.strip().lower()
-    value = re.sub(r"[^a-z0-9\-\s]", "", value)
-    value = re.sub(r"\s+", "-", value)
-    value = re.sub(r"-+", "-", value)
+    value = _SLUG_INVALID_CHARS.sub("", value.strip().lower())
+    value = _SLUG_SEPARATORS.sub("-", value)
     return value or "ticket"
 
 
@@ -31,27 +51,34 @@ def safe_json_extract(text: str) -> Optional[dict]:
     
     # Try direct parse
     try:
-        result = json.loads(s)
+        result = json_loads(s)
         print(f"DEBUG safe_json_extract: Successfully parsed JSON directly")
         return result
     except Exception as e:
         print(f"DEBUG safe_json_extract: Direct parse failed: {e}")
     
-    # Try to find JSON object in text
-    m = re.search(r"(\{(?:.|\n)*\})", s, re.DOTALL)
-    if m:
+    # Try to find JSON object in text: the span from the first '{' to the
+    # last '}', located with str.find/rfind rather than a greedy regex
+    start = s.find("{")
+    end = s.rfind("}")
+    if start != -1 and end > start:
+        candidate = s[start:end + 1]
         try:
-            result = json.loads(m.group(1))
-            print(f"DEBUG safe_json_extract: Successfully extracted JSON via regex")
+            result = json_loads(candidate)
+            print(f"DEBUG safe_json_extract: Successfully extracted JSON object span")
             return result
         except Exception as e:
-            print(f"DEBUG safe_json_extract: Regex extraction parse failed: {e}")
-            print(f"DEBUG safe_json_extract: Extracted text (first 200 chars): {m.group(1)[:200]}")
+            print(f"DEBUG safe_json_extract: Object span parse failed: {e}")
+            print(f"DEBUG safe_json_extract: Extracted text (first 200 chars): {candidate[:200]}")
     
     print("DEBUG safe_json_extract: All parsing attempts failed")
     return None
 
 
+_STRIKETHROUGH_PATTERN = re.compile(r"~~[^~]+~~")
+_SCOPE_NOTE_PATTERN = re.compile(r"\b\w+\s*\([^)]*removed from scope[^)]*\)", re.IGNORECASE)
+
+
 def clean_jira_text_for_llm(text: str) -> str:
     """
     Clean Jira text to remove out-of-scope content before sending to LLM.
@@ -72,10 +99,10 @@ def clean_jira_text_for_llm(text: str) -> str:
             continue
         
         # Remove inline strikethrough text
-        line = re.sub(r"~~[^~]+~~", "", line)
+        line = _STRIKETHROUGH_PATTERN.sub("", line)
         
         # Remove parenthetical scope notes with preceding word
-        line = re.sub(r"\b\w+\s*\([^)]*removed from scope[^)]*\)", "", line, flags=re.IGNORECASE)
+        line = _SCOPE_NOTE_PATTERN.sub("", line)
         
         if line.strip():
             cleaned_lines.append(line)
@@ -179,83 +206,93 @@ def plain_to_html(text: str) -> str:
     return JIRA_HTML_CSS + f"<div class='jira'><p>{safe}</p></div>"
 
 
+def _adf_list_item_text(item: Dict) -> str:
+    return "".join(
+        text_node.get("text", "")
+        for item_content in item.get("content", [])
+        if item_content.get("type") == "paragraph"
+        for text_node in item_content.get("content", [])
+        if text_node.get("type") == "text"
+    )
+
+
 def adf_to_plaintext(adf: Dict) -> str:
     """Convert Atlassian Document Format to readable plain text."""
     out = []
-    
-    def walk(node, indent_level=0):
+    # Explicit stack of (node, indent_level); an indent of None marks a
+    # finished string to emit. Entries are pushed in reverse so they pop in
+    # document order.
+    stack = [(adf, 0)] if adf else []
+
+    while stack:
+        node, indent_level = stack.pop()
+        if indent_level is None:
+            out.append(node)
+            continue
+
         node_type = node.get("type", "")
         content = node.get("content", [])
-        
+
         if node_type == "heading":
-            level = node.get("attrs", {}).get("level", 1)
             heading_text = "".join([c.get("text", "") for c in content if c.get("type") == "text"])
             out.append("\n" + heading_text + "\n")
-        
+
         elif node_type == "paragraph":
-            para_text = ""
+            para_parts = []
             for c in content:
                 if c.get("type") == "text":
-                    para_text += c.get("text", "")
+                    para_parts.append(c.get("text", ""))
                 elif c.get("type") == "hardBreak":
-                    para_text += "\n"
+                    para_parts.append("\n")
+            para_text = "".join(para_parts)
             if para_text.strip():
                 out.append("  " * indent_level + para_text + "\n")
-        
-        elif node_type == "bulletList":
-            for item in content:
-                if item.get("type") == "listItem":
-                    item_text = ""
-                    for item_content in item.get("content", []):
-                        if item_content.get("type") == "paragraph":
-                            for text_node in item_content.get("content", []):
-                                if text_node.get("type") == "text":
-                                    item_text += text_node.get("text", "")
-                    if item_text.strip():
-                        out.append("  " * indent_level + "• " + item_text + "\n")
-                    
-                    for nested in item.get("content", []):
-                        if nested.get("type") in ["bulletList", "orderedList"]:
-                            walk(nested, indent_level + 1)
-        
-        elif node_type == "orderedList":
+
+        elif node_type in ("bulletList", "orderedList"):
+            pending = []
             for idx, item in enumerate(content, 1):
                 if item.get("type") == "listItem":
-                    item_text = ""
-                    for item_content in item.get("content", []):
-                        if item_content.get("type") == "paragraph":
-                            for text_node in item_content.get("content", []):
-                                if text_node.get("type") == "text":
-                                    item_text += text_node.get("text", "")
+                    item_text = _adf_list_item_text(item)
                     if item_text.strip():
-                        out.append("  " * indent_level + f"{idx}. " + item_text + "\n")
-                    
+                        marker = "• " if node_type == "bulletList" else f"{idx}. "
+                        pending.append(("  " * indent_level + marker + item_text + "\n", None))
+
                     for nested in item.get("content", []):
                         if nested.get("type") in ["bulletList", "orderedList"]:
-                            walk(nested, indent_level + 1)
-        
+                            pending.append((nested, indent_level + 1))
+            stack.extend(reversed(pending))
+
         elif node_type == "codeBlock":
             code_text = "".join([c.get("text", "") for c in content if c.get("type") == "text"])
             out.append("\n" + code_text + "\n")
-        
+
         elif node_type == "text":
             out.append(node.get("text", ""))
-        
+
         else:
-            for child in content:
-                walk(child, indent_level)
-    
-    if adf:
-        walk(adf)
-    
+            stack.extend((child, indent_level) for child in reversed(content))
+
     result = "".join(out)
-    result = re.sub(r"\n{4,}", "\n\n", result)
+    result = _EXCESS_NEWLINES_PATTERN.sub("\n\n", result)
     return result.strip()
 
 
 def extract_text_from_pdf(pdf_bytes: bytes) -> str:
-    """Extract text from PDF bytes."""
+    """Extract text from PDF bytes.
+
+    Uses PDFium through pypdfium2 when it is installed, falling back to PyPDF2.
+    """
     try:
+        if PYPDFIUM2_AVAILABLE:
+            pdf = pdfium.PdfDocument(pdf_bytes)
+            try:
+                text_parts = []
+                for page in pdf:
+                    text_parts.append(page.get_textpage().get_text_range().replace("\r\n", "\n"))
+                return "\n\n".join(text_parts)
+            finally:
+                pdf.close()
+
         import PyPDF2
         import io
         pdf_file = io.BytesIO(pdf_bytes)
@@ -269,13 +306,98 @@ def extract_text_from_pdf(pdf_bytes: bytes) -> str:
         return ""
 
 
+_W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+_CT_NS = "{http://schemas.openxmlformats.org/package/2006/content-types}"
+_OFFICE_DOCUMENT_REL = (
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"
+)
+
+# Run children with a fixed text equivalent, mirroring python-docx's ``Run.text``
+_W_RUN_TEXT = {
+    _W_NS + "tab": "\t",
+    _W_NS + "ptab": "\t",
+    _W_NS + "cr": "\n",
+    _W_NS + "noBreakHyphen": "-",
+}
+
+
+def _docx_part_path(base: str, target: str) -> str:
+    """Resolve a relationship target against the directory of its source part."""
+    import posixpath
+    if target.startswith("/"):
+        return target.lstrip("/")
+    return posixpath.normpath(posixpath.join(base, target))
+
+
+def _docx_main_part(archive) -> str:
+    """Return the zip path of the main document part (usually word/document.xml)."""
+    import xml.etree.ElementTree as ET
+    try:
+        rels = ET.fromstring(archive.read("_rels/.rels"))
+    except KeyError:
+        return "word/document.xml"
+    for rel in rels.iter(_REL_NS + "Relationship"):
+        if rel.get("Type") == _OFFICE_DOCUMENT_REL:
+            return _docx_part_path("", rel.get("Target", ""))
+    return "word/document.xml"
+
+
+def _docx_run_text(run) -> str:
+    parts = []
+    for child in run:
+        if child.tag == _W_NS + "t":
+            parts.append(child.text or "")
+        elif child.tag in _W_RUN_TEXT:
+            parts.append(_W_RUN_TEXT[child.tag])
+        elif child.tag == _W_NS + "br":
+            if child.get(_W_NS + "type", "textWrapping") == "textWrapping":
+                parts.append("\n")
+    return "".join(parts)
+
+
+def _docx_paragraph_text(paragraph) -> str:
+    parts = []
+    for child in paragraph:
+        if child.tag == _W_NS + "r":
+            parts.append(_docx_run_text(child))
+        elif child.tag == _W_NS + "hyperlink":
+            parts.extend(_docx_run_text(r) for r in child if r.tag == _W_NS + "r")
+    return "".join(parts)
+
+
 def extract_text_from_word(docx_bytes: bytes) -> str:
-    """Extract text from Word document bytes."""
+    """Extract text from Word document bytes.
+
+    Streams the main document part with ``iterparse`` and drops each body-level
+    element once read, so memory stays bounded by the largest paragraph or
+    table rather than the whole document.
+    """
     try:
-        import docx
         import io
-        doc = docx.Document(io.BytesIO(docx_bytes))
-        paragraphs = [p.text for p in doc.paragraphs if p.text.strip()]
+        import zipfile
+        import xml.etree.ElementTree as ET
+
+        paragraphs = []
+        with zipfile.ZipFile(io.BytesIO(docx_bytes)) as archive:
+            with archive.open(_docx_main_part(archive)) as part:
+                body = None
+                depth = 0
+                for event, elem in ET.iterparse(part, events=("start", "end")):
+                    if event == "start":
+                        depth += 1
+                        if depth == 2 and elem.tag == _W_NS + "body":
+                            body = elem
+                        continue
+                    depth -= 1
+                    if body is None or depth != 2:
+                        continue
+                    # Direct child of <w:body>; only its paragraphs are body text
+                    if elem.tag == _W_NS + "p":
+                        text = _docx_paragraph_text(elem)
+                        if text.strip():
+                            paragraphs.append(text)
+                    body.remove(elem)
         return "\n\n".join(paragraphs)
     except Exception as e:
         print(f"Error extracting Word text: {e}")
@@ -293,22 +415,43 @@ def extract_images_from_word(docx_bytes: bytes) -> list:
         List of dicts with 'data' (base64) and 'mime_type' keys
     """
     try:
-        import docx
         import io
-        from docx.oxml import parse_xml
+        import posixpath
+        import zipfile
+        import xml.etree.ElementTree as ET
 
-        doc = docx.Document(io.BytesIO(docx_bytes))
         images = []
-
-        # Get all image relationships
-        for rel in doc.part.rels.values():
-            if "image" in rel.target_ref:
+        with zipfile.ZipFile(io.BytesIO(docx_bytes)) as archive:
+            main_part = _docx_main_part(archive)
+            part_dir, part_name = posixpath.split(main_part)
+            rels = ET.fromstring(archive.read(posixpath.join(part_dir, "_rels", part_name + ".rels")))
+
+            # Content types: per-part overrides win over per-extension defaults
+            content_types = ET.fromstring(archive.read("[Content_Types].xml"))
+            defaults = {
+                d.get("Extension", "").lower(): d.get("ContentType")
+                for d in content_types.iter(_CT_NS + "Default")
+            }
+            overrides = {
+                o.get("PartName", "").lstrip("/"): o.get("ContentType")
+                for o in content_types.iter(_CT_NS + "Override")
+            }
+
+            # Get all image relationships
+            for rel in rels.iter(_REL_NS + "Relationship"):
+                target = rel.get("Target", "")
+                if "image" not in target:
+                    continue
                 try:
-                    image_part = rel.target_part
-                    image_bytes = image_part.blob
+                    if rel.get("TargetMode") == "External":
+                        raise ValueError(f"image is linked, not embedded: {target}")
+                    image_path = _docx_part_path(part_dir, target)
+                    image_bytes = archive.read(image_path)
 
                     # Determine mime type from content type
-                    mime_type = image_part.content_type
+                    mime_type = overrides.get(image_path) or defaults[
+                        posixpath.splitext(image_path)[1][1:].lower()
+                    ]
 
                     # Encode to base64
                     image_base64 = encode_image_to_base64(image_bytes, mime_type)
@@ -333,4 +476,8 @@ def extract_images_from_word(docx_bytes: bytes) -> list:
 
 def encode_image_to_base64(image_bytes: bytes, mime_type: str) -> str:
     """Encode image bytes to base64 for AI vision."""
-    return base64.b64encode(image_bytes).decode('utf-8')
+    if not image_bytes:
+        return ""
+    if PYBASE64_AVAILABLE:
+        return pybase64.b64encode_as_string(image_bytes)
+    return b2a_base64(image_bytes, newline=False).decode('ascii')
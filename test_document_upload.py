@@ -59,9 +59,11 @@ def test_dependencies():
 
     dependencies = [
         ('PyPDF2', 'PDF processing'),
-        ('docx', 'Word document processing'),
         ('base64', 'Image encoding (built-in)'),
     ]
+    optional_dependencies = [
+        ('pypdfium2', 'faster PDF processing, falls back to PyPDF2'),
+    ]
 
     all_good = True
     for module_name, description in dependencies:
@@ -72,6 +74,13 @@ def test_dependencies():
             print(f"[FAIL] {module_name} NOT installed ({description})")
             all_good = False
 
+    for module_name, description in optional_dependencies:
+        try:
+            __import__(module_name)
+            print(f"[OK] {module_name} installed ({description})")
+        except ImportError:
+            print(f"[INFO] {module_name} not installed, optional ({description})")
+
     return all_good
 
 def test_backend_integration():
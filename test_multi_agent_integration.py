@@ -16,6 +16,9 @@ from generate_test_tickets import analyze_epic_with_multi_agent
 # Load environment
 load_dotenv()
 
+# Section rule used by all report headers
+_RULE = "=" * 80
+
 
 def create_test_epic_context():
     """Create a sample Epic context for testing."""
@@ -59,9 +62,9 @@ def create_test_epic_context():
 
 def test_multi_agent_workflow():
     """Test the multi-agent workflow integration."""
-    print("=" * 80)
+    print(_RULE)
     print("TESTING MULTI-AGENT INTEGRATION")
-    print("=" * 80)
+    print(_RULE)
 
     # Initialize LLM client
     llm = LLMClient(enabled=True, model=os.getenv("OPENAI_MODEL", "gpt-4o"))
@@ -89,9 +92,9 @@ def test_multi_agent_workflow():
         print(f"\nError: {error}")
         return False
 
-    print("\n" + "=" * 80)
+    print("\n" + _RULE)
     print("WORKFLOW RESULT")
-    print("=" * 80)
+    print(_RULE)
 
     print(f"\nTotal Test Tickets: {split_data.get('total_test_tickets', 0)}")
     print(f"Coverage Notes: {split_data.get('coverage_notes', 'N/A')}")
@@ -109,9 +112,9 @@ def test_multi_agent_workflow():
         print(f"     Child Tickets: {', '.join(split.get('child_tickets', []))}")
         print(f"     Est. Test Cases: {split.get('estimated_test_cases', 0)}")
 
-    print("\n" + "=" * 80)
+    print("\n" + _RULE)
     print("INTEGRATION TEST PASSED!")
-    print("=" * 80)
+    print(_RULE)
 
     return True
 
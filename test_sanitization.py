@@ -11,9 +11,12 @@ Usage:
     python test_sanitization.py
 """
 
+import contextlib
 import os
 import sys
-from typing import Dict, Any, List
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Tuple
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
@@ -24,16 +27,20 @@ from ai_tester.utils.data_sanitizer import (
     sanitize_document_content,
     sanitize_attachment,
     remove_code_blocks,
-    get_sanitization_summary,
+    get_sanitization_counts,
     FieldWhitelistConfig
 )
+from script_output import PerThreadStdout
+
+# Section rule used by all report headers
+_RULE = "=" * 80
 
 
 def print_section(title: str):
     """Print a section header"""
-    print("\n" + "="*80)
+    print("\n" + _RULE)
     print(f"  {title}")
-    print("="*80 + "\n")
+    print(_RULE + "\n")
 
 
 def print_test_result(test_name: str, passed: bool, details: str = ""):
@@ -45,117 +52,92 @@ def print_test_result(test_name: str, passed: bool, details: str = ""):
     print()
 
 
+def report_checks(checks: List[Tuple[str, bool, str]]) -> Tuple[int, int]:
+    """Print each (name, passed, failure_details) check and return (passed, total)"""
+    for name, passed, details in checks:
+        print_test_result(name, passed, "" if passed else details)
+    return sum(passed for _, passed, _ in checks), len(checks)
+
+
+# Mock Jira ticket with both safe and sensitive fields
+# Jira format: {'key': 'TEST-123', 'fields': {...}}
+# Shared by reference: sanitize_jira_ticket must not mutate its input
+_MOCK_TICKET = {
+    "key": "TEST-123",
+    "id": "12345",
+    "fields": {
+        # Safe fields (should be preserved)
+        "summary": "Implement user authentication",
+        "description": "Create a login system with OAuth2",
+        "issuetype": {"name": "Story"},
+        "status": {"name": "In Progress"},
+        "priority": {"name": "High"},
+        "labels": ["security", "authentication"],
+        "customfield_10011": "User Management Epic",  # Epic Name
+        "customfield_10524": "Users can log in successfully",  # Acceptance Criteria
+
+        # Sensitive fields (should be blocked)
+        "reporter": {"emailAddress": "john.doe@company.com", "displayName": "John Doe"},
+        "assignee": {"emailAddress": "jane.smith@company.com", "displayName": "Jane Smith"},
+        "creator": {"emailAddress": "admin@company.com"},
+        "comment": {
+            "comments": [
+                {"body": "DEBUG: API key is sk-abc123def456"},
+                {"body": "Server logs show error at 10.0.45.23"}
+            ]
+        },
+        "created": "2025-01-15T10:30:00.000+0000",
+        "updated": "2025-01-19T14:20:00.000+0000",
+        "worklog": {"worklogs": [{"timeSpent": "2h"}]},
+        "watches": {"watchCount": 5},
+        "votes": {"votes": 3}
+    }
+}
+
+
 def test_field_whitelisting():
     """Test that sensitive fields are blocked from tickets"""
     print_section("TEST 1: Field Whitelisting")
 
-    # Create a mock Jira ticket with both safe and sensitive fields
-    # Jira format: {'key': 'TEST-123', 'fields': {...}}
-    mock_ticket = {
-        "key": "TEST-123",
-        "id": "12345",
-        "fields": {
-            # Safe fields (should be preserved)
-            "summary": "Implement user authentication",
-            "description": "Create a login system with OAuth2",
-            "issuetype": {"name": "Story"},
-            "status": {"name": "In Progress"},
-            "priority": {"name": "High"},
-            "labels": ["security", "authentication"],
-            "customfield_10011": "User Management Epic",  # Epic Name
-            "customfield_10524": "Users can log in successfully",  # Acceptance Criteria
-
-            # Sensitive fields (should be blocked)
-            "reporter": {"emailAddress": "john.doe@company.com", "displayName": "John Doe"},
-            "assignee": {"emailAddress": "jane.smith@company.com", "displayName": "Jane Smith"},
-            "creator": {"emailAddress": "admin@company.com"},
-            "comment": {
-                "comments": [
-                    {"body": "DEBUG: API key is sk-abc123def456"},
-                    {"body": "Server logs show error at 10.0.45.23"}
-                ]
-            },
-            "created": "2025-01-15T10:30:00.000+0000",
-            "updated": "2025-01-19T14:20:00.000+0000",
-            "worklog": {"worklogs": [{"timeSpent": "2h"}]},
-            "watches": {"watchCount": 5},
-            "votes": {"votes": 3}
-        }
-    }
+    mock_ticket = _MOCK_TICKET
 
     # Sanitize the ticket
     sanitized = sanitize_jira_ticket(mock_ticket)
 
-    # Get sanitization summary
-    summary = get_sanitization_summary(mock_ticket, sanitized)
-
-    # Verify safe fields are preserved
-    tests_passed = 0
-    tests_total = 0
-
-    tests_total += 1
-    if sanitized.get("key") == "TEST-123":
-        print_test_result("Safe field preserved: key", True)
-        tests_passed += 1
-    else:
-        print_test_result("Safe field preserved: key", False, f"Got: {sanitized.get('key')}")
-
-    tests_total += 1
-    if sanitized.get("fields", {}).get("summary") == "Implement user authentication":
-        print_test_result("Safe field preserved: summary", True)
-        tests_passed += 1
-    else:
-        print_test_result("Safe field preserved: summary", False, f"Got: {sanitized.get('fields', {}).get('summary')}")
-
-    tests_total += 1
-    if sanitized.get("fields", {}).get("description") == "Create a login system with OAuth2":
-        print_test_result("Safe field preserved: description", True)
-        tests_passed += 1
-    else:
-        print_test_result("Safe field preserved: description", False)
-
-    # Verify sensitive fields are blocked
-    tests_total += 1
-    if "reporter" not in sanitized.get("fields", {}):
-        print_test_result("Sensitive field blocked: reporter", True)
-        tests_passed += 1
-    else:
-        print_test_result("Sensitive field blocked: reporter", False, f"Field still present")
-
-    tests_total += 1
-    if "assignee" not in sanitized.get("fields", {}):
-        print_test_result("Sensitive field blocked: assignee", True)
-        tests_passed += 1
-    else:
-        print_test_result("Sensitive field blocked: assignee", False)
-
-    tests_total += 1
-    if "comment" not in sanitized.get("fields", {}):
-        print_test_result("Sensitive field blocked: comment", True)
-        tests_passed += 1
-    else:
-        print_test_result("Sensitive field blocked: comment", False)
-
-    tests_total += 1
-    if "created" not in sanitized.get("fields", {}):
-        print_test_result("Sensitive field blocked: created (audit data)", True)
-        tests_passed += 1
-    else:
-        print_test_result("Sensitive field blocked: created", False)
-
-    tests_total += 1
-    if "worklog" not in sanitized.get("fields", {}):
-        print_test_result("Sensitive field blocked: worklog", True)
-        tests_passed += 1
-    else:
-        print_test_result("Sensitive field blocked: worklog", False)
+    # Get sanitization counts (only counts and a sample of names are displayed)
+    summary = get_sanitization_counts(mock_ticket, sanitized)
+
+    key = sanitized.get("key")
+    fields = sanitized.get("fields", {})
+
+    # (name, passed, details shown on failure)
+    checks = [
+        # Verify safe fields are preserved
+        ("Safe field preserved: key", key == "TEST-123", f"Got: {key}"),
+        ("Safe field preserved: summary",
+         fields.get("summary") == "Implement user authentication",
+         f"Got: {fields.get('summary')}"),
+        ("Safe field preserved: description",
+         fields.get("description") == "Create a login system with OAuth2", ""),
+
+        # Verify sensitive fields are blocked
+        ("Sensitive field blocked: reporter", "reporter" not in fields, "Field still present"),
+        ("Sensitive field blocked: assignee", "assignee" not in fields, ""),
+        ("Sensitive field blocked: comment", "comment" not in fields, ""),
+        ("Sensitive field blocked: created (audit data)", "created" not in fields, ""),
+        ("Sensitive field blocked: worklog", "worklog" not in fields, ""),
+    ]
+    tests_passed, tests_total = report_checks(checks)
+
+    # Sanitization must leave the shared fixture untouched
+    assert "reporter" in _MOCK_TICKET["fields"], "sanitize_jira_ticket mutated its input"
 
     # Check summary
     print(f"\nSanitization Summary:")
-    print(f"   Total fields: {summary['total_fields']}")
-    print(f"   Safe fields: {summary['safe_fields']}")
-    print(f"   Removed fields: {summary['removed_fields']}")
-    print(f"   Removed field names: {', '.join(summary['removed_field_names'][:5])}")
+    print(f"   Total fields: {summary.total_fields}")
+    print(f"   Safe fields: {summary.safe_fields}")
+    print(f"   Removed fields: {summary.removed_fields}")
+    print(f"   Removed field names: {', '.join(summary.removed_field_names)}")
 
     print(f"\nTest Results: {tests_passed}/{tests_total} passed")
     return tests_passed, tests_total
@@ -181,7 +163,7 @@ export DB_PASSWORD=admin123
 Then run the service.
 """
     sanitized = remove_code_blocks(text_with_markdown)
-    if "sk-secret123" not in sanitized and "[CODE_BLOCK_REMOVED]" in sanitized:
+    if sanitized.find("sk-secret123") < 0 <= sanitized.find("[CODE_BLOCK_REMOVED]"):
         print_test_result("Markdown code block removed", True)
         tests_passed += 1
     else:
@@ -200,7 +182,7 @@ INSERT INTO api_keys VALUES ('sk-abc123');
 Apply this config.
 """
     sanitized = remove_code_blocks(text_with_jira)
-    if "password123" not in sanitized and "[CODE_BLOCK_REMOVED]" in sanitized:
+    if sanitized.find("password123") < 0 <= sanitized.find("[CODE_BLOCK_REMOVED]"):
         print_test_result("Jira code block removed", True)
         tests_passed += 1
     else:
@@ -214,7 +196,7 @@ SELECT user_id, email FROM employees WHERE department='Engineering';
 This will give you the data.
 """
     sanitized = remove_code_blocks(text_with_sql)
-    if "SELECT" not in sanitized and "[SQL_QUERY_REMOVED]" in sanitized:
+    if sanitized.find("SELECT") < 0 <= sanitized.find("[SQL_QUERY_REMOVED]"):
         print_test_result("SQL query removed", True)
         tests_passed += 1
     else:
@@ -458,33 +440,47 @@ def test_custom_acceptance_criteria_field():
 
 def run_all_tests():
     """Run all sanitization tests"""
-    print("\n" + "="*80)
+    print("\n" + _RULE)
     print(" "*20 + "PHASE 1 SANITIZATION TEST SUITE")
-    print("="*80)
+    print(_RULE)
 
     total_passed = 0
     total_tests = 0
 
-    # Run all test suites
-    passed, total = test_field_whitelisting()
-    total_passed += passed
-    total_tests += total
-
-    passed, total = test_code_block_removal()
-    total_passed += passed
-    total_tests += total
-
-    passed, total = test_attachment_sanitization()
-    total_passed += passed
-    total_tests += total
-
-    passed, total = test_description_sanitization()
-    total_passed += passed
-    total_tests += total
-
-    passed, total = test_custom_acceptance_criteria_field()
-    total_passed += passed
-    total_tests += total
+    # The suites are independent, so run them in parallel and replay each
+    # suite's captured output in submission order to keep the console readable
+    suites = (
+        test_field_whitelisting,
+        test_code_block_removal,
+        test_attachment_sanitization,
+        test_description_sanitization,
+        test_custom_acceptance_criteria_field,
+    )
+    router = PerThreadStdout(sys.stdout)
+
+    def run_captured(suite):
+        # A crashing suite counts as one failed test; its output up to the
+        # crash (and the traceback) is still replayed
+        router.capture()
+        result = (0, 1)
+        try:
+            result = suite()
+        except Exception as e:
+            print(f"\n[ERROR] {suite.__name__} crashed: {e}")
+            traceback.print_exc(file=sys.stdout)
+        finally:
+            output = router.release()
+        return result, output
+
+    with contextlib.redirect_stdout(router):
+        with ThreadPoolExecutor(max_workers=len(suites)) as executor:
+            futures = [executor.submit(run_captured, suite) for suite in suites]
+
+    for future in futures:
+        (passed, total), output = future.result()
+        sys.stdout.write(output)
+        total_passed += passed
+        total_tests += total
 
     # Final summary
     print_section("FINAL RESULTS")
@@ -517,6 +513,5 @@ if __name__ == "__main__":
         sys.exit(exit_code)
     except Exception as e:
         print(f"\n[ERROR] TEST SUITE CRASHED: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
@@ -11,12 +11,15 @@ sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 from src.ai_tester.utils.jira_text_cleaner import sanitize_prompt_input
 from src.ai_tester.agents.ticket_analyzer import TicketAnalyzerAgent
 
+# Section rule used by all report headers
+_RULE = "=" * 80
+
 
 def test_prompt_injection_sanitization():
     """Test C6: Prompt injection sanitization"""
-    print("\n" + "="*80)
+    print("\n" + _RULE)
     print("Testing C6: Prompt Injection Sanitization")
-    print("="*80)
+    print(_RULE)
 
     # Test cases with malicious input
     test_cases = [
@@ -58,9 +61,9 @@ def test_prompt_injection_sanitization():
 
 def test_silent_failure_fix():
     """Test C7: Silent failures now raise exceptions"""
-    print("\n" + "="*80)
+    print("\n" + _RULE)
     print("Testing C7: Silent Failures Fix")
-    print("="*80)
+    print(_RULE)
 
     # This test verifies the code structure, not runtime behavior
     # We check that the analyze_ticket method no longer returns fake data
@@ -87,9 +90,9 @@ def test_silent_failure_fix():
 
 def main():
     """Run all security fix tests"""
-    print("\n" + "="*80)
+    print("\n" + _RULE)
     print("SECURITY FIXES VERIFICATION")
-    print("="*80)
+    print(_RULE)
 
     results = []
 
@@ -110,9 +113,9 @@ def main():
         results.append(("C7 - Silent Failures", False))
 
     # Summary
-    print("\n" + "="*80)
+    print("\n" + _RULE)
     print("FINAL RESULTS")
-    print("="*80)
+    print(_RULE)
 
     for test_name, passed in results:
         status = "✅ PASSED" if passed else "❌ FAILED"
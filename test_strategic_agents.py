@@ -5,6 +5,7 @@ Tests the first part of Phase 1 multi-agent implementation
 
 import os
 import json
+from functools import lru_cache
 from dotenv import load_dotenv
 from ai_tester import JiraClient, LLMClient
 from ai_tester.agents import StrategicPlannerAgent, EvaluationAgent
@@ -12,11 +13,17 @@ from ai_tester.agents import StrategicPlannerAgent, EvaluationAgent
 # Load environment
 load_dotenv()
 
+# Section rule used by all report headers
+_RULE = "=" * 80
 
+
+@lru_cache(maxsize=None)
 def create_test_epic_context():
     """
     Create a sample Epic context for testing.
     In real usage, this would come from Jira.
+
+    The context is built once and shared; the agents only read from it.
     """
     return {
         'epic_key': 'UEX-17',
@@ -58,9 +65,9 @@ def create_test_epic_context():
 
 def test_strategic_planner():
     """Test the Strategic Planner Agent"""
-    print("=" * 80)
+    print(_RULE)
     print("TESTING STRATEGIC PLANNER AGENT")
-    print("=" * 80)
+    print(_RULE)
 
     # Initialize LLM client
     llm = LLMClient(
@@ -89,36 +96,36 @@ def test_strategic_planner():
 
     # Display options
     for i, option in enumerate(options, 1):
-        print(f"\n{'=' * 80}")
+        print(f"\n{_RULE}")
         print(f"OPTION {i}: {option['name']}")
-        print(f"{'=' * 80}")
+        print(f"{_RULE}")
         print(f"\nRationale:")
         print(f"   {option['rationale']}")
 
-        print(f"\nAdvantages:")
-        for adv in option['advantages']:
-            print(f"   - {adv}")
+        advantages = "\n".join(f"   - {adv}" for adv in option['advantages'])
+        print(f"\nAdvantages:\n{advantages}")
 
-        print(f"\nDisadvantages:")
-        for dis in option['disadvantages']:
-            print(f"   - {dis}")
+        disadvantages = "\n".join(f"   - {dis}" for dis in option['disadvantages'])
+        print(f"\nDisadvantages:\n{disadvantages}")
 
-        print(f"\nProposed Test Tickets ({len(option['tickets'])}):")
-        for j, ticket in enumerate(option['tickets'], 1):
-            print(f"\n   Ticket {j}: {ticket['title']}")
-            print(f"   Priority: {ticket['priority']}")
-            print(f"   Scope: {ticket['scope']}")
-            print(f"   Est. Test Cases: {ticket['estimated_test_cases']}")
-            print(f"   Focus: {', '.join(ticket['focus_areas'])}")
+        tickets = "\n".join(
+            f"\n   Ticket {j}: {ticket['title']}\n"
+            f"   Priority: {ticket['priority']}\n"
+            f"   Scope: {ticket['scope']}\n"
+            f"   Est. Test Cases: {ticket['estimated_test_cases']}\n"
+            f"   Focus: {', '.join(ticket['focus_areas'])}"
+            for j, ticket in enumerate(option['tickets'], 1)
+        )
+        print(f"\nProposed Test Tickets ({len(option['tickets'])}):\n{tickets}")
 
     return options
 
 
 def test_evaluator(options):
     """Test the Evaluation Agent"""
-    print("\n" + "=" * 80)
+    print("\n" + _RULE)
     print("TESTING EVALUATION AGENT")
-    print("=" * 80)
+    print(_RULE)
 
     if not options:
         print("\nSkipping evaluation - no options to evaluate")
@@ -138,9 +145,9 @@ def test_evaluator(options):
 
     # Evaluate each option
     for i, option in enumerate(options, 1):
-        print(f"\n{'=' * 80}")
+        print(f"\n{_RULE}")
         print(f"EVALUATING OPTION {i}: {option['name']}")
-        print(f"{'=' * 80}")
+        print(f"{_RULE}")
 
         print("\nEvaluating...")
         evaluation, error = evaluator.evaluate_split(option, epic_context)
@@ -162,13 +169,12 @@ def test_evaluator(options):
         print(f"   {evaluation['recommendation']}")
 
         if evaluation.get('concerns'):
-            print(f"\nConcerns:")
-            for concern in evaluation['concerns']:
-                print(f"   - {concern}")
+            concerns = "\n".join(f"   - {concern}" for concern in evaluation['concerns'])
+            print(f"\nConcerns:\n{concerns}")
 
-    print("\n" + "=" * 80)
+    print("\n" + _RULE)
     print("TESTING COMPLETE")
-    print("=" * 80)
+    print(_RULE)
 
 
 if __name__ == "__main__":
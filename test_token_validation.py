@@ -2,11 +2,12 @@
 Test script to verify C8 token validation is working correctly.
 Tests token estimation, validation, and truncation functionality.
 """
+import contextlib
 import sys
-import io
+from concurrent.futures import ThreadPoolExecutor
 
 # Fix Windows console encoding issues
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+sys.stdout.reconfigure(encoding='utf-8')
 
 from src.ai_tester.utils.token_manager import (
     estimate_tokens,
@@ -15,13 +16,20 @@ from src.ai_tester.utils.token_manager import (
     truncate_to_token_limit,
     get_max_tokens_for_model
 )
+from script_output import PerThreadStdout
+
+# Section rule used by all report headers
+_RULE = "=" * 80
+
+# ~125k-token text shared by the over-limit checks
+_LONG_TEXT = "A" * 500_000
 
 
 def test_token_estimation():
     """Test C8: Token estimation accuracy"""
-    print("\n" + "="*80)
+    print("\n" + _RULE)
     print("Testing C8: Token Estimation")
-    print("="*80)
+    print(_RULE)
 
     test_cases = [
         ("Hello world", 2, 5),  # Simple text: 2-5 tokens
@@ -47,9 +55,9 @@ def test_token_estimation():
 
 def test_token_limit_validation():
     """Test C8: Token limit validation"""
-    print("\n" + "="*80)
+    print("\n" + _RULE)
     print("Testing C8: Token Limit Validation")
-    print("="*80)
+    print(_RULE)
 
     model = "gpt-4o"
     max_tokens = get_max_tokens_for_model(model)
@@ -65,9 +73,8 @@ def test_token_limit_validation():
         return False
 
     # Test case 2: Text that exceeds limit
-    # Create text with ~130k tokens (exceeds 128k limit)
-    long_text = "A" * 500000  # ~125k tokens
-    fits, current, max_allowed = check_token_limit(long_text, model=model, response_reserve=4000)
+    # Text with ~125k tokens (exceeds the 124k allowed after the response reserve)
+    fits, current, max_allowed = check_token_limit(_LONG_TEXT, model=model, response_reserve=4000)
     if not fits:
         print(f"✅ PASS: Long text ({current} tokens) correctly identified as exceeding limit ({max_allowed} tokens)")
     else:
@@ -80,9 +87,9 @@ def test_token_limit_validation():
 
 def test_prompt_size_validation():
     """Test C8: Prompt size validation for system + user prompts"""
-    print("\n" + "="*80)
+    print("\n" + _RULE)
     print("Testing C8: Prompt Size Validation")
-    print("="*80)
+    print(_RULE)
 
     model = "gpt-4o"
 
@@ -103,9 +110,7 @@ def test_prompt_size_validation():
         return False
 
     # Test case 2: Very large user prompt
-    large_user_prompt = "A" * 500000  # ~125k tokens
-
-    validation = validate_prompt_size(system_prompt, large_user_prompt, model=model)
+    validation = validate_prompt_size(system_prompt, _LONG_TEXT, model=model)
 
     if not validation["valid"]:
         print(f"✅ PASS: Large prompt correctly identified as exceeding limit")
@@ -122,9 +127,9 @@ def test_prompt_size_validation():
 
 def test_truncation():
     """Test C8: Smart text truncation"""
-    print("\n" + "="*80)
+    print("\n" + _RULE)
     print("Testing C8: Smart Text Truncation")
-    print("="*80)
+    print(_RULE)
 
     # Create text with sentences
     text = """This is the first sentence. This is the second sentence. This is the third sentence.
@@ -166,48 +171,45 @@ This is the fourth sentence. This is the fifth sentence. This is the sixth sente
 
 def main():
     """Run all C8 token validation tests"""
-    print("\n" + "="*80)
+    print("\n" + _RULE)
     print("C8 TOKEN VALIDATION TEST SUITE")
-    print("="*80)
+    print(_RULE)
+
+    # The suites are independent and tiktoken releases the GIL while encoding,
+    # so run them in parallel and replay each suite's output in order
+    suites = [
+        ("Token Estimation", test_token_estimation),
+        ("Token Limit Validation", test_token_limit_validation),
+        ("Prompt Size Validation", test_prompt_size_validation),
+        ("Smart Truncation", test_truncation),
+    ]
+    router = PerThreadStdout(sys.stdout)
+
+    def run_captured(name, suite):
+        router.capture()
+        try:
+            passed = suite()
+        except Exception as e:
+            print(f"❌ {name} test failed with exception: {e}")
+            passed = False
+        finally:
+            output = router.release()
+        return passed, output
+
+    with contextlib.redirect_stdout(router):
+        with ThreadPoolExecutor(max_workers=len(suites)) as executor:
+            futures = [executor.submit(run_captured, name, suite) for name, suite in suites]
 
     results = []
-
-    # Test 1: Token Estimation
-    try:
-        estimation_pass = test_token_estimation()
-        results.append(("Token Estimation", estimation_pass))
-    except Exception as e:
-        print(f"❌ Token Estimation test failed with exception: {e}")
-        results.append(("Token Estimation", False))
-
-    # Test 2: Token Limit Validation
-    try:
-        limit_pass = test_token_limit_validation()
-        results.append(("Token Limit Validation", limit_pass))
-    except Exception as e:
-        print(f"❌ Token Limit Validation test failed with exception: {e}")
-        results.append(("Token Limit Validation", False))
-
-    # Test 3: Prompt Size Validation
-    try:
-        prompt_pass = test_prompt_size_validation()
-        results.append(("Prompt Size Validation", prompt_pass))
-    except Exception as e:
-        print(f"❌ Prompt Size Validation test failed with exception: {e}")
-        results.append(("Prompt Size Validation", False))
-
-    # Test 4: Truncation
-    try:
-        truncation_pass = test_truncation()
-        results.append(("Smart Truncation", truncation_pass))
-    except Exception as e:
-        print(f"❌ Smart Truncation test failed with exception: {e}")
-        results.append(("Smart Truncation", False))
+    for (name, _), future in zip(suites, futures):
+        passed, output = future.result()
+        sys.stdout.write(output)
+        results.append((name, passed))
 
     # Summary
-    print("\n" + "="*80)
+    print("\n" + _RULE)
     print("FINAL RESULTS")
-    print("="*80)
+    print(_RULE)
 
     for test_name, passed in results:
         status = "✅ PASSED" if passed else "❌ FAILED"
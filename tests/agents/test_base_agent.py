@@ -11,7 +11,7 @@ Tests cover:
 
 import pytest
 import json
-from unittest.mock import Mock, MagicMock
+from unittest.mock import MagicMock
 from ai_tester.agents.base_agent import BaseAgent
 
 
@@ -19,10 +19,17 @@ from ai_tester.agents.base_agent import BaseAgent
 # TEST FIXTURES
 # ============================================================================
 
+class FakeLLM:
+    """Minimal LLM client stub - only complete_json is mocked for call assertions"""
+
+    def __init__(self):
+        self.complete_json = MagicMock()
+
+
 @pytest.fixture
 def mock_llm():
     """Create a mock LLM client"""
-    return Mock()
+    return FakeLLM()
 
 
 @pytest.fixture
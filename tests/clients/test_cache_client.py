@@ -13,13 +13,37 @@ Tests cover:
 
 import pytest
 import os
+import errno
 import json
 import zlib
 import tempfile
 import shutil
+import threading
+import time
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch, MagicMock
-from ai_tester.clients.cache_client import CacheClient
+from ai_tester.clients import cache_client
+from ai_tester.clients.cache_client import (
+    CacheClient,
+    ENTRY_HEADER,
+    ENTRY_HEADER_V1,
+    ENTRY_MAGIC_V1,
+    MMAP_THRESHOLD,
+    ZSTD_AVAILABLE,
+    ZSTD_DICT_FILE,
+    ZSTD_DICT_MIN_SAMPLES,
+)
+from ai_tester.clients.llm_client import LLMClient
+
+
+@pytest.fixture(autouse=True)
+def reset_redis_pools():
+    """Keep mocked Redis connection pools and writers from leaking between tests"""
+    cache_client._redis_pools.clear()
+    cache_client._redis_writers.clear()
+    yield
+    cache_client._redis_pools.clear()
+    cache_client._redis_writers.clear()
 
 
 # ============================================================================
@@ -61,7 +85,7 @@ class TestCacheClientInitialization:
                 mock_redis = Mock()
                 mock_client = Mock()
                 mock_client.ping.return_value = True
-                mock_redis.from_url.return_value = mock_client
+                mock_redis.Redis.return_value = mock_client
                 return mock_redis
             return __import__(name, *args, **kwargs)
 
@@ -71,25 +95,71 @@ class TestCacheClientInitialization:
             assert client.use_redis is True
             assert client.redis_client is not None
 
+    def test_redis_pool_shared_between_clients(self):
+        """Test that clients for the same URL share one connection pool"""
+        mock_redis = Mock()
+
+        def mock_import(name, *args, **kwargs):
+            if name == 'redis':
+                return mock_redis
+            return __import__(name, *args, **kwargs)
+
+        with patch('builtins.__import__', side_effect=mock_import):
+            CacheClient(redis_url="redis://localhost:6379/0")
+            CacheClient(redis_url="redis://localhost:6379/0")
+
+        mock_redis.BlockingConnectionPool.from_url.assert_called_once()
+        pool = mock_redis.BlockingConnectionPool.from_url.return_value
+        for call in mock_redis.Redis.call_args_list:
+            assert call.kwargs["connection_pool"] is pool
+
     def test_init_redis_connection_failure(self):
-        """Test Redis connection failure falls back to disk"""
+        """Test Redis connection failure on the first command falls back to disk"""
         def mock_import(name, *args, **kwargs):
             if name == 'redis':
                 mock_redis = Mock()
-                mock_redis.from_url.side_effect = Exception("Connection failed")
+                mock_redis.Redis.return_value.get.side_effect = Exception("Connection failed")
                 return mock_redis
             return __import__(name, *args, **kwargs)
 
         with patch('builtins.__import__', side_effect=mock_import):
             with tempfile.TemporaryDirectory() as tmpdir:
+                cache_dir = os.path.join(tmpdir, "llm")
                 client = CacheClient(
                     redis_url="redis://localhost:6379/0",
-                    cache_dir=tmpdir
+                    cache_dir=cache_dir
                 )
 
+                # No round trip at construction time
+                client.redis_client.ping.assert_not_called()
+
+                cached = client.get("test_key")
+
+                assert cached is None
                 assert client.use_redis is False
                 assert client.redis_client is None
-                assert os.path.exists(tmpdir)
+                assert client.stats["misses"] == 1
+                assert os.path.exists(cache_dir)
+
+    def test_redis_error_after_first_command_does_not_fall_back(self):
+        """Test that errors after Redis has answered once are not treated as an outage"""
+        def mock_import(name, *args, **kwargs):
+            if name == 'redis':
+                mock_redis = Mock()
+                mock_client = Mock()
+                mock_client.get.side_effect = [None, Exception("Timeout")]
+                mock_redis.Redis.return_value = mock_client
+                return mock_redis
+            return __import__(name, *args, **kwargs)
+
+        with patch('builtins.__import__', side_effect=mock_import):
+            client = CacheClient(redis_url="redis://localhost:6379/0")
+
+            assert client.get("key1") is None
+            assert client.get("key2") is None
+
+            assert client.use_redis is True
+            assert client.stats["errors"] == 1
 
     def test_init_stats_initialized(self):
         """Test that stats are initialized"""
@@ -164,6 +234,26 @@ class TestCacheKeyGeneration:
 
         assert key1 != key2
 
+    def test_cache_key_field_boundaries_unambiguous(self):
+        """Test that moving text between fields changes the key"""
+        client = CacheClient(enabled=False)
+
+        key1 = client._generate_cache_key(
+            sys_prompt="System|",
+            user_prompt="User",
+            max_tokens=100,
+            model="gpt-4"
+        )
+
+        key2 = client._generate_cache_key(
+            sys_prompt="System",
+            user_prompt="|User",
+            max_tokens=100,
+            model="gpt-4"
+        )
+
+        assert key1 != key2
+
     def test_cache_key_includes_version(self):
         """Test that cache key includes version"""
         client = CacheClient(enabled=False)
@@ -229,6 +319,15 @@ class TestCompression:
 
         assert decompressed == data
 
+    def test_decompress_reads_zlib_entries(self):
+        """Test that entries written with zlib stay readable"""
+        client = CacheClient(enabled=False)
+
+        data = {"response": "Legacy response", "error": None}
+        compressed = zlib.compress(json.dumps(data).encode('utf-8'), level=6)
+
+        assert client._decompress_data(compressed) == data
+
 
 # ============================================================================
 # DISK CACHE GET/SET TESTS
@@ -257,6 +356,155 @@ class TestDiskCacheOperations:
             assert cached[1] is None  # No error
             assert client.stats["hits"] == 1
 
+    def test_set_and_get_large_entry_disk(self):
+        """Test that entries above the mmap threshold round-trip from disk"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = CacheClient(cache_dir=tmpdir)
+
+            # Random hex barely compresses, so the stored entry stays large
+            response = os.urandom(MMAP_THRESHOLD).hex()
+            client.set("large_key", response)
+
+            cache_file = client._cache_file_path("large_key")
+            assert os.path.getsize(cache_file) >= MMAP_THRESHOLD
+
+            cached = client.get("large_key")
+            assert cached is not None
+            assert cached[0] == response
+
+    @pytest.mark.skipif(not ZSTD_AVAILABLE, reason="zstandard not installed")
+    def test_disk_cache_trains_zstd_dictionary(self):
+        """Test that a dictionary is trained in the background and older entries still read"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = CacheClient(cache_dir=tmpdir)
+            for i in range(ZSTD_DICT_MIN_SAMPLES):
+                client.set(f"key{i}", json.dumps({"title": f"Test case {i}", "steps": ["Open page"] * (i % 5)}))
+            client.close()
+
+            assert os.path.exists(os.path.join(tmpdir, ZSTD_DICT_FILE))
+            assert not [name for name in os.listdir(tmpdir) if name.endswith('.tmp')]
+            assert client._zstd_dict is not None
+
+            # Entries written before the dictionary existed still decode
+            client._memory.clear()
+            assert client.get("key0") is not None
+
+            client.set("new_key", "New response")
+            header = open(client._cache_file_path("new_key"), 'rb').read(ENTRY_HEADER.size)
+            assert ENTRY_HEADER.unpack(header)[2] == client._zstd_dict.dict_id()
+
+            # A fresh client loads the dictionary instead of training one
+            other = CacheClient(cache_dir=tmpdir)
+            assert other._zstd_dict.dict_id() == client._zstd_dict.dict_id()
+            assert other.get("new_key")[0] == "New response"
+
+    @pytest.mark.skipif(not ZSTD_AVAILABLE, reason="zstandard not installed")
+    def test_init_does_not_train_zstd_dictionary(self):
+        """Test that opening a cache with many entries doesn't read them to train"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = CacheClient(cache_dir=tmpdir)
+            for i in range(ZSTD_DICT_MIN_SAMPLES - 1):
+                client.set(f"key{i}", f"Response {i}")
+
+            with patch.object(CacheClient, 'train_dictionary') as mock_train:
+                CacheClient(cache_dir=tmpdir)
+
+            mock_train.assert_not_called()
+            assert client._dict_trainer is None
+            assert not os.path.exists(os.path.join(tmpdir, ZSTD_DICT_FILE))
+
+    @pytest.mark.skipif(not ZSTD_AVAILABLE, reason="zstandard not installed")
+    def test_entry_from_other_process_dictionary(self):
+        """Test that an entry compressed with a dictionary trained elsewhere is found by its id"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            reader = CacheClient(cache_dir=tmpdir)
+            writer = CacheClient(cache_dir=tmpdir)
+            for i in range(ZSTD_DICT_MIN_SAMPLES):
+                writer.set(f"key{i}", json.dumps({"title": f"Test case {i}"}))
+            writer.close()
+            writer.set("new_key", "New response")
+
+            assert reader._zstd_dict is None
+            assert reader.get("new_key")[0] == "New response"
+            assert reader._zstd_dict.dict_id() == writer._zstd_dict.dict_id()
+
+    def test_version_1_entry_still_read(self):
+        """Test that entries with the header written before it carried a dictionary id still read"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = CacheClient(cache_dir=tmpdir)
+            client.set("key", "Response")
+            cache_file = client._cache_file_path("key")
+            with open(cache_file, 'rb') as f:
+                entry = f.read()
+            written_ns = ENTRY_HEADER.unpack_from(entry)[1]
+            with open(cache_file, 'wb') as f:
+                f.write(ENTRY_HEADER_V1.pack(ENTRY_MAGIC_V1, written_ns) + entry[ENTRY_HEADER.size:])
+            client._memory.clear()
+
+            assert client.get("key") == ("Response", None)
+
+    def test_repeat_get_served_from_memory(self):
+        """Test that repeat gets are answered from memory without touching disk"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = CacheClient(cache_dir=tmpdir)
+            client.set("test_key", "Test response")
+
+            with patch.object(client, '_get_disk') as mock_get_disk:
+                cached = client.get("test_key")
+
+            mock_get_disk.assert_not_called()
+            assert cached == ("Test response", None)
+            assert client.stats["hits"] == 1
+
+    def test_memory_tier_rereads_after_short_ttl(self):
+        """Test that entries cleared by another client stop being served from memory"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = CacheClient(cache_dir=tmpdir)
+            other = CacheClient(cache_dir=tmpdir)
+            client.set("test_key", "Test response")
+
+            other.clear()
+            later = time.time_ns() + (cache_client.MEMORY_CACHE_TTL_SECONDS + 1) * 1_000_000_000
+            with patch('ai_tester.clients.cache_client.time.time_ns', return_value=later):
+                assert client.get("test_key") is None
+            assert "test_key" not in client._memory
+
+    def test_set_after_other_client_cleared(self):
+        """Test that writes still succeed after another client removed the shard directories"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = CacheClient(cache_dir=tmpdir)
+            other = CacheClient(cache_dir=tmpdir)
+            client.set("test_key", "Test response")
+
+            other.clear()
+
+            assert client.set("test_key", "New response") is True
+            assert client.stats["errors"] == 0
+            assert other.get("test_key")[0] == "New response"
+
+    def test_memory_tier_thread_safe(self):
+        """Test concurrent gets and sets keep the LRU tier within its size"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = CacheClient(cache_dir=tmpdir)
+            keys = [f"key{i}" for i in range(cache_client.MEMORY_CACHE_SIZE + 200)]
+
+            def worker(offset):
+                for key in keys[offset::4]:
+                    client.set(key, key)
+                    client.get(keys[0])
+
+            threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            # Over ZSTD_DICT_MIN_SAMPLES disk writes start dictionary training
+            client.close()
+
+            assert len(client._memory) == cache_client.MEMORY_CACHE_SIZE
+            assert client.stats["errors"] == 0
+
     def test_get_disk_miss(self):
         """Test cache miss from disk"""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -291,8 +539,8 @@ class TestDiskCacheOperations:
             cache_key = "test_key"
 
             # Manually create an expired cache file
-            safe_key = cache_key.replace(":", "_")
-            cache_file = os.path.join(tmpdir, f"{safe_key}.cache")
+            cache_file = client._cache_file_path(cache_key)
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
 
             old_timestamp = (datetime.now() - timedelta(days=2)).isoformat()
             data = {
@@ -312,6 +560,47 @@ class TestDiskCacheOperations:
             assert cached is None
             assert not os.path.exists(cache_file)  # File should be deleted
 
+    def test_disk_cache_ttl_expired_ts_ns(self):
+        """Test that entries with an integer ts_ns timestamp expire too"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = CacheClient(cache_dir=tmpdir, ttl_days=1)
+
+            client.set("fresh_key", "Fresh response")
+            with open(client._cache_file_path("fresh_key"), 'rb') as f:
+                assert "ts_ns" in client._decompress_data(f.read())
+            assert client.get("fresh_key")[0] == "Fresh response"
+
+            cache_file = client._cache_file_path("old_key")
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            data = {
+                "response": "Old response",
+                "error": None,
+                "ts_ns": time.time_ns() - client.ttl_ns - 1,
+                "version": client.CACHE_VERSION
+            }
+            with open(cache_file, 'wb') as f:
+                f.write(client._compress_data(data))
+
+            assert client.get("old_key") is None
+            assert not os.path.exists(cache_file)
+
+    def test_expired_entry_not_decompressed(self):
+        """Test that the header timestamp lets expired entries skip decompression"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = CacheClient(cache_dir=tmpdir, ttl_days=1)
+
+            client.set("old_key", "Old response")
+            client._memory.clear()
+
+            with patch('ai_tester.clients.cache_client.time.time_ns',
+                       return_value=time.time_ns() + client.ttl_ns + 1), \
+                    patch.object(client, '_read_cache_file') as mock_read:
+                cached = client.get("old_key")
+
+            assert cached is None
+            mock_read.assert_not_called()
+            assert not os.path.exists(client._cache_file_path("old_key"))
+
     def test_disk_cache_windows_safe_keys(self):
         """Test that colons in keys are handled for Windows compatibility"""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -323,10 +612,23 @@ class TestDiskCacheOperations:
             client.set(cache_key, response)
 
             # Check that file was created with underscores
-            files = os.listdir(tmpdir)
+            files = [name for _, _, names in os.walk(tmpdir) for name in names]
             assert len(files) == 1
             assert "_" in files[0]  # Colons replaced with underscores
 
+    def test_disk_cache_path_separators_in_keys(self):
+        """Test that path separators in keys cannot escape the cache directory"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = CacheClient(cache_dir=tmpdir)
+
+            client.set("ticket/PROJ-1\\summary", "Test response")
+
+            cache_file = client._cache_file_path("ticket/PROJ-1\\summary")
+            assert os.path.basename(cache_file) == "ticket_PROJ-1_summary.cache"
+            assert os.path.dirname(os.path.dirname(cache_file)) == tmpdir
+            assert os.path.exists(cache_file)
+            assert client.get("ticket/PROJ-1\\summary")[0] == "Test response"
+
     def test_get_set_when_disabled(self):
         """Test that get/set do nothing when disabled"""
         client = CacheClient(enabled=False)
@@ -352,7 +654,7 @@ class TestRedisCacheOperations:
                 mock_redis = Mock()
                 mock_client = Mock()
                 mock_client.ping.return_value = True
-                mock_redis.from_url.return_value = mock_client
+                mock_redis.Redis.return_value = mock_client
                 return mock_redis
             return __import__(name, *args, **kwargs)
 
@@ -385,6 +687,59 @@ class TestRedisCacheOperations:
             assert cached[0] == response
             assert client.stats["hits"] == 1
 
+    def test_set_redis_write_behind(self):
+        """Test that writes after the first go through the background pipeline"""
+        def mock_import(name, *args, **kwargs):
+            if name == 'redis':
+                mock_redis = Mock()
+                mock_client = Mock()
+                mock_redis.Redis.return_value = mock_client
+                return mock_redis
+            return __import__(name, *args, **kwargs)
+
+        with patch('builtins.__import__', side_effect=mock_import):
+            client = CacheClient(redis_url="redis://localhost:6379/0")
+
+            # The first write is synchronous and confirms the connection
+            assert client.set("key1", "value1") is True
+            assert client.redis_client.setex.call_count == 1
+
+            assert client.set("key2", "value2") is True
+            assert client.set("key3", "value3") is True
+            client.flush()
+
+            assert client.redis_client.setex.call_count == 1
+            pipe = client.redis_client.pipeline.return_value
+            written = [call.args[0] for call in pipe.setex.call_args_list]
+            assert written == ["key2", "key3"]
+            assert pipe.execute.called
+            assert client.stats["sets"] == 3
+
+    def test_redis_writer_shared_between_clients(self):
+        """Test that clients for one Redis URL share a writer thread, each counting its own errors"""
+        def mock_import(name, *args, **kwargs):
+            if name == 'redis':
+                mock_redis = Mock()
+                mock_redis.Redis.return_value = Mock()
+                return mock_redis
+            return __import__(name, *args, **kwargs)
+
+        with patch('builtins.__import__', side_effect=mock_import):
+            clients = [CacheClient(redis_url="redis://localhost:6379/0") for _ in range(2)]
+            for client in clients:
+                client.set("key1", "value1")
+            clients[0].redis_client.pipeline.return_value.execute.side_effect = Exception("Connection lost")
+
+            clients[0].set("key2", "value2")
+            clients[1].set("key3", "value3")
+            clients[1].set("key4", "value4")
+            clients[0].flush()
+
+            assert clients[0]._writer is clients[1]._writer
+            assert len(cache_client._redis_writers) == 1
+            assert clients[0].stats["errors"] == 1
+            assert clients[1].stats["errors"] == 2
+
     def test_get_redis_miss(self):
         """Test Redis cache miss"""
         def mock_import(name, *args, **kwargs):
@@ -393,7 +748,7 @@ class TestRedisCacheOperations:
                 mock_client = Mock()
                 mock_client.ping.return_value = True
                 mock_client.get.return_value = None
-                mock_redis.from_url.return_value = mock_client
+                mock_redis.Redis.return_value = mock_client
                 return mock_redis
             return __import__(name, *args, **kwargs)
 
@@ -429,6 +784,30 @@ class TestCacheClear:
             assert cleared == 3
             assert len(os.listdir(tmpdir)) == 0
 
+    def test_clear_removes_legacy_flat_entries(self):
+        """Test that clear also removes entries written before sharding"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = CacheClient(cache_dir=tmpdir)
+
+            client.set("key1", "value1")
+            with open(os.path.join(tmpdir, "old_key.cache"), 'wb') as f:
+                f.write(b"legacy entry")
+
+            assert client.get_stats()["disk_cache_entries"] == 2
+            assert client.clear() == 2
+            assert os.listdir(tmpdir) == []
+
+    def test_clear_drops_memory_tier(self):
+        """Test that clearing also empties the in-process memory tier"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = CacheClient(cache_dir=tmpdir)
+
+            client.set("key1", "value1")
+            client.clear()
+
+            assert client.get("key1") is None
+            assert client.stats["misses"] == 1
+
     def test_clear_empty_disk_cache(self):
         """Test clearing empty disk cache"""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -446,8 +825,8 @@ class TestCacheClear:
                 mock_client = Mock()
                 mock_client.ping.return_value = True
                 mock_client.scan_iter.return_value = iter(["key1", "key2", "key3"])
-                mock_client.delete.return_value = 3
-                mock_redis.from_url.return_value = mock_client
+                mock_client.pipeline.return_value.execute.return_value = [3]
+                mock_redis.Redis.return_value = mock_client
                 return mock_redis
             return __import__(name, *args, **kwargs)
 
@@ -457,7 +836,10 @@ class TestCacheClear:
             cleared = client.clear()
 
             assert cleared == 3
-            client.redis_client.delete.assert_called_once()
+            pipe = client.redis_client.pipeline.return_value
+            pipe.unlink.assert_called_once_with("key1", "key2", "key3")
+            pipe.execute.assert_called_once()
+            client.redis_client.delete.assert_not_called()
 
     def test_clear_when_disabled(self):
         """Test that clear does nothing when disabled"""
@@ -543,7 +925,7 @@ class TestCacheStatistics:
                 mock_client.ping.return_value = True
                 mock_client.info.return_value = {"used_memory_human": "1.5M"}
                 mock_client.dbsize.return_value = 42
-                mock_redis.from_url.return_value = mock_client
+                mock_redis.Redis.return_value = mock_client
                 return mock_redis
             return __import__(name, *args, **kwargs)
 
@@ -571,8 +953,8 @@ class TestErrorHandling:
 
             # Create a corrupted cache file
             cache_key = "test_key"
-            safe_key = cache_key.replace(":", "_")
-            cache_file = os.path.join(tmpdir, f"{safe_key}.cache")
+            cache_file = client._cache_file_path(cache_key)
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
 
             with open(cache_file, 'wb') as f:
                 f.write(b"corrupted data")
@@ -583,6 +965,71 @@ class TestErrorHandling:
             assert cached is None
             assert client.stats["errors"] >= 1
 
+    def test_failed_write_keeps_previous_entry(self):
+        """Test that a write failing before the rename leaves the old entry intact"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = CacheClient(cache_dir=tmpdir)
+            client.set("test_key", "Old response")
+
+            with patch('ai_tester.clients.cache_client.os.replace', side_effect=OSError("disk full")):
+                result = client.set("test_key", "New response")
+
+            assert result is False
+            files = [name for _, _, names in os.walk(tmpdir) for name in names]
+            assert files == ["test_key.cache"]  # No temporary file left behind
+
+            client._memory.clear()
+            assert client.get("test_key")[0] == "Old response"
+
+    @pytest.mark.skipif(not hasattr(os, 'O_TMPFILE'), reason="O_TMPFILE is Linux-only")
+    def test_new_entry_linked_from_tmpfile(self, monkeypatch):
+        """Test that new entries are linked from an unnamed temp file, overwrites renamed"""
+        monkeypatch.setattr(cache_client, '_tmpfile_link_supported', True)
+        linked = []
+
+        def fake_link(src, dst):
+            # Stand-in for linkat(), which some sandboxes refuse for /proc paths
+            with open(src, 'rb') as f_src, open(dst, 'xb') as f_dst:
+                f_dst.write(f_src.read())
+            linked.append(dst)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = CacheClient(cache_dir=tmpdir)
+
+            with patch('ai_tester.clients.cache_client.os.link', side_effect=fake_link):
+                assert client.set("test_key", "First response") is True
+                assert client.set("test_key", "Second response") is True
+
+            assert linked == [client._cache_file_path("test_key")]
+            assert cache_client._tmpfile_link_supported is True
+
+            files = [name for _, _, names in os.walk(tmpdir) for name in names]
+            assert files == ["test_key.cache"]
+
+            client._memory.clear()
+            assert client.get("test_key")[0] == "Second response"
+
+    @pytest.mark.skipif(not hasattr(os, 'O_TMPFILE'), reason="O_TMPFILE is Linux-only")
+    @pytest.mark.parametrize("error, still_supported", [
+        pytest.param(errno.ENOSPC, True, id="transient-enospc"),
+        pytest.param(errno.EIO, True, id="transient-eio"),
+        pytest.param(errno.EXDEV, False, id="unsupported-exdev"),
+        pytest.param(errno.EPERM, False, id="unsupported-eperm"),
+    ])
+    def test_tmpfile_link_disabled_only_when_unsupported(self, monkeypatch, error, still_supported):
+        """Test that only errors meaning linking can't work here turn the O_TMPFILE path off"""
+        monkeypatch.setattr(cache_client, '_tmpfile_link_supported', True)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = CacheClient(cache_dir=tmpdir)
+
+            with patch('ai_tester.clients.cache_client.os.link', side_effect=OSError(error, os.strerror(error))):
+                assert client.set("test_key", "Response") is True
+
+            assert cache_client._tmpfile_link_supported is still_supported
+            client._memory.clear()
+            assert client.get("test_key")[0] == "Response"
+
     def test_set_handles_write_error(self):
         """Test that write errors are handled gracefully"""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -620,13 +1067,84 @@ class TestErrorHandling:
 class TestInvalidation:
     """Tests for cache invalidation"""
 
-    def test_invalidate_by_ticket_not_implemented(self):
-        """Test that ticket invalidation returns 0 (not implemented)"""
-        client = CacheClient(enabled=False)
+    def test_invalidate_by_ticket_unknown_ticket(self):
+        """Test that invalidating a ticket with no indexed entries returns 0"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = CacheClient(cache_dir=tmpdir)
+            client.set("key1", "value1")
 
-        result = client.invalidate_by_ticket("TICKET-123")
+            result = client.invalidate_by_ticket("TICKET-123")
 
-        assert result == 0
+            assert result == 0
+            assert client.get("key1") is not None
+
+    def test_invalidate_by_ticket_disk(self):
+        """Test that only the ticket's disk entries are invalidated"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = CacheClient(cache_dir=tmpdir)
+            client.set("key1", "value1", ticket_key="TICKET-123")
+            client.set("key2", "value2", ticket_key="TICKET-123")
+            client.set("key3", "value3", ticket_key="TICKET-456")
+
+            result = client.invalidate_by_ticket("TICKET-123")
+
+            assert result == 2
+            assert client.get("key1") is None
+            assert client.get("key2") is None
+            assert client.get("key3") is not None
+            assert client.invalidate_by_ticket("TICKET-123") == 0
+
+    def test_invalidate_by_ticket_redis(self):
+        """Test that Redis invalidation unlinks the keys from the ticket's index"""
+        def mock_import(name, *args, **kwargs):
+            if name == 'redis':
+                mock_redis = Mock()
+                mock_client = Mock()
+                mock_client.smembers.return_value = {b"key1", b"key2"}
+                mock_client.pipeline.return_value.execute.return_value = [2, 1]
+                mock_redis.Redis.return_value = mock_client
+                return mock_redis
+            return __import__(name, *args, **kwargs)
+
+        with patch('builtins.__import__', side_effect=mock_import):
+            client = CacheClient(redis_url="redis://localhost:6379/0")
+            client.set("key1", "value1", ticket_key="TICKET-123")
+
+            pipe = client.redis_client.pipeline.return_value
+            pipe.sadd.assert_called_once_with("llm_cache:idx:ticket:TICKET-123", "key1")
+
+            result = client.invalidate_by_ticket("TICKET-123")
+
+            assert result == 2
+            client.redis_client.smembers.assert_called_once_with("llm_cache:idx:ticket:TICKET-123")
+            assert set(pipe.unlink.call_args.args) == {b"key1", b"key2"}
+            pipe.delete.assert_called_once_with("llm_cache:idx:ticket:TICKET-123")
+            assert "key1" not in client._memory
+
+    def test_invalidate_llm_client_response_by_ticket(self, monkeypatch):
+        """Test that responses cached by LLMClient are indexed by ticket and can be invalidated"""
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        completion = Mock()
+        completion.choices = [Mock()]
+        completion.choices[0].message.content = '{"score": 80}'
+        openai_client = Mock()
+        openai_client.chat.completions.create.return_value = completion
+
+        with tempfile.TemporaryDirectory() as tmpdir, \
+                patch("openai.OpenAI", return_value=openai_client):
+            llm = LLMClient(model="gpt-3.5-turbo", cache_enabled=False)
+            llm.cache_client = CacheClient(cache_dir=tmpdir)
+
+            first = llm.complete_json("sys", "user", ticket_key="TICKET-123")
+            cached = llm.complete_json("sys", "user", ticket_key="TICKET-123")
+
+            assert first == cached == ('{"score": 80}', None)
+            assert openai_client.chat.completions.create.call_count == 1
+
+            assert llm.cache_client.invalidate_by_ticket("TICKET-123") == 1
+
+            llm.complete_json("sys", "user", ticket_key="TICKET-123")
+            assert openai_client.chat.completions.create.call_count == 2
 
     def test_invalidate_by_ticket_when_disabled(self):
         """Test invalidation when caching is disabled"""
@@ -99,6 +99,18 @@ def sample_test_ticket():
     return ticket
 
 
+@pytest.fixture
+def empty_test_case():
+    """Fixture providing a minimal test case with no steps, requirements or tags"""
+    return TestCase(id="TC-1", title="Test")
+
+
+@pytest.fixture
+def empty_test_ticket():
+    """Fixture providing a minimal test ticket with no test cases"""
+    return GeneratedTestTicket(title="Tests", description="Desc")
+
+
 @pytest.fixture
 def sample_epic_context():
     """Fixture providing a sample epic context"""
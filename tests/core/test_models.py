@@ -4,6 +4,8 @@ Unit tests for core data models.
 These tests demonstrate TDD approach and provide examples for writing
 more tests as we build out the framework.
 """
+import json
+
 import pytest
 from ai_tester.core.models import (
     TestStep,
@@ -36,23 +38,17 @@ class TestTestStep:
         
         assert step.step_number == 1
     
-    def test_test_step_validation_empty_action(self):
-        """Test that empty action raises ValueError"""
-        with pytest.raises(ValueError, match="action cannot be empty"):
-            TestStep(action="", expected="Something happens")
-    
-    def test_test_step_validation_empty_expected(self):
-        """Test that empty expected raises ValueError"""
-        with pytest.raises(ValueError, match="expected result cannot be empty"):
-            TestStep(action="Do something", expected="")
-    
-    def test_test_step_validation_whitespace_only(self):
-        """Test that whitespace-only strings are rejected"""
-        with pytest.raises(ValueError):
-            TestStep(action="   ", expected="Result")
-        
-        with pytest.raises(ValueError):
-            TestStep(action="Action", expected="   ")
+    @pytest.mark.parametrize("action,expected,message", [
+        pytest.param("", "Something happens", "action cannot be empty", id="empty-action"),
+        pytest.param("Do something", "", "expected result cannot be empty", id="empty-expected"),
+        pytest.param("   ", "Result", "action cannot be empty", id="whitespace-action"),
+        pytest.param("Action", "   ", "expected result cannot be empty", id="whitespace-expected"),
+    ])
+    def test_test_step_validation(self, action, expected, message):
+        """Test that empty or whitespace-only action/expected raises ValueError"""
+        with pytest.raises(ValueError) as exc_info:
+            TestStep(action=action, expected=expected)
+        assert message in str(exc_info.value)
     
     def test_test_step_to_dict(self):
         """Test converting test step to dictionary"""
@@ -87,15 +83,15 @@ class TestRequirement:
         
         assert req.priority == Priority.HIGH
     
-    def test_requirement_validation_empty_id(self):
-        """Test that empty ID raises ValueError"""
-        with pytest.raises(ValueError, match="ID cannot be empty"):
-            Requirement(req_id="", text="Some text")
-    
-    def test_requirement_validation_empty_text(self):
-        """Test that empty text raises ValueError"""
-        with pytest.raises(ValueError, match="text cannot be empty"):
-            Requirement(req_id="REQ-1", text="")
+    @pytest.mark.parametrize("kwargs,message", [
+        pytest.param(dict(req_id="", text="Some text"), "ID cannot be empty", id="empty-id"),
+        pytest.param(dict(req_id="REQ-1", text=""), "text cannot be empty", id="empty-text"),
+    ])
+    def test_requirement_validation(self, kwargs, message):
+        """Test that empty ID or text raises ValueError"""
+        with pytest.raises(ValueError) as exc_info:
+            Requirement(**kwargs)
+        assert message in str(exc_info.value)
     
     def test_requirement_to_dict(self):
         """Test converting requirement to dictionary"""
@@ -134,19 +130,19 @@ class TestTestCase:
         assert tc.steps[0].step_number == 1
         assert tc.steps[1].step_number == 2
     
-    def test_test_case_validation_empty_id(self):
-        """Test that empty ID raises ValueError"""
-        with pytest.raises(ValueError, match="ID cannot be empty"):
-            TestCase(id="", title="Some title")
-    
-    def test_test_case_validation_empty_title(self):
-        """Test that empty title raises ValueError"""
-        with pytest.raises(ValueError, match="title cannot be empty"):
-            TestCase(id="TC-1", title="")
-    
-    def test_add_step(self):
+    @pytest.mark.parametrize("kwargs,message", [
+        pytest.param(dict(id="", title="Some title"), "ID cannot be empty", id="empty-id"),
+        pytest.param(dict(id="TC-1", title=""), "title cannot be empty", id="empty-title"),
+    ])
+    def test_test_case_validation(self, kwargs, message):
+        """Test that empty ID or title raises ValueError"""
+        with pytest.raises(ValueError) as exc_info:
+            TestCase(**kwargs)
+        assert message in str(exc_info.value)
+    
+    def test_add_step(self, empty_test_case):
         """Test adding steps to test case"""
-        tc = TestCase(id="TC-1", title="Test")
+        tc = empty_test_case
         
         tc.add_step(TestStep(action="Step 1", expected="Result 1"))
         tc.add_step(TestStep(action="Step 2", expected="Result 2"))
@@ -155,17 +151,17 @@ class TestTestCase:
         assert tc.steps[0].step_number == 1
         assert tc.steps[1].step_number == 2
     
-    def test_add_step_preserves_explicit_number(self):
+    def test_add_step_preserves_explicit_number(self, empty_test_case):
         """Test that explicitly set step numbers are preserved"""
-        tc = TestCase(id="TC-1", title="Test")
+        tc = empty_test_case
         
         tc.add_step(TestStep(action="Step", expected="Result", step_number=5))
         
         assert tc.steps[0].step_number == 5
     
-    def test_add_requirement(self):
+    def test_add_requirement(self, empty_test_case):
         """Test adding requirements to test case"""
-        tc = TestCase(id="TC-1", title="Test")
+        tc = empty_test_case
         
         tc.add_requirement(Requirement(req_id="REQ-1", text="Login required"))
         tc.add_requirement(Requirement(req_id="REQ-2", text="Security check"))
@@ -173,9 +169,9 @@ class TestTestCase:
         assert len(tc.requirements) == 2
         assert tc.requirements[0].req_id == "REQ-1"
     
-    def test_add_tag(self):
+    def test_add_tag(self, empty_test_case):
         """Test adding tags to test case"""
-        tc = TestCase(id="TC-1", title="Test")
+        tc = empty_test_case
         
         tc.add_tag("smoke-test")
         tc.add_tag("regression")
@@ -183,27 +179,27 @@ class TestTestCase:
         assert len(tc.tags) == 2
         assert "smoke-test" in tc.tags
     
-    def test_add_duplicate_tag(self):
+    def test_add_duplicate_tag(self, empty_test_case):
         """Test that duplicate tags are not added"""
-        tc = TestCase(id="TC-1", title="Test")
+        tc = empty_test_case
         
         tc.add_tag("smoke-test")
         tc.add_tag("smoke-test")
         
         assert len(tc.tags) == 1
     
-    def test_add_empty_tag(self):
+    def test_add_empty_tag(self, empty_test_case):
         """Test that empty tags are not added"""
-        tc = TestCase(id="TC-1", title="Test")
+        tc = empty_test_case
         
         tc.add_tag("")
         tc.add_tag("   ")
         
         assert len(tc.tags) == 0
     
-    def test_get_step_count(self):
+    def test_get_step_count(self, empty_test_case):
         """Test getting step count"""
-        tc = TestCase(id="TC-1", title="Test")
+        tc = empty_test_case
         assert tc.get_step_count() == 0
         
         tc.add_step(TestStep(action="Step 1", expected="Result 1"))
@@ -246,35 +242,30 @@ class TestGeneratedTestTicket:
         assert len(ticket.test_cases) == 0
         assert ticket.priority == Priority.MEDIUM
     
-    def test_test_ticket_validation_empty_title(self):
-        """Test that empty title raises ValueError"""
-        with pytest.raises(ValueError, match="title cannot be empty"):
-            GeneratedTestTicket(title="", description="Description")
+    @pytest.mark.parametrize("title", [
+        pytest.param("", id="empty"),
+        pytest.param("   ", id="whitespace"),
+    ])
+    def test_test_ticket_validation_empty_title(self, title):
+        """Test that empty or whitespace-only title raises ValueError"""
+        with pytest.raises(ValueError) as exc_info:
+            GeneratedTestTicket(title=title, description="Description")
+        assert "title cannot be empty" in str(exc_info.value)
     
-    def test_add_test_case(self):
-        """Test adding test cases to ticket"""
-        ticket = GeneratedTestTicket(title="Tests", description="Desc")
-        
-        tc1 = TestCase(id="TC-1", title="Test 1")
-        tc2 = TestCase(id="TC-2", title="Test 2")
+    @pytest.mark.parametrize("count", [0, 1, 2, 5])
+    def test_add_test_case(self, empty_test_ticket, count):
+        """Test adding test cases to ticket and counting them"""
+        ticket = empty_test_ticket
         
-        ticket.add_test_case(tc1)
-        ticket.add_test_case(tc2)
+        for i in range(1, count + 1):
+            ticket.add_test_case(TestCase(id=f"TC-{i}", title=f"Test {i}"))
         
-        assert len(ticket.test_cases) == 2
-        assert ticket.test_cases[0].id == "TC-1"
+        assert ticket.get_test_case_count() == count
+        assert [tc.id for tc in ticket.test_cases] == [f"TC-{i}" for i in range(1, count + 1)]
     
-    def test_get_test_case_count(self):
-        """Test getting test case count"""
-        ticket = GeneratedTestTicket(title="Tests", description="Desc")
-        assert ticket.get_test_case_count() == 0
-        
-        ticket.add_test_case(TestCase(id="TC-1", title="Test 1"))
-        assert ticket.get_test_case_count() == 1
-    
-    def test_get_total_step_count(self):
+    def test_get_total_step_count(self, empty_test_ticket):
         """Test getting total step count across all test cases"""
-        ticket = GeneratedTestTicket(title="Tests", description="Desc")
+        ticket = empty_test_ticket
         
         tc1 = TestCase(id="TC-1", title="Test 1")
         tc1.add_step(TestStep(action="Step 1", expected="Result 1"))
@@ -312,6 +303,31 @@ class TestGeneratedTestTicket:
         assert result["stats"]["test_case_count"] == 1
         assert result["stats"]["total_step_count"] == 1
 
+    
+    def test_to_json_bytes(self, sample_test_ticket):
+        """Test serializing test ticket to JSON bytes"""
+        result = sample_test_ticket.to_json_bytes()
+        
+        assert isinstance(result, bytes)
+        assert json.loads(result) == sample_test_ticket.to_dict()
+    
+    def test_iter_json_chunks(self, sample_test_ticket):
+        """Test streaming serialization matches serializing to_dict() in one go"""
+        sample_test_ticket.add_test_case(TestCase(id="TC-2", title="Second test", notes="Ünïcode"))
+        
+        result = b"".join(sample_test_ticket.iter_json_chunks())
+        
+        expected = json.dumps(sample_test_ticket.to_dict(), ensure_ascii=False, separators=(',', ':'))
+        assert result.decode('utf-8') == expected
+    
+    def test_iter_json_chunks_without_test_cases(self):
+        """Test streaming serialization of a ticket with no test cases"""
+        ticket = GeneratedTestTicket(title="Empty", description="")
+        
+        result = b"".join(ticket.iter_json_chunks())
+        
+        assert json.loads(result) == ticket.to_dict()
+
 
 class TestEpicContext:
     """Tests for EpicContext model"""
@@ -330,12 +346,13 @@ class TestEpicContext:
     
     def test_epic_context_validation_empty_key(self):
         """Test that empty epic key raises ValueError"""
-        with pytest.raises(ValueError, match="Epic key cannot be empty"):
+        with pytest.raises(ValueError) as exc_info:
             EpicContext(
                 epic_key="",
                 epic_summary="Summary",
                 epic_description="Description"
             )
+        assert "Epic key cannot be empty" in str(exc_info.value)
     
     def test_get_child_count(self):
         """Test getting child ticket count"""
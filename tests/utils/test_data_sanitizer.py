@@ -10,18 +10,24 @@ Tests cover:
 6. Sanitization summary generation
 """
 
+import random
+import re
+
 import pytest
+from ai_tester.utils import data_sanitizer
 from ai_tester.utils.data_sanitizer import (
     FieldWhitelistConfig,
     SAFE_FIELDS,
     BLOCKED_FIELDS,
     remove_code_blocks,
     sanitize_jira_ticket,
+    sanitize_jira_tickets,
     sanitize_ticket_description,
     sanitize_document_content,
     sanitize_attachment,
     sanitize_image_attachment,
     get_sanitization_summary,
+    get_sanitization_counts,
 )
 
 
@@ -62,6 +68,17 @@ class TestFieldWhitelistConfig:
         assert 'customfield_12345' in config.safe_fields
         assert 'customfield_67890' in config.safe_fields
 
+    def test_custom_fields_not_mutated(self):
+        """Test that the caller's field set is copied, not extended in place"""
+        custom_safe = {'summary'}
+        config = FieldWhitelistConfig(
+            safe_fields=custom_safe,
+            additional_acceptance_criteria_fields=['customfield_12345']
+        )
+
+        assert 'customfield_12345' in config.safe_fields
+        assert custom_safe == {'summary'}
+
     def test_is_field_allowed_safe_field(self):
         """Test that safe fields are allowed"""
         config = FieldWhitelistConfig()
@@ -200,6 +217,35 @@ Last section with `inline code`
         assert "Middle section" in result
         assert "Last section with" in result
 
+    def test_sql_keyword_does_not_split_code_block(self):
+        """Test that a SQL keyword in prose does not swallow half of a following code block"""
+        text = """
+Update the schema as follows
+```sql
+ALTER TABLE users ADD token TEXT;
+GRANT ALL ON users TO admin_secret
+```
+Done
+"""
+        result = remove_code_blocks(text)
+
+        assert "admin_secret" not in result
+        assert "```" not in result
+        assert "Done" in result
+
+    def test_sql_keywords_without_terminator_kept(self):
+        """Test that prose full of SQL keywords but no ';' is left intact"""
+        text = "Select this option and update the field. " * 2000
+
+        assert remove_code_blocks(text) == text
+        assert remove_code_blocks(text + "{code}x{code}") == text + "[CODE_BLOCK_REMOVED]"
+
+    def test_unclosed_jira_block_openers_kept(self):
+        """Test that Jira block openers without a closing {code} are left intact"""
+        text = "{code:java} x " * 5000
+
+        assert remove_code_blocks(text) == text
+
     def test_custom_replacement_text(self):
         """Test using custom replacement text"""
         text = "```python\ncode here\n```"
@@ -232,6 +278,83 @@ Last section with `inline code`
         # Warning feature is optional, not testing it here
 
 
+def _remove_code_blocks_four_pass(text, replacement="[CODE_BLOCK_REMOVED]"):
+    """Reference implementation: the original four sequential re.sub passes"""
+    patterns = data_sanitizer.CODE_BLOCK_PATTERNS
+    text = re.sub(patterns[0], replacement, text, flags=re.DOTALL)
+    text = re.sub(patterns[1], replacement, text, flags=re.DOTALL | re.IGNORECASE)
+    text = re.sub(patterns[2], replacement, text)
+    return re.sub(patterns[3], replacement, text, flags=re.IGNORECASE | re.DOTALL)
+
+
+class TestRemoveCodeBlocksMatchesFourPass:
+    """Differential tests of remove_code_blocks against the sequential passes"""
+
+    @pytest.mark.parametrize("text", [
+        "Use the `{code}` macro for the key: `AKIAEXAMPLEKEY`",
+        "Run `grep {code` on the file, password is `hunter2`",
+        "UPDATE users SET pw='hunter2' -- see {code}notes{code} first;",
+        "```\nSELECT 1\n``` then DELETE FROM t; and `x`",
+        "{code:sql}SELECT `a`{code} `b` DROP x;",
+    ])
+    def test_known_cases(self, text):
+        """Test constructs whose removal depends on pass order"""
+        assert remove_code_blocks(text) == _remove_code_blocks_four_pass(text)
+
+    def test_known_cases_leak_no_secret(self):
+        """Test that secrets inside inline code next to Jira markers are removed"""
+        assert "AKIAEXAMPLEKEY" not in remove_code_blocks(
+            "Use the `{code}` macro for the key: `AKIAEXAMPLEKEY`"
+        )
+        assert "hunter2" not in remove_code_blocks("Run `grep {code` on the file, password is `hunter2`")
+        assert "hunter2" not in remove_code_blocks(
+            "UPDATE users SET pw='hunter2' -- see {code}notes{code} first;"
+        )
+
+    def test_random_inputs(self):
+        """Test random mixes of code markers against the reference passes"""
+        atoms = [
+            "`", "```", "```py\n", "\n```", "{code}", "{CODE:java}", "{code", "}",
+            "select ", "UPDATE ", "DROP", ";", "\n", " ", "a", "pw=hunter2",
+        ]
+        rng = random.Random(4421)
+        for _ in range(5000):
+            text = "".join(rng.choice(atoms) for _ in range(rng.randint(0, 16)))
+            replacement = rng.choice(["[CODE_BLOCK_REMOVED]", "`;`", "{code}"])
+            assert remove_code_blocks(text, replacement) == _remove_code_blocks_four_pass(text, replacement), text
+
+
+
+@pytest.mark.skipif(not data_sanitizer.HYPERSCAN_AVAILABLE, reason="Hyperscan not installed")
+class TestLongTokenHyperscanParity:
+    """Tests that the Hyperscan long-token path agrees with the re fallback"""
+
+    @pytest.mark.parametrize("text", [
+        "é" + "a" * 40,
+        "a" * 40 + "é",
+        "ü" + "A1" * 20 + " ",
+        "key " + "a" * 40 + " end",
+        "a" * 31,
+        "_" + "a" * 40,
+        "日本" + "x" * 33,
+        "",
+    ])
+    def test_matches_re(self, text):
+        """Test boundary cases next to non-ASCII and underscore word characters"""
+        assert data_sanitizer._LONG_TOKEN_DB is not None
+        expected = data_sanitizer._LONG_TOKEN_PATTERN.search(text) is not None
+        assert data_sanitizer._contains_long_token(text) == expected
+
+    def test_random_inputs(self):
+        """Test random mixes of ASCII, non-ASCII and separator characters"""
+        atoms = ["a" * 16, "Z9" * 8, "é", "ß", "_", " ", "-", "\n", "日"]
+        rng = random.Random(4420)
+        for _ in range(2000):
+            text = "".join(rng.choice(atoms) for _ in range(rng.randint(0, 8)))
+            expected = data_sanitizer._LONG_TOKEN_PATTERN.search(text) is not None
+            assert data_sanitizer._contains_long_token(text) == expected, text
+
+
 # ============================================================================
 # JIRA TICKET SANITIZATION TESTS
 # ============================================================================
@@ -406,6 +529,18 @@ class TestSanitizeJiraTicket:
         # Summary should still be present
         assert 'summary' in result['fields']
 
+    def test_sanitize_batch_matches_single(self):
+        """Test that batch sanitization matches per-ticket sanitization"""
+        tickets = [
+            {'key': 'PROJ-1', 'fields': {'summary': 'First', 'reporter': 'John'}},
+            {'key': 'PROJ-2', 'fields': {'description': 'Run `rm -rf /`', 'worklog': []}},
+        ]
+
+        result = sanitize_jira_tickets(tickets)
+
+        assert result == [sanitize_jira_ticket(ticket) for ticket in tickets]
+        assert [r['key'] for r in result] == ['PROJ-1', 'PROJ-2']
+
 
 # ============================================================================
 # DESCRIPTION SANITIZATION TESTS
@@ -462,6 +597,15 @@ class TestSanitizeDocumentContent:
         assert sanitize_document_content("") == ""
         assert sanitize_document_content(None) is None
 
+    def test_repeated_document_warns_every_time(self, capsys):
+        """Test that each sanitization of the same document re-checks for long tokens"""
+        content = "Shared spec {code}x{code} key " + "A1" * 20
+
+        for _ in range(2):
+            assert sanitize_document_content(content) == "Shared spec [CODE_BLOCK_REMOVED] key " + "A1" * 20
+
+        assert capsys.readouterr().out.count("Potential API key") == 2
+
 
 # ============================================================================
 # ATTACHMENT SANITIZATION TESTS
@@ -550,12 +694,10 @@ class TestGetSanitizationSummary:
 
         summary = get_sanitization_summary(original, sanitized)
 
-        assert summary['total_fields'] == 5
-        assert summary['safe_fields'] == 2
-        assert summary['removed_fields'] == 3
-        assert 'reporter' in summary['removed_field_names']
-        assert 'assignee' in summary['removed_field_names']
-        assert 'worklog' in summary['removed_field_names']
+        assert summary.total_fields == 5
+        assert summary.safe_fields == 2
+        assert summary.removed_fields == 3
+        assert summary.removed_field_names == ('assignee', 'reporter', 'worklog')
 
     def test_summary_no_fields_removed(self):
         """Test summary when no fields are removed"""
@@ -575,10 +717,10 @@ class TestGetSanitizationSummary:
 
         summary = get_sanitization_summary(original, sanitized)
 
-        assert summary['total_fields'] == 2
-        assert summary['safe_fields'] == 2
-        assert summary['removed_fields'] == 0
-        assert summary['removed_field_names'] == []
+        assert summary.total_fields == 2
+        assert summary.safe_fields == 2
+        assert summary.removed_fields == 0
+        assert summary.removed_field_names == ()
 
     def test_summary_all_fields_removed(self):
         """Test summary when all fields are removed"""
@@ -595,9 +737,51 @@ class TestGetSanitizationSummary:
 
         summary = get_sanitization_summary(original, sanitized)
 
-        assert summary['total_fields'] == 2
-        assert summary['safe_fields'] == 0
-        assert summary['removed_fields'] == 2
+        assert summary.total_fields == 2
+        assert summary.safe_fields == 0
+        assert summary.removed_fields == 2
+
+
+class TestGetSanitizationCounts:
+    """Tests for the count-only sanitization summary"""
+
+    def test_counts_match_full_summary(self):
+        """Test that counts agree with get_sanitization_summary"""
+        original = {
+            'fields': {
+                'summary': 'Test',
+                'reporter': 'user1',
+                'assignee': 'user2',
+                'worklog': []
+            }
+        }
+        sanitized = {'fields': {'summary': 'Test'}}
+
+        counts = get_sanitization_counts(original, sanitized, sample_removed=0)
+        summary = get_sanitization_summary(original, sanitized)
+
+        assert counts.total_fields == summary.total_fields
+        assert counts.safe_fields == summary.safe_fields
+        assert counts.removed_fields == summary.removed_fields
+        assert counts.removed_field_names == ()
+
+    def test_sample_removed_default(self):
+        """Test that up to five removed names are collected by default"""
+        original = {'fields': {'summary': 'Test', **{f'custom_{i}': i for i in range(7)}}}
+        sanitized = {'fields': {'summary': 'Test'}}
+
+        counts = get_sanitization_counts(original, sanitized)
+
+        assert counts.removed_field_names == tuple(f'custom_{i}' for i in range(5))
+
+    def test_sample_removed_limits_names(self):
+        """Test that only sample_removed names are collected"""
+        original = {'fields': {'summary': 'Test', 'reporter': 'a', 'assignee': 'b', 'worklog': []}}
+        sanitized = {'fields': {'summary': 'Test'}}
+
+        counts = get_sanitization_counts(original, sanitized, sample_removed=2)
+
+        assert counts.removed_field_names == ('reporter', 'assignee')
 
 
 # ============================================================================
@@ -0,0 +1,45 @@
+"""Tests for the orjson/json compatibility helpers"""
+import json
+import math
+
+import pytest
+
+from ai_tester.utils import json_compat
+from ai_tester.utils.json_compat import json_loads, json_dumps_bytes
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "json"])
+def orjson_available(request, monkeypatch):
+    """Run each test with and without orjson"""
+    if request.param and not json_compat.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(json_compat, "ORJSON_AVAILABLE", request.param)
+    return request.param
+
+
+class TestJsonLoads:
+    """Tests for json_loads"""
+
+    def test_parses_str_and_bytes(self, orjson_available):
+        """Test that text and UTF-8 bytes both parse"""
+        assert json_loads('{"key": "välue"}') == {"key": "välue"}
+        assert json_loads('{"key": "välue"}'.encode("utf-8")) == {"key": "välue"}
+
+    def test_accepts_nan(self, orjson_available):
+        """Test that NaN (rejected by orjson) falls back to json"""
+        assert math.isnan(json_loads('{"score": NaN}')["score"])
+
+    def test_invalid_json_raises_json_error(self, orjson_available):
+        """Test that invalid input raises json.JSONDecodeError"""
+        with pytest.raises(json.JSONDecodeError):
+            json_loads("not json")
+
+
+class TestJsonDumpsBytes:
+    """Tests for json_dumps_bytes"""
+
+    def test_compact_utf8(self, orjson_available):
+        """Test that output is compact UTF-8 without ASCII escapes"""
+        result = json_dumps_bytes({"title": "Ünïcode", "steps": [1, 2]})
+
+        assert result == '{"title":"Ünïcode","steps":[1,2]}'.encode("utf-8")
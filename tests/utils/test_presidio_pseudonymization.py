@@ -9,10 +9,15 @@ Tests cover:
 5. Integration with sanitization pipeline
 """
 
+import sys
+from unittest.mock import MagicMock
+
 import pytest
+from ai_tester.utils import data_sanitizer
 from ai_tester.utils.data_sanitizer import (
     EntityPseudonymizer,
     pseudonymize_text_with_presidio,
+    pseudonymize_texts_with_presidio,
     sanitize_jira_ticket_with_pseudonymization,
     PRESIDIO_AVAILABLE
 )
@@ -91,6 +96,17 @@ class TestEntityPseudonymizer:
         reversed_text = pseudonymizer.reverse_pseudonymization(pseudonymized)
         assert reversed_text == original
 
+    def test_reverse_pseudonymization_many_entities(self):
+        """Test reversal with multi-digit placeholders and unknown placeholders"""
+        pseudonymizer = EntityPseudonymizer()
+        emails = [f"user{i}@example.com" for i in range(1, 12)]
+        placeholders = [pseudonymizer.pseudonymize_entity(e, "EMAIL_ADDRESS") for e in emails]
+
+        text = " ".join(placeholders[::-1]) + " <PHONE_1>"
+        reversed_text = pseudonymizer.reverse_pseudonymization(text)
+
+        assert reversed_text == " ".join(emails[::-1]) + " <PHONE_1>"
+
     def test_get_summary(self):
         """Test audit summary generation"""
         pseudonymizer = EntityPseudonymizer()
@@ -263,6 +279,178 @@ class TestPresidioIntegration:
         assert "10.0.0.1" in pseudonymized  # IP not detected
         assert summary["entities_detected"] == 1
 
+    def test_batch_consistent_across_texts(self):
+        """Test batch pseudonymization shares placeholders across texts"""
+        texts = [
+            "Contact john@company.com",
+            "",
+            "Email john@company.com or jane@company.com",
+        ]
+        pseudonymizer = EntityPseudonymizer()
+
+        results = pseudonymize_texts_with_presidio(texts, pseudonymizer)
+
+        assert [text for text, _ in results] == [
+            "Contact <EMAIL_1>",
+            "",
+            "Email <EMAIL_1> or <EMAIL_2>",
+        ]
+        assert [summary["entities_detected"] for _, summary in results] == [1, 0, 2]
+
+
+class TestAnalyzerEngineReuse:
+    """Tests for sharing one Presidio AnalyzerEngine across calls"""
+
+    def test_engine_built_once(self, monkeypatch):
+        """Test that repeated calls reuse the same analyzer engine"""
+        built = []
+
+        class FakeAnalyzerEngine:
+            def __init__(self, nlp_engine, supported_languages):
+                built.append(self)
+
+            def analyze(self, text, entities, language, allow_list):
+                return []
+
+        monkeypatch.setattr(data_sanitizer, "PRESIDIO_AVAILABLE", True)
+        monkeypatch.setattr(data_sanitizer, "AnalyzerEngine", FakeAnalyzerEngine)
+        monkeypatch.setattr(data_sanitizer, "_create_nlp_engine", lambda: None)
+        data_sanitizer._get_analyzer_engine.cache_clear()
+        try:
+            for text in ("ticket 1", "ticket 2"):
+                result, summary = pseudonymize_text_with_presidio(text, EntityPseudonymizer())
+                assert result == text
+                assert summary["entities_detected"] == 0
+        finally:
+            data_sanitizer._get_analyzer_engine.cache_clear()
+    
+        assert len(built) == 1
+
+    def test_broken_install_treated_as_missing(self, monkeypatch):
+        """Test that Presidio failing to import is reported once, then handled as not installed"""
+        monkeypatch.setattr(data_sanitizer, "PRESIDIO_AVAILABLE", True)
+        monkeypatch.setattr(data_sanitizer, "AnalyzerEngine", None)
+        monkeypatch.setitem(sys.modules, "presidio_analyzer", None)
+        data_sanitizer._get_analyzer_engine.cache_clear()
+        try:
+            _, first = pseudonymize_text_with_presidio("call 555", EntityPseudonymizer())
+            _, second = pseudonymize_text_with_presidio("call 555", EntityPseudonymizer())
+        finally:
+            data_sanitizer._get_analyzer_engine.cache_clear()
+
+        assert first["entities_detected"] == 0
+        assert "presidio_analyzer" in first["error"]
+        assert data_sanitizer.PRESIDIO_AVAILABLE is False
+        assert second["error"] == "Presidio not installed"
+
+    def test_nlp_engine_uses_configured_model(self, monkeypatch):
+        """Test that the spaCy model comes from PRESIDIO_SPACY_MODEL, defaulting to the small model"""
+        configurations = []
+
+        class FakeNlpEngineProvider:
+            def __init__(self, nlp_configuration):
+                configurations.append(nlp_configuration)
+
+            def create_engine(self):
+                return "engine"
+
+        fake_module = MagicMock(NlpEngineProvider=FakeNlpEngineProvider)
+        monkeypatch.setitem(sys.modules, "presidio_analyzer.nlp_engine", fake_module)
+
+        monkeypatch.delenv("PRESIDIO_SPACY_MODEL", raising=False)
+        assert data_sanitizer._create_nlp_engine() == "engine"
+        monkeypatch.setenv("PRESIDIO_SPACY_MODEL", "en_core_web_lg")
+        data_sanitizer._create_nlp_engine()
+
+        assert [c["models"][0]["model_name"] for c in configurations] == [
+            "en_core_web_sm",
+            "en_core_web_lg",
+        ]
+
+
+class TestPiiPrefilter:
+    """Tests for skipping Presidio on text that cannot contain default PII"""
+
+    @pytest.fixture
+    def fake_engine(self, monkeypatch):
+        analyzed = []
+
+        class FakeAnalyzerEngine:
+            def __init__(self, nlp_engine, supported_languages):
+                pass
+
+            def analyze(self, text, entities, language, allow_list):
+                analyzed.append(text)
+                return []
+
+        monkeypatch.setattr(data_sanitizer, "PRESIDIO_AVAILABLE", True)
+        monkeypatch.setattr(data_sanitizer, "AnalyzerEngine", FakeAnalyzerEngine)
+        monkeypatch.setattr(data_sanitizer, "_create_nlp_engine", lambda: None)
+        data_sanitizer._get_analyzer_engine.cache_clear()
+        yield analyzed
+        data_sanitizer._get_analyzer_engine.cache_clear()
+
+    @pytest.fixture
+    def fake_batch_engine(self, monkeypatch):
+        class FakeBatchAnalyzerEngine:
+            def __init__(self, analyzer_engine):
+                self.analyzer_engine = analyzer_engine
+
+            def analyze_iterator(self, texts, language, batch_size, n_process, **kwargs):
+                return [self.analyzer_engine.analyze(text, language=language, **kwargs) for text in texts]
+
+        monkeypatch.setattr(data_sanitizer, "BatchAnalyzerEngine", FakeBatchAnalyzerEngine)
+
+    def test_clean_text_skips_analyzer(self, fake_engine):
+        """Test that text without '@', ':' or digits never reaches the analyzer"""
+        text = "This is a normal sentence with no sensitive information."
+
+        result, summary = pseudonymize_text_with_presidio(text, EntityPseudonymizer())
+
+        assert result == text
+        assert summary["entities_detected"] == 0
+        assert fake_engine == []
+
+    def test_candidate_text_is_analyzed(self, fake_engine):
+        """Test that text with a PII trigger character is still analyzed"""
+        for text in ("mail me@example", "call 555", "fe80::ab"):
+            pseudonymize_text_with_presidio(text, EntityPseudonymizer())
+
+        assert fake_engine == ["mail me@example", "call 555", "fe80::ab"]
+
+    def test_batch_analyzes_by_length_keeps_order(self, fake_engine, fake_batch_engine):
+        """Test that batch texts are analyzed shortest first but returned in input order"""
+        texts = ["a much longer text 123", "no pii here", "id 7", "call 555 now"]
+
+        results = pseudonymize_texts_with_presidio(texts, EntityPseudonymizer())
+
+        assert fake_engine == ["id 7", "call 555 now", "a much longer text 123"]
+        assert [text for text, _ in results] == texts
+
+    def test_repeated_text_not_cached_across_calls(self, fake_engine):
+        """Test that detections (and the PII text behind them) are not kept between calls"""
+        for _ in range(2):
+            pseudonymize_text_with_presidio("build 42 failed", EntityPseudonymizer())
+
+        assert fake_engine == ["build 42 failed", "build 42 failed"]
+
+    def test_batch_analyzes_duplicate_texts_once(self, fake_engine, fake_batch_engine):
+        """Test that identical texts in one batch share a single analysis"""
+        texts = ["build 42 failed", "no pii", "build 42 failed"]
+
+        results = pseudonymize_texts_with_presidio(texts, EntityPseudonymizer())
+
+        assert fake_engine == ["build 42 failed"]
+        assert [text for text, _ in results] == texts
+
+    def test_custom_entities_bypass_prefilter(self, fake_engine):
+        """Test that entity types outside the default set are always analyzed"""
+        text = "Meeting with Alice"
+
+        pseudonymize_text_with_presidio(text, EntityPseudonymizer(), entities_to_detect=["PERSON"])
+
+        assert fake_engine == [text]
+
 
 # ============================================================================
 # INTEGRATION WITH SANITIZATION PIPELINE
@@ -413,6 +601,16 @@ class TestErrorHandling:
         assert "error" in summary
         assert "Presidio not installed" in summary["error"]
 
+    @pytest.mark.skipif(PRESIDIO_AVAILABLE, reason="Test for when Presidio NOT installed")
+    def test_batch_presidio_not_available(self):
+        """Test graceful batch handling when Presidio not installed"""
+        texts = ["Contact john@company.com", "No PII here"]
+
+        results = pseudonymize_texts_with_presidio(texts, EntityPseudonymizer())
+
+        assert [text for text, _ in results] == texts
+        assert all("Presidio not installed" in summary["error"] for _, summary in results)
+
     @pytest.mark.skipif(not PRESIDIO_AVAILABLE, reason="Presidio not installed")
     def test_special_characters_in_text(self):
         """Test handling of special characters"""
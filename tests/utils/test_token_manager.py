@@ -0,0 +1,64 @@
+"""Tests for token management utilities"""
+import pytest
+from unittest.mock import Mock
+from ai_tester.utils import token_manager
+from ai_tester.utils.token_manager import (
+    estimate_tokens,
+    get_encoding_for_model,
+    validate_prompt_size,
+)
+
+
+def _exact(text, model="gpt-4o"):
+    return len(get_encoding_for_model(model).encode_ordinary(text))
+
+
+class TestEstimateTokens:
+    """Tests for estimate_tokens"""
+
+    def test_empty_text(self):
+        """Test that empty text has no tokens"""
+        assert estimate_tokens("") == 0
+
+    @pytest.mark.parametrize("text", [
+        pytest.param("Short prompt", id="short"),
+        pytest.param("word " * 400, id="repeated-words"),
+        pytest.param(
+            "Intro prose. " * 50 + '{"k": [1, 2, 3]}' * 5000 + " Closing prose." * 50,
+            id="json-middle",
+        ),
+        pytest.param(
+            "Intro prose. " * 50 + "测试用例生成" * 5000 + " Closing prose." * 50,
+            id="cjk-middle",
+        ),
+    ])
+    def test_count_is_exact(self, text):
+        """Test that long prompts with a different middle are not undercounted"""
+        assert estimate_tokens(text) == _exact(text)
+
+    def test_memoized_counts_do_not_keep_text(self, monkeypatch):
+        """Test that short texts are counted once and the cache holds no prompt text"""
+        encoding = Mock()
+        encoding.encode_ordinary.side_effect = lambda text: text.split()
+        monkeypatch.setattr(token_manager, "get_encoding_for_model", lambda model: encoding)
+        monkeypatch.setattr(token_manager, "_COUNT_CACHE", token_manager.LRUCache(maxsize=16))
+        text = "Contact jane.doe@example.com about PROJ-1"
+
+        assert estimate_tokens(text) == 4
+        assert estimate_tokens(text) == 4
+
+        encoding.encode_ordinary.assert_called_once_with(text)
+        assert text not in repr(dict(token_manager._COUNT_CACHE))
+
+
+class TestValidatePromptSize:
+    """Tests for validate_prompt_size"""
+
+    def test_code_heavy_prompt_over_limit_is_invalid(self):
+        """Test that a prompt whose bulk is JSON is rejected when it exceeds the window"""
+        user_prompt = "Intro prose. " * 50 + '{"k": [1, 2, 3]}' * 40000 + " Closing prose." * 50
+
+        validation = validate_prompt_size("System", user_prompt, model="gpt-4o", response_reserve=4000)
+
+        assert validation["user_tokens"] == _exact(user_prompt)
+        assert validation["valid"] == (_exact("System") + _exact(user_prompt) + 20 <= 128000 - 4000)
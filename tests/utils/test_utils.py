@@ -453,6 +453,18 @@ class TestAdfToPlaintext:
         # Should not have more than 2 consecutive newlines
         assert "\n\n\n\n" not in result
 
+    def test_deeply_nested_adf(self):
+        """Test that nesting deeper than the recursion limit is handled"""
+        adf = {"type": "doc", "content": []}
+        node = adf
+        for _ in range(5000):
+            child = {"type": "blockquote", "content": []}
+            node["content"].append(child)
+            node = child
+        node["content"].append({"type": "paragraph", "content": [{"type": "text", "text": "Deep"}]})
+
+        assert adf_to_plaintext(adf) == "Deep"
+
 
 # ============================================================================
 # PLAIN TEXT TO HTML TESTS
@@ -523,6 +535,28 @@ class TestExtractTextFromPdf:
         # Should not crash, should return empty string
         assert result == ""
 
+    def test_uses_pdfium_when_available(self):
+        """Test that the pypdfium2 backend is preferred and its pages are joined"""
+        from ai_tester.utils import utils
+
+        pages = []
+        for text in ("Page one\r\nline two", "Page two"):
+            page = Mock()
+            page.get_textpage.return_value.get_text_range.return_value = text
+            pages.append(page)
+        pdf = MagicMock()
+        pdf.__iter__.return_value = iter(pages)
+        fake_pdfium = Mock()
+        fake_pdfium.PdfDocument.return_value = pdf
+
+        with patch.object(utils, "PYPDFIUM2_AVAILABLE", True), \
+                patch.object(utils, "pdfium", fake_pdfium):
+            result = extract_text_from_pdf(b"%PDF-1.7")
+
+        assert result == "Page one\nline two\n\nPage two"
+        fake_pdfium.PdfDocument.assert_called_once_with(b"%PDF-1.7")
+        pdf.close.assert_called_once()
+
 
 # ============================================================================
 # WORD DOCUMENT EXTRACTION TESTS
@@ -533,7 +567,7 @@ class TestExtractTextFromWord:
 
     def test_extraction_returns_string(self):
         """Test that Word extraction returns a string"""
-        # This will actually use python-docx if available, otherwise gracefully fail
+        # Not a zip archive, so reading the main document part fails
         result = extract_text_from_word(b"invalid docx")
 
         # Should return string (empty on error)
@@ -547,6 +581,29 @@ class TestExtractTextFromWord:
         # Should not crash, should return empty string
         assert result == ""
 
+    def test_extracts_body_paragraphs(self):
+        """Test that body paragraphs are extracted and table/blank paragraphs skipped"""
+        import io
+        import zipfile
+
+        document = (
+            '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+            '<w:body>'
+            '<w:p><w:r><w:t>First</w:t><w:tab/><w:t>line</w:t></w:r></w:p>'
+            '<w:p><w:r><w:t xml:space="preserve">  </w:t></w:r></w:p>'
+            '<w:tbl><w:tr><w:tc><w:p><w:r><w:t>Cell</w:t></w:r></w:p></w:tc></w:tr></w:tbl>'
+            '<w:p><w:hyperlink><w:r><w:t>Link</w:t></w:r></w:hyperlink><w:r><w:br/><w:t>end</w:t></w:r></w:p>'
+            '</w:body>'
+            '</w:document>'
+        )
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, "w") as archive:
+            archive.writestr("word/document.xml", document)
+
+        result = extract_text_from_word(buf.getvalue())
+
+        assert result == "First\tline\n\nLink\nend"
+
 
 # ============================================================================
 # WORD IMAGE EXTRACTION TESTS
@@ -557,7 +614,7 @@ class TestExtractImagesFromWord:
 
     def test_extraction_returns_list(self):
         """Test that image extraction returns a list"""
-        # This will actually use python-docx if available, otherwise gracefully fail
+        # Not a zip archive, so reading the relationships part fails
         result = extract_images_from_word(b"invalid docx")
 
         # Should return list (empty on error)
@@ -612,3 +669,17 @@ class TestEncodeImageToBase64:
         # Should be decodable
         decoded = base64.b64decode(result)
         assert decoded == image_bytes
+
+    @pytest.mark.parametrize("pybase64_available", [True, False])
+    def test_backends_match_stdlib(self, pybase64_available):
+        """Test that pybase64 and the stdlib fallback produce identical output"""
+        from ai_tester.utils import utils
+
+        if pybase64_available and utils.pybase64 is None:
+            pytest.skip("pybase64 not installed")
+
+        image_bytes = bytes(range(256)) * 300
+        with patch.object(utils, "PYBASE64_AVAILABLE", pybase64_available):
+            result = encode_image_to_base64(image_bytes, "image/png")
+
+        assert result == base64.b64encode(image_bytes).decode('ascii')